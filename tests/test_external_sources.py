@@ -204,3 +204,40 @@ def test_force_gif_frame_duration_updates_existing_gif(tmp_path):
 
     with timelapse_core.Image.open(out_gif) as gif:
         assert gif.info["duration"] == 100
+
+
+def test_force_gif_frame_duration_keeps_every_frame(tmp_path):
+    out_gif = tmp_path / "timing.gif"
+    frames = [
+        timelapse_core.Image.new("RGB", (16, 16), (i * 60, 80, 120)) for i in range(4)
+    ]
+    frames[0].save(
+        out_gif, format="GIF", save_all=True, append_images=frames[1:], duration=500
+    )
+
+    external_sources.force_gif_frame_duration(str(out_gif), str(out_gif), fps=4)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["timing.gif"]
+    with timelapse_core.Image.open(out_gif) as gif:
+        assert gif.n_frames == 4
+        gif.seek(3)
+        assert gif.info["duration"] == 250
+        assert gif.convert("RGB").getpixel((0, 0)) == (180, 80, 120)
+
+
+@requires_pillow
+def test_force_gif_frame_duration_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    out_gif = tmp_path / "timing.gif"
+    frame = timelapse_core.Image.new("RGB", (16, 16), (40, 80, 120))
+    frame.save(out_gif, format="GIF", save_all=True, duration=1000, loop=0)
+
+    def failing_save(self, fp, *args, **kwargs):
+        with open(fp, "wb") as f:
+            f.write(b"GIF89a")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(timelapse_core.Image.Image, "save", failing_save)
+
+    with pytest.raises(OSError):
+        external_sources.force_gif_frame_duration(str(out_gif), str(out_gif), fps=10)
+    assert [p.name for p in tmp_path.iterdir()] == ["timing.gif"]
@@ -1,4 +1,10 @@
+import collections
 import datetime
+import json
+import shutil
+import types
+
+import pytest
 
 from timelapse.core import timelapse_core
 
@@ -109,3 +115,715 @@ def test_date_sequence_dekadal_uses_actual_month_end():
         datetime.date(2026, 2, 28),
         "2026-02-21",
     )
+
+
+def test_date_sequence_returns_independent_lists_from_cache():
+    first = timelapse_core.date_sequence(2020, 2022, "06-01", "09-30")
+    first.clear()
+
+    second = timelapse_core.date_sequence(2020, 2022, "06-01", "09-30")
+
+    assert [label for _start, _end, label in second] == ["2020", "2021", "2022"]
+
+
+def test_date_sequence_day_respects_step_across_leap_day():
+    ranges = timelapse_core.date_sequence(
+        start_year=2024,
+        end_year=2024,
+        start_date="02-27",
+        end_date="03-04",
+        frequency="day",
+        step=2,
+    )
+
+    assert ranges == [
+        (datetime.date(2024, 2, 27), datetime.date(2024, 2, 27), "2024-02-27"),
+        (datetime.date(2024, 2, 29), datetime.date(2024, 2, 29), "2024-02-29"),
+        (datetime.date(2024, 3, 2), datetime.date(2024, 3, 2), "2024-03-02"),
+        (datetime.date(2024, 3, 4), datetime.date(2024, 3, 4), "2024-03-04"),
+    ]
+    assert all(type(start) is datetime.date for start, _end, _label in ranges)
+
+
+def test_geojson_to_ee_featurecollection_sets_geodesic_without_mutating_input(
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        timelapse_core, "ee", types.SimpleNamespace(FeatureCollection=lambda fc: fc)
+    )
+    line = {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}
+    point = {"type": "Point", "coordinates": [0, 0]}
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": line, "properties": {}},
+            {"type": "Feature", "geometry": point, "properties": {}},
+        ],
+    }
+
+    result = timelapse_core.geojson_to_ee_featurecollection(geojson)
+
+    assert result["features"][0]["geometry"]["geodesic"] is False
+    assert "geodesic" not in result["features"][1]["geometry"]
+    assert "geodesic" not in line
+
+
+def test_vector_cache_key_tracks_sidecar_files(tmp_path):
+    shp = tmp_path / "roads.shp"
+    shp.write_bytes(b"shp")
+    (tmp_path / "roads.dbf").write_bytes(b"dbf")
+    (tmp_path / "other.dbf").write_bytes(b"other")
+    bbox = {"xmin": 0, "ymin": 0, "xmax": 1, "ymax": 1}
+
+    key = timelapse_core._vector_cache_key(str(shp), bbox)
+    assert [name for name, _, _ in key[2]] == ["roads.dbf", "roads.shp"]
+    assert timelapse_core._vector_cache_key(str(shp), None) != key
+
+    (tmp_path / "roads.dbf").write_bytes(b"edited dbf")
+    assert timelapse_core._vector_cache_key(str(shp), bbox) != key
+    assert timelapse_core._vector_cache_key("/vsimem/roads.shp", bbox) is None
+
+
+def test_vector_to_geojson_reads_wgs84_geojson_and_filters_by_bbox(tmp_path):
+    path = tmp_path / "overlay.geojson"
+    inside = {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]],
+        },
+        "properties": {"name": "inside"},
+    }
+    outside = {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [10, 10]},
+        "properties": {"name": "outside"},
+    }
+    no_geometry = {"type": "Feature", "geometry": None, "properties": {}}
+    path.write_text(
+        json.dumps(
+            {"type": "FeatureCollection", "features": [inside, outside, no_geometry]}
+        )
+    )
+
+    result = timelapse_core.vector_to_geojson(
+        str(path), {"xmin": 1, "ymin": 1, "xmax": 5, "ymax": 5}
+    )
+
+    assert result == {"type": "FeatureCollection", "features": [inside]}
+
+
+@pytest.mark.parametrize("bad_date", ["02-29", "13-01", "0601", "06-01x", None])
+def test_date_sequence_rejects_invalid_mmdd(bad_date):
+    with pytest.raises(ValueError, match="MM-dd"):
+        timelapse_core.date_sequence(2020, 2020, bad_date, "12-31")
+
+
+def test_parse_ymd_matches_strptime():
+    assert timelapse_core._parse_ymd("2024-02-29") == datetime.date(2024, 2, 29)
+    assert timelapse_core._parse_ymd("2024-3-5") == datetime.date(2024, 3, 5)
+    for bad in ("2023-02-29", "2024-03", "2024-03-05-01", "2024/03/05"):
+        with pytest.raises(ValueError):
+            timelapse_core._parse_ymd(bad)
+
+
+@pytest.mark.parametrize(
+    "color, expected",
+    [
+        ("Red", "#FF0000"),
+        ("#00ff00", "#00ff00"),
+        ("00ff00", "#00ff00"),
+        ("", ""),
+        ("notacolor", "notacolor"),
+    ],
+)
+def test_check_color(color, expected):
+    assert timelapse_core.check_color(color) == expected
+
+
+def _write_test_gif(path, n_frames=4, size=(40, 30), duration=200):
+    from PIL import Image
+
+    frames = [Image.new("RGB", size, (i * 40 % 256, 80, 160)) for i in range(n_frames)]
+    frames[0].save(
+        path,
+        format="GIF",
+        append_images=frames[1:],
+        save_all=True,
+        duration=duration,
+        loop=0,
+    )
+
+
+def test_add_text_to_gif_keeps_frames_and_draws_progress_bar(tmp_path):
+    from PIL import Image
+
+    in_gif = tmp_path / "in.gif"
+    out_gif = tmp_path / "out.gif"
+    _write_test_gif(in_gif)
+
+    timelapse_core.add_text_to_gif(
+        str(in_gif),
+        str(out_gif),
+        ["2020", "2021", "2022", "2023"],
+        progress_bar_color="red",
+        progress_bar_height=3,
+    )
+
+    with Image.open(out_gif) as gif:
+        assert gif.n_frames == 4
+        assert gif.info["duration"] == 200
+        gif.seek(3)
+        last = gif.convert("RGB")
+        assert last.getpixel((39, 29)) == (255, 0, 0)
+        gif.seek(1)
+        second = gif.convert("RGB")
+        assert second.getpixel((39, 29)) != (255, 0, 0)
+
+
+def _write_test_jpgs(directory, n_frames=3, size=(32, 24)):
+    from PIL import Image
+
+    for i in range(n_frames):
+        Image.new("RGB", size, (i * 100, 50, 50)).save(directory / f"frame_{i}.jpg")
+
+
+def test_make_gif_falls_back_to_pil_without_ffmpeg(monkeypatch, tmp_path):
+    from PIL import Image
+
+    _write_test_jpgs(tmp_path)
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    out_gif = tmp_path / "out.gif"
+
+    timelapse_core.make_gif(str(tmp_path), str(out_gif), fps=5)
+
+    with Image.open(out_gif) as gif:
+        assert gif.n_frames == 3
+        assert gif.info["duration"] == 200
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_make_gif_with_ffmpeg_keeps_every_frame(tmp_path):
+    from PIL import Image
+
+    _write_test_jpgs(tmp_path)
+    out_gif = tmp_path / "out.gif"
+
+    timelapse_core.make_gif(str(tmp_path), str(out_gif), fps=5)
+
+    with Image.open(out_gif) as gif:
+        assert gif.n_frames == 3
+        gif.seek(2)
+        red = gif.convert("RGB").getpixel((5, 5))[0]
+        assert red > 150
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_add_text_to_gif_streams_through_ffmpeg_in_place(tmp_path):
+    from PIL import Image
+
+    gif_path = tmp_path / "timelapse.gif"
+    _write_test_gif(gif_path, n_frames=5, duration=300)
+
+    timelapse_core.add_text_to_gif(str(gif_path), str(gif_path), "Title")
+
+    assert [p.name for p in tmp_path.iterdir()] == ["timelapse.gif"]
+    with Image.open(gif_path) as gif:
+        assert gif.n_frames == 5
+        assert gif.info["duration"] == 300
+
+
+def test_add_text_to_gif_pil_fallback_streams_frames_in_place(monkeypatch, tmp_path):
+    from PIL import Image
+
+    gif_path = tmp_path / "timelapse.gif"
+    _write_test_gif(gif_path, n_frames=12, duration=300)
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+
+    timelapse_core.add_text_to_gif(
+        str(gif_path), str(gif_path), [str(i) for i in range(12)]
+    )
+
+    assert [p.name for p in tmp_path.iterdir()] == ["timelapse.gif"]
+    with Image.open(gif_path) as gif:
+        assert gif.n_frames == 12
+        assert gif.info["duration"] == 300
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_add_text_to_gif_reused_frame_buffer_matches_pil_frames(monkeypatch, tmp_path):
+    in_gif = tmp_path / "in.gif"
+    _write_test_gif(in_gif, size=(80, 40))
+    outputs = []
+    for numpy_module in (timelapse_core.np, None):
+        monkeypatch.setattr(timelapse_core, "np", numpy_module)
+        out_gif = tmp_path / f"out_{len(outputs)}.gif"
+        timelapse_core.add_text_to_gif(str(in_gif), str(out_gif), ["A1", "B2"])
+        outputs.append(out_gif.read_bytes())
+
+    assert outputs[0] == outputs[1]
+
+
+def test_add_text_to_gif_numpy_compositing_matches_imagedraw(monkeypatch, tmp_path):
+    from PIL import Image
+
+    in_gif = tmp_path / "in.gif"
+    _write_test_gif(in_gif, size=(80, 40))
+    outputs = []
+    for numpy_module in (timelapse_core.np, None):
+        monkeypatch.setattr(timelapse_core, "np", numpy_module)
+        out_gif = tmp_path / f"out_{len(outputs)}.gif"
+        timelapse_core.add_text_to_gif(
+            str(in_gif), str(out_gif), ["A1", "B2", "C3", "D4"], font_color="yellow"
+        )
+        with Image.open(out_gif) as gif:
+            frames = []
+            for i in range(gif.n_frames):
+                gif.seek(i)
+                frames.append(gif.convert("RGB").tobytes())
+        outputs.append(frames)
+
+    assert outputs[0] == outputs[1]
+
+
+def test_add_overlays_to_gif_draws_labels_and_title_in_one_pass(monkeypatch, tmp_path):
+    from PIL import Image
+
+    in_gif = tmp_path / "in.gif"
+    _write_test_gif(in_gif, size=(80, 60))
+    opened = []
+    real_open = Image.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(timelapse_core.Image, "open", counting_open)
+    out_gif = tmp_path / "out.gif"
+    timelapse_core.add_overlays_to_gif(
+        str(in_gif),
+        str(out_gif),
+        ["A1", "B2", "C3", "D4"],
+        "Title",
+        font_color="red",
+        add_progress_bar=False,
+    )
+    monkeypatch.undo()
+
+    assert opened == [str(in_gif)]
+    with Image.open(out_gif) as gif:
+        assert gif.n_frames == 4
+        frame = gif.convert("RGB")
+    top = frame.crop((0, 0, 80, 20)).getcolors(80 * 20)
+    bottom = frame.crop((0, 50, 80, 60)).getcolors(80 * 10)
+    assert any(r > 150 and g < 100 for _, (r, g, b) in top)
+    assert any(r > 150 and g < 100 for _, (r, g, b) in bottom)
+
+
+def test_add_overlays_to_gif_closes_input_when_writing_fails(monkeypatch, tmp_path):
+    from PIL import Image
+
+    in_gif = tmp_path / "in.gif"
+    _write_test_gif(in_gif, size=(80, 60))
+
+    opened = []
+    real_open = Image.open
+
+    def tracking_open(*args, **kwargs):
+        image = real_open(*args, **kwargs)
+        opened.append(image)
+        return image
+
+    def failing_write(*args, **kwargs):
+        raise RuntimeError("annotate failed")
+
+    monkeypatch.setattr(Image, "open", tracking_open)
+    monkeypatch.setattr(timelapse_core, "_ffmpeg_write_gif", failing_write)
+
+    with pytest.raises(RuntimeError):
+        timelapse_core.add_overlays_to_gif(
+            str(in_gif), str(tmp_path / "out.gif"), ["A1", "B2"], "Title"
+        )
+    assert opened and all(image.fp is None for image in opened)
+
+
+def test_add_overlays_to_gif_removes_temp_file_when_save_fails(monkeypatch, tmp_path):
+    from PIL import Image
+
+    in_gif = tmp_path / "in.gif"
+    _write_test_gif(in_gif, size=(80, 60))
+
+    def failing_save(self, fp, *args, **kwargs):
+        with open(fp, "wb") as f:
+            f.write(b"GIF89a")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(timelapse_core, "_ffmpeg_write_gif", lambda *a, **k: False)
+    monkeypatch.setattr(Image.Image, "save", failing_save)
+
+    with pytest.raises(OSError):
+        timelapse_core.add_overlays_to_gif(
+            str(in_gif), str(in_gif), ["A1", "B2", "C3", "D4"], "Title"
+        )
+    assert [p.name for p in tmp_path.iterdir()] == ["in.gif"]
+
+
+def test_detect_h264_encoder_prefers_listed_hardware_encoder(monkeypatch):
+    import subprocess
+
+    listing = (
+        "Encoders:\n"
+        " ------\n"
+        " V....D libx264              libx264 H.264 / AVC\n"
+        " V....D h264_videotoolbox    VideoToolbox H.264 Encoder\n"
+    )
+    monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, listing, ""),
+    )
+    timelapse_core._detect_h264_encoder.cache_clear()
+    try:
+        assert timelapse_core._detect_h264_encoder() == "h264_videotoolbox"
+    finally:
+        timelapse_core._detect_h264_encoder.cache_clear()
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_gif_to_mp4_falls_back_to_libx264(monkeypatch, tmp_path):
+    gif_path = tmp_path / "in.gif"
+    _write_test_gif(gif_path, size=(41, 31))
+    # An encoder that no ffmpeg build provides fails to open
+    monkeypatch.setitem(
+        timelapse_core._HW_H264_ARGS, "h264_missing", ["-vcodec", "h264_missing"]
+    )
+    monkeypatch.setattr(timelapse_core, "_detect_h264_encoder", lambda: "h264_missing")
+
+    out_mp4 = tmp_path / "out.mp4"
+    assert timelapse_core.gif_to_mp4(str(gif_path), str(out_mp4))
+    assert out_mp4.stat().st_size > 0
+
+
+def test_gif_to_mp4_skips_unchanged_gif(monkeypatch, tmp_path):
+    import subprocess
+
+    gif_path = tmp_path / "in.gif"
+    _write_test_gif(gif_path)
+    out_mp4 = tmp_path / "out.mp4"
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        out_mp4.write_bytes(b"mp4")
+
+    monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(timelapse_core, "_detect_h264_encoder", lambda: None)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert timelapse_core.gif_to_mp4(str(gif_path), str(out_mp4))
+    assert timelapse_core.gif_to_mp4(str(gif_path), str(out_mp4))
+    assert len(runs) == 1
+
+    _write_test_gif(gif_path, duration=500)
+    assert timelapse_core.gif_to_mp4(str(gif_path), str(out_mp4))
+    assert len(runs) == 2
+
+
+def test_text_sprite_is_rasterized_once_per_label():
+    from PIL import ImageFont
+
+    font = ImageFont.load_default()
+    timelapse_core._text_sprite.cache_clear()
+
+    first = timelapse_core._text_sprite("2020", font, "white")
+    again = timelapse_core._text_sprite("2020", font, "white")
+
+    assert again is first
+    assert timelapse_core._text_sprite.cache_info().misses == 1
+    assert timelapse_core._text_sprite("", font, "white") is None
+
+
+def test_get_font_loads_each_size_once(monkeypatch):
+    calls = []
+
+    def fake_truetype(path, size):
+        calls.append(path)
+        if path == "arial.ttf":
+            raise OSError("cannot open resource")
+        return object()
+
+    monkeypatch.setattr(timelapse_core.ImageFont, "truetype", fake_truetype)
+    monkeypatch.setattr(timelapse_core, "_FONT_PATH", None)
+    timelapse_core._get_font.cache_clear()
+
+    font = timelapse_core._get_font(20)
+    assert timelapse_core._get_font(20) is font
+    timelapse_core._get_font(12)
+    timelapse_core._get_font.cache_clear()
+
+    # The failed candidate is only probed once
+    assert calls == ["arial.ttf", timelapse_core._FONT_CANDIDATES[1], calls[1]]
+
+
+def test_download_ee_video_and_fetch_overlaps_label_request(monkeypatch):
+    import threading
+
+    started = threading.Event()
+
+    class FakeLabels:
+        def getInfo(self):
+            started.set()
+            return ["2020", "2021"]
+
+    def fake_download(collection, video_args, out_gif):
+        # The label request must already be running while the video downloads
+        assert started.wait(timeout=5)
+
+    monkeypatch.setattr(timelapse_core, "download_ee_video", fake_download)
+
+    labels = timelapse_core._download_ee_video_and_fetch(
+        object(), {}, "out.gif", FakeLabels()
+    )
+
+    assert labels == ["2020", "2021"]
+    assert timelapse_core._download_ee_video_and_fetch(object(), {}, "out.gif") is None
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_month_day_labels(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(timelapse_core, "np", None)
+    timestamps = [
+        int(
+            datetime.datetime(
+                2013, month, day, tzinfo=datetime.timezone.utc
+            ).timestamp()
+            * 1000
+        )
+        for month, day in [(1, 1), (2, 18), (12, 19)]
+    ]
+
+    assert timelapse_core._month_day_labels(timestamps) == [
+        "Jan 01",
+        "Feb 18",
+        "Dec 19",
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_utc_minute_labels(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(timelapse_core, "np", None)
+    timestamps = [
+        int(
+            datetime.datetime(
+                2021, 10, 24, hour, minute, 59, tzinfo=datetime.timezone.utc
+            ).timestamp()
+            * 1000
+        )
+        for hour, minute in [(14, 0), (23, 50)]
+    ]
+
+    assert timelapse_core._utc_minute_labels(timestamps) == [
+        "2021-10-24 14:00 UTC",
+        "2021-10-24 23:50 UTC",
+    ]
+
+
+def test_cached_get_info_reuses_stored_result(monkeypatch, tmp_path):
+    class FakeQuery:
+        calls = 0
+
+        def serialize(self):
+            return '{"values": {"0": "dates"}}'
+
+        def getInfo(self):
+            FakeQuery.calls += 1
+            return ["2021-10-24 14:00", "2021-10-24 14:10"]
+
+    monkeypatch.setattr(timelapse_core, "_EE_INFO_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(timelapse_core, "_EE_INFO_MEMO", collections.OrderedDict())
+
+    first = timelapse_core._cached_get_info(FakeQuery())
+    assert timelapse_core._cached_get_info(FakeQuery()) == first
+    assert FakeQuery.calls == 1
+
+    # A new session reads the stored result from disk
+    monkeypatch.setattr(timelapse_core, "_EE_INFO_MEMO", collections.OrderedDict())
+    assert timelapse_core._cached_get_info(FakeQuery()) == first
+    assert FakeQuery.calls == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_cached_get_info_bounds_memo_and_disk_cache(monkeypatch, tmp_path):
+    class FakeQuery:
+        def __init__(self, n):
+            self.n = n
+
+        def serialize(self):
+            return f'{{"values": {{"0": {self.n}}}}}'
+
+        def getInfo(self):
+            return self.n
+
+    monkeypatch.setattr(timelapse_core, "_EE_INFO_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(timelapse_core, "_EE_INFO_MEMO", collections.OrderedDict())
+    monkeypatch.setattr(timelapse_core, "_EE_INFO_MEMO_SIZE", 2)
+    monkeypatch.setattr(timelapse_core, "_EE_INFO_CACHE_MAX_FILES", 3)
+
+    for n in range(5):
+        assert timelapse_core._cached_get_info(FakeQuery(n)) == n
+
+    assert list(timelapse_core._EE_INFO_MEMO.values()) == [3, 4]
+    assert len(list(tmp_path.glob("*.json"))) == 3
+
+
+def test_cached_download_ee_video_reuses_stored_gif(monkeypatch, tmp_path):
+    class FakeCollection:
+        def serialize(self):
+            return '{"values": {"0": "collection"}}'
+
+    downloads = []
+
+    def fake_download(collection, video_args, out_gif):
+        downloads.append(video_args["dimensions"])
+        _write_test_gif(out_gif)
+        return out_gif
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(timelapse_core, "_EE_VIDEO_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(timelapse_core, "download_ee_video", fake_download)
+
+    first = tmp_path / "first.gif"
+    second = tmp_path / "second.gif"
+    timelapse_core._cached_download_ee_video(
+        FakeCollection(), {"dimensions": 768}, str(first)
+    )
+    timelapse_core._cached_download_ee_video(
+        FakeCollection(), {"dimensions": 768}, str(second)
+    )
+    assert downloads == [768]
+    assert second.read_bytes() == first.read_bytes()
+
+    # Different video parameters are a different download
+    timelapse_core._cached_download_ee_video(
+        FakeCollection(), {"dimensions": 512}, str(second)
+    )
+    assert downloads == [768, 512]
+    assert len(list(cache_dir.glob("*.gif"))) == 2
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_annotate_timelapse_writes_mp4_from_final_pass(tmp_path):
+    from PIL import Image
+
+    gif_path = tmp_path / "timelapse.gif"
+    _write_test_gif(gif_path, n_frames=4, size=(41, 31))
+
+    timelapse_core._annotate_timelapse(
+        str(gif_path), ["a", "b", "c", "d"], "Title", mp4=True
+    )
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "timelapse.gif",
+        "timelapse.mp4",
+    ]
+    assert (tmp_path / "timelapse.mp4").stat().st_size > 0
+    with Image.open(gif_path) as gif:
+        assert gif.n_frames == 4
+
+
+def test_create_timelapses_batch_keeps_order_and_isolates_failures(monkeypatch):
+    def fake_builder(out_gif, fail=False):
+        if fail:
+            raise RuntimeError("quota exceeded")
+        return out_gif
+
+    monkeypatch.setitem(timelapse_core._TIMELAPSE_BUILDERS, "landsat", fake_builder)
+    specs = [
+        {"type": "landsat", "out_gif": "a.gif"},
+        {"type": "landsat", "out_gif": "b.gif", "fail": True},
+        {"type": "landsat", "out_gif": "c.gif"},
+    ]
+
+    assert timelapse_core.create_timelapses_batch(specs, max_workers=2) == [
+        "a.gif",
+        None,
+        "c.gif",
+    ]
+    with pytest.raises(ValueError):
+        timelapse_core.create_timelapses_batch([{"type": "unknown"}])
+
+
+def test_download_ee_video_retries_transient_http_errors(monkeypatch, tmp_path):
+    import io
+    import urllib.error
+    import urllib.request
+
+    class FakeCollection:
+        def getVideoThumbURL(self, args):
+            return "https://earthengine.googleapis.com/v1/videoThumbnails/x"
+
+    responses = [
+        urllib.error.HTTPError("url", 503, "Unavailable", {}, io.BytesIO()),
+        io.BytesIO(b"GIF89a"),
+    ]
+
+    def fake_urlopen(url, timeout=None):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    out_gif = tmp_path / "out.gif"
+
+    timelapse_core.download_ee_video(FakeCollection(), {}, str(out_gif), backoff=0)
+
+    assert out_gif.read_bytes() == b"GIF89a"
+    assert responses == []
+
+
+def test_download_ee_video_removes_truncated_file(monkeypatch, tmp_path):
+    import urllib.request
+
+    class FakeCollection:
+        def getVideoThumbURL(self, args):
+            return "https://earthengine.googleapis.com/v1/videoThumbnails/x"
+
+    class DroppedResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def read(self, size=-1):
+            raise ConnectionResetError("connection reset")
+
+    monkeypatch.setattr(
+        urllib.request, "urlopen", lambda url, timeout=None: DroppedResponse()
+    )
+    out_gif = tmp_path / "out.gif"
+
+    with pytest.raises(ConnectionResetError):
+        timelapse_core.download_ee_video(
+            FakeCollection(), {}, str(out_gif), max_retries=1, backoff=0
+        )
+    assert not out_gif.exists()
+
+
+def test_goes_custom_vis_params_uses_channel_ranges():
+    vis_params = timelapse_core._goes_custom_vis_params(
+        ["CMI_C02", "CMI_C13", "CMI_C01"]
+    )
+
+    assert vis_params == {
+        "bands": ["GOES_RED", "GOES_GREEN", "GOES_BLUE"],
+        "min": [0.0, 180.0, 0.0],
+        "max": [1.0, 330.0, 1.0],
+    }
+    assert timelapse_core._goes_mode(" Volcanic_Ash ") == "volcanic_ash"
+    with pytest.raises(ValueError):
+        timelapse_core._goes_mode("false_color")
@@ -1,9 +1,12 @@
 """Tests for virtual environment dependency status checks."""
 
+import os
 import sys
 import types
 
-from timelapse.core import python_manager, venv_manager
+import pytest
+
+from timelapse.core import python_manager, uv_manager, venv_manager
 
 
 def _write_dist_info(site_packages, directory_name, package_name, version):
@@ -163,6 +166,50 @@ def test_find_python_executable_selects_matching_bundle_python(monkeypatch, tmp_
     assert venv_manager._find_python_executable() == str(python_path)
 
 
+def test_find_python_executable_probes_once_per_session(monkeypatch, tmp_path):
+    """A resolved interpreter is not started again for the next lookup."""
+    monkeypatch.setattr(venv_manager, "_python_executable_cache", {})
+    runs = []
+
+    def fake_run(cmd, **_kwargs):
+        runs.append(cmd)
+        return types.SimpleNamespace(
+            returncode=0,
+            stdout=f"{sys.version_info.major}.{sys.version_info.minor}\n",
+        )
+
+    monkeypatch.setattr(venv_manager.subprocess, "run", fake_run)
+
+    first = venv_manager._find_python_executable()
+    assert venv_manager._find_python_executable() == first
+    assert len(runs) == 1
+
+
+def test_get_qgis_python_reuses_stored_path(monkeypatch, tmp_path):
+    """A Python resolved in an earlier session is not probed again."""
+    python_path = tmp_path / "python3"
+    python_path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(
+        venv_manager, "PYTHON_PATH_FILE", str(tmp_path / "cache" / ".python")
+    )
+    calls = []
+
+    def fake_find():
+        calls.append(1)
+        return str(python_path)
+
+    monkeypatch.setattr(venv_manager, "_find_python_executable", fake_find)
+
+    assert venv_manager._get_qgis_python() == str(python_path)
+    assert venv_manager._get_qgis_python() == str(python_path)
+    assert len(calls) == 1
+
+    # A stored path for another QGIS executable is resolved again
+    monkeypatch.setattr(venv_manager.sys, "executable", str(tmp_path / "other"))
+    assert venv_manager._get_qgis_python() == str(python_path)
+    assert len(calls) == 2
+
+
 def test_find_python_executable_reports_checked_candidates(monkeypatch, tmp_path):
     """Resolver failures should be explicit and diagnosable."""
     launcher = tmp_path / "QGIS"
@@ -186,3 +233,614 @@ def test_find_python_executable_reports_checked_candidates(monkeypatch, tmp_path
 
     assert "Could not find a Python executable" in message
     assert "Checked candidates" in message
+
+
+def _write_required_dist_infos(site_packages):
+    _write_dist_info(
+        site_packages,
+        "earthengine_api-1.7.4.dist-info",
+        "earthengine-api",
+        "1.7.4",
+    )
+    _write_dist_info(site_packages, "numpy-2.3.5.dist-info", "numpy", "2.3.5")
+    _write_dist_info(site_packages, "pillow-12.1.1.dist-info", "Pillow", "12.1.1")
+    _write_dist_info(
+        site_packages,
+        "google_auth_oauthlib-1.2.3.dist-info",
+        "google-auth-oauthlib",
+        "1.2.3",
+    )
+
+
+def test_install_dependencies_skips_when_specs_unchanged(tmp_path, monkeypatch):
+    """A matching dependency hash avoids running the installer again."""
+    venv_dir = tmp_path / "venv"
+    python_path = venv_dir / "bin" / "python3"
+    python_path.parent.mkdir(parents=True)
+    python_path.write_text("", encoding="utf-8")
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    _write_required_dist_infos(site_packages)
+    (venv_dir / venv_manager.DEPS_HASH_FILE).write_text(
+        venv_manager._compute_deps_hash(), encoding="utf-8"
+    )
+
+    def fail_install(*_args, **_kwargs):
+        raise AssertionError("installer should not run")
+
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        venv_manager,
+        "get_venv_site_packages",
+        lambda venv_dir=None: str(site_packages),
+    )
+    monkeypatch.setattr(venv_manager, "_run_install", fail_install)
+
+    success, _message = venv_manager.install_dependencies(str(venv_dir))
+
+    assert success is True
+
+
+def test_install_dependencies_builds_from_source_only_without_wheels(
+    tmp_path, monkeypatch
+):
+    """Only a missing wheel triggers the second, source-allowed pass."""
+    python_path = tmp_path / "python"
+    python_path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        venv_manager, "get_venv_python_path", lambda venv_dir=None: str(python_path)
+    )
+    monkeypatch.setattr(
+        venv_manager, "get_venv_site_packages", lambda venv_dir=None: None
+    )
+    monkeypatch.setattr(uv_manager, "uv_exists", lambda: False)
+    commands = []
+    output = ""
+
+    def fake_install(cmd, *_args, **_kwargs):
+        commands.append(cmd)
+        return False, venv_manager._classify_pip_error(output), output
+
+    monkeypatch.setattr(venv_manager, "_run_install", fake_install)
+
+    output = "ConnectionError: connection reset by peer"
+    assert venv_manager.install_dependencies(str(tmp_path))[0] is False
+    assert len(commands) == 1
+
+    commands.clear()
+    output = "ERROR: No matching distribution found for earthengine-api"
+    venv_manager.install_dependencies(str(tmp_path))
+    assert len(commands) == 2
+    assert "--only-binary" in commands[0]
+    assert "--only-binary" not in commands[1]
+
+
+def test_install_dependencies_skips_when_installed_versions_satisfy_specs(
+    tmp_path, monkeypatch
+):
+    """Installed packages that meet the specs skip the installer without a hash."""
+    pytest.importorskip("packaging")
+    venv_dir = tmp_path / "venv"
+    python_path = venv_dir / "bin" / "python3"
+    python_path.parent.mkdir(parents=True)
+    python_path.write_text("", encoding="utf-8")
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    _write_required_dist_infos(site_packages)
+    monkeypatch.setattr(
+        venv_manager,
+        "REQUIRED_PACKAGES",
+        [
+            ("earthengine-api", ">=1.0"),
+            ("numpy", ""),
+            ("Pillow", ">=10"),
+            ("google-auth-oauthlib", ""),
+        ],
+    )
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        venv_manager,
+        "get_venv_site_packages",
+        lambda venv_dir=None: str(site_packages),
+    )
+    monkeypatch.setattr(
+        venv_manager, "get_venv_python_path", lambda venv_dir=None: str(python_path)
+    )
+
+    def fail_install(*_args, **_kwargs):
+        raise AssertionError("installer should not run")
+
+    monkeypatch.setattr(venv_manager, "_run_install", fail_install)
+    assert venv_manager.install_dependencies(str(venv_dir))[0] is True
+    assert (venv_dir / venv_manager.DEPS_HASH_FILE).read_text(
+        encoding="utf-8"
+    ) == venv_manager._compute_deps_hash()
+
+    # An unmet spec still goes to the installer
+    (venv_dir / venv_manager.DEPS_HASH_FILE).unlink()
+    monkeypatch.setattr(venv_manager, "REQUIRED_PACKAGES", [("numpy", ">=3")])
+    assert not venv_manager._dependencies_up_to_date(
+        str(venv_dir), venv_manager._compute_deps_hash()
+    )
+
+
+def test_install_dependencies_upgrades_only_when_forced(tmp_path, monkeypatch):
+    """Satisfied packages are not upgraded unless asked for."""
+    python_path = tmp_path / "python"
+    python_path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        venv_manager, "get_venv_python_path", lambda venv_dir=None: str(python_path)
+    )
+    monkeypatch.setattr(
+        venv_manager, "get_venv_site_packages", lambda venv_dir=None: None
+    )
+    monkeypatch.setattr(venv_manager.uv_manager, "uv_exists", lambda: False)
+    commands = []
+
+    def fake_install(cmd, *_args, **_kwargs):
+        commands.append(cmd)
+        return False, "stop", ""
+
+    monkeypatch.setattr(venv_manager, "_run_install", fake_install)
+
+    venv_manager.install_dependencies(str(tmp_path))
+    assert "--upgrade" not in commands[-1]
+    venv_manager.install_dependencies(str(tmp_path), force_upgrade=True)
+    assert "--upgrade" in commands[-1]
+
+
+def test_get_venv_status_trusts_ready_marker(tmp_path, monkeypatch):
+    """A completed install is recognized without scanning site-packages."""
+    venv_dir = tmp_path / "venv"
+    venv_dir.mkdir()
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    _write_required_dist_infos(site_packages)
+    (venv_dir / venv_manager.DEPS_HASH_FILE).write_text(
+        venv_manager._compute_deps_hash(), encoding="utf-8"
+    )
+    monkeypatch.setattr(venv_manager, "VENV_DIR", str(venv_dir))
+    monkeypatch.setattr(venv_manager, "_ready_cache", {})
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        venv_manager,
+        "get_venv_site_packages",
+        lambda venv_dir=None: str(site_packages),
+    )
+    python_path = venv_dir / "python"
+    python_path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(
+        venv_manager, "get_venv_python_path", lambda venv_dir=None: str(python_path)
+    )
+
+    assert venv_manager.install_dependencies(str(venv_dir))[0] is True
+    assert (venv_dir / venv_manager.READY_FILE).is_file()
+
+    def fail_scan(_site_packages):
+        raise AssertionError("site-packages should not be scanned")
+
+    monkeypatch.setattr(venv_manager, "_scan_site_packages", fail_scan)
+    monkeypatch.setattr(venv_manager, "venv_exists", lambda venv_dir=None: False)
+    assert venv_manager.get_venv_status() == (True, "Virtual environment ready")
+
+    # The marker is only parsed once per session
+    real_json_load = venv_manager.json.load
+
+    def fail_json_load(_f):
+        raise AssertionError("marker should not be read again")
+
+    monkeypatch.setattr(venv_manager.json, "load", fail_json_load)
+    assert venv_manager.get_venv_status() == (True, "Virtual environment ready")
+    monkeypatch.setattr(venv_manager.json, "load", real_json_load)
+
+    # A new session with changed package specs ignores the marker
+    monkeypatch.setattr(venv_manager, "_ready_cache", {})
+    monkeypatch.setattr(venv_manager, "_compute_deps_hash", lambda: "changed")
+    assert venv_manager.get_venv_status() == (
+        False,
+        "Virtual environment not configured",
+    )
+
+
+def test_get_venv_status_rejects_ready_marker_without_interpreter(
+    tmp_path, monkeypatch
+):
+    """A ready marker is ignored once the venv's interpreter is gone."""
+    venv_dir = tmp_path / "venv"
+    venv_dir.mkdir()
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    _write_required_dist_infos(site_packages)
+    python_path = venv_dir / "python"
+    python_path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(venv_manager, "VENV_DIR", str(venv_dir))
+    monkeypatch.setattr(venv_manager, "_ready_cache", {})
+    monkeypatch.setattr(
+        venv_manager,
+        "get_venv_site_packages",
+        lambda venv_dir=None: str(site_packages),
+    )
+    monkeypatch.setattr(
+        venv_manager, "get_venv_python_path", lambda venv_dir=None: str(python_path)
+    )
+    venv_manager._write_ready_marker(str(venv_dir), venv_manager._compute_deps_hash())
+    assert venv_manager.get_venv_status() == (True, "Virtual environment ready")
+
+    python_path.unlink()
+    assert venv_manager.get_venv_status() == (
+        False,
+        "Virtual environment not configured",
+    )
+
+
+def test_get_venv_site_packages_reuses_recorded_path(tmp_path, monkeypatch):
+    """The resolved path is recorded in the venv and reused without a scan."""
+    venv_dir = tmp_path / "venv"
+    site_packages = venv_dir / "lib" / "python3.12" / "site-packages"
+    site_packages.mkdir(parents=True)
+    monkeypatch.setattr(venv_manager, "_IS_WINDOWS", False)
+    monkeypatch.setattr(venv_manager, "_site_packages_cache", {})
+
+    assert venv_manager.get_venv_site_packages(str(venv_dir)) == str(site_packages)
+    assert (venv_dir / venv_manager.SITE_PACKAGES_FILE).read_text(
+        encoding="utf-8"
+    ) == str(site_packages)
+
+    # A new session trusts the pointer file instead of listing lib/
+    monkeypatch.setattr(venv_manager, "_site_packages_cache", {})
+
+    def fail_listdir(path):
+        raise AssertionError("lib/ should not be scanned")
+
+    monkeypatch.setattr(venv_manager.os, "listdir", fail_listdir)
+    monkeypatch.setattr(venv_manager.os, "scandir", fail_listdir)
+    assert venv_manager.get_venv_site_packages(str(venv_dir)) == str(site_packages)
+
+
+def test_run_install_subprocess_keeps_output_tail():
+    """Large installer output is drained while running and only its tail kept."""
+    script = (
+        "import sys\n"
+        "for i in range(5000):\n"
+        "    print(f'Collecting package-{i} ' + 'x' * 40)\n"
+        "print('ERROR: no matching distribution', file=sys.stderr)\n"
+        "sys.exit(1)\n"
+    )
+
+    returncode, stdout, stderr = venv_manager._run_install_subprocess(
+        [sys.executable, "-c", script], None, {}, timeout=60
+    )
+
+    assert returncode == 1
+    assert stdout == ""
+    lines = stderr.splitlines()
+    assert len(lines) == venv_manager._OUTPUT_TAIL_LINES
+    assert lines[-1] == "ERROR: no matching distribution"
+    assert lines[0].startswith("Collecting package-4937 ")
+
+
+def _write_venv_archive(path, deps_hash, extra_members=()):
+    import io
+    import tarfile
+
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in [
+            ("bin/python", b""),
+            (venv_manager.DEPS_HASH_FILE, deps_hash.encode("utf-8")),
+            (venv_manager.SITE_PACKAGES_FILE, b"/elsewhere/site-packages"),
+        ]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        for info in extra_members:
+            tar.addfile(info)
+
+
+def test_candidate_python_paths_skips_other_apps_python_versions(tmp_path, monkeypatch):
+    """Bundled Pythons of another version are not probed."""
+    tag = f"{sys.version_info.major}{sys.version_info.minor}"
+    for name in (f"Python{tag}", "Python27", "Python3", "python-qgis"):
+        (tmp_path / "apps" / name).mkdir(parents=True)
+    monkeypatch.setattr(
+        venv_manager.sys, "executable", str(tmp_path / "bin" / "qgis-bin.exe")
+    )
+
+    apps_candidates = [
+        path
+        for path in venv_manager._candidate_python_paths()
+        if os.path.dirname(os.path.dirname(path)) == str(tmp_path / "apps")
+    ]
+    assert {os.path.basename(os.path.dirname(p)) for p in apps_candidates} == {
+        f"Python{tag}",
+        "Python3",
+        "python-qgis",
+    }
+
+
+def test_cleanup_partial_venv_frees_path_before_deleting(tmp_path, monkeypatch):
+    """The partial venv is renamed aside and deleted in the background."""
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    threads = []
+
+    class RecordingThread:
+        def __init__(self, target, daemon):
+            self.target = target
+            threads.append(self)
+
+        def start(self):
+            pass
+
+    monkeypatch.setattr(venv_manager.threading, "Thread", RecordingThread)
+    venv_dir = tmp_path / "venv"
+    (venv_dir / "lib").mkdir(parents=True)
+    (venv_dir / "lib" / "mod.py").write_text("", encoding="utf-8")
+    (tmp_path / "venv.partial-1-2").mkdir()
+
+    venv_manager._cleanup_partial_venv(str(venv_dir))
+
+    assert not venv_dir.exists()
+    assert len(list(tmp_path.glob("venv.partial-*"))) == 2
+    threads[0].target()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_try_restore_cached_venv_extracts_matching_archive(tmp_path, monkeypatch):
+    """A pre-built venv for the current specs replaces venv creation."""
+    monkeypatch.setattr(venv_manager, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(venv_manager, "_IS_WINDOWS", False)
+    runs = []
+
+    def fake_run(cmd, **_kwargs):
+        runs.append(cmd)
+        return types.SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(venv_manager.subprocess, "run", fake_run)
+    venv_dir = tmp_path / "venv"
+
+    # No archive: create the venv as usual
+    assert not venv_manager._try_restore_cached_venv(str(venv_dir), "python3")
+
+    archive = venv_manager._venv_archive_paths()[-1]
+    _write_venv_archive(archive, venv_manager._compute_deps_hash())
+    assert venv_manager._try_restore_cached_venv(str(venv_dir), "python3") == "archive"
+    assert (venv_dir / "bin" / "python").is_file()
+    assert not (venv_dir / venv_manager.SITE_PACKAGES_FILE).exists()
+    assert runs == [["python3", "-m", "venv", "--upgrade", str(venv_dir)]]
+
+    # An archive built for other package specs is ignored
+    _write_venv_archive(archive, "stale")
+    other_dir = tmp_path / "other"
+    assert not venv_manager._try_restore_cached_venv(str(other_dir), "python3")
+    assert not other_dir.exists()
+
+    # Absolute interpreter links are left to "venv --upgrade", while members
+    # that escape the venv reject the whole archive
+    import tarfile
+
+    link = tarfile.TarInfo("bin/python3")
+    link.type = tarfile.SYMTYPE
+    link.linkname = "/usr/bin/python3"
+    _write_venv_archive(archive, venv_manager._compute_deps_hash(), [link])
+    linked_dir = tmp_path / "linked"
+    assert venv_manager._try_restore_cached_venv(str(linked_dir), "python3")
+    assert not os.path.lexists(linked_dir / "bin" / "python3")
+
+    escape = tarfile.TarInfo("../escaped.txt")
+    _write_venv_archive(archive, venv_manager._compute_deps_hash(), [escape])
+    escaped_dir = tmp_path / "escaped"
+    assert not venv_manager._try_restore_cached_venv(str(escaped_dir), "python3")
+    assert not (tmp_path / "escaped.txt").exists()
+
+    monkeypatch.delattr(venv_manager.tarfile, "data_filter")
+    assert not venv_manager._try_restore_cached_venv(str(linked_dir), "python3")
+
+
+def test_try_restore_cached_venv_clones_saved_template(tmp_path, monkeypatch):
+    """A verified venv is snapshotted and cloned when the venv is recreated."""
+    monkeypatch.setattr(venv_manager, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(venv_manager, "venv_exists", lambda venv_dir=None: True)
+    monkeypatch.setattr(
+        venv_manager.subprocess,
+        "run",
+        lambda cmd, **_kwargs: types.SimpleNamespace(returncode=0),
+    )
+    venv_dir = tmp_path / "venv"
+    module = venv_dir / "lib" / "python3.12" / "site-packages" / "mod.py"
+    module.parent.mkdir(parents=True)
+    module.write_text("x = 1\n", encoding="utf-8")
+    (venv_dir / "pyvenv.cfg").write_text("home = /usr/bin\n", encoding="utf-8")
+    (venv_dir / venv_manager.SITE_PACKAGES_FILE).write_text(
+        str(module.parent), encoding="utf-8"
+    )
+    (venv_dir / venv_manager.DEPS_HASH_FILE).write_text(
+        venv_manager._compute_deps_hash(), encoding="utf-8"
+    )
+
+    venv_manager._save_venv_template(str(venv_dir))
+    template_dir = tmp_path / os.path.basename(venv_manager._venv_template_dir())
+    assert (template_dir / "pyvenv.cfg").is_file()
+    assert not (template_dir / venv_manager.SITE_PACKAGES_FILE).exists()
+    # Files rewritten in place by "venv --upgrade" are never shared
+    assert not os.path.samefile(template_dir / "pyvenv.cfg", venv_dir / "pyvenv.cfg")
+
+    venv_manager.remove_venv(str(venv_dir))
+    assert not template_dir.exists()
+
+    # Without reflinks or hardlinks the template would be a full copy
+    venv_dir.mkdir()
+    (venv_dir / venv_manager.DEPS_HASH_FILE).write_text(
+        venv_manager._compute_deps_hash(), encoding="utf-8"
+    )
+    can_clone_cheaply = venv_manager._can_clone_cheaply
+    monkeypatch.setattr(venv_manager, "_can_clone_cheaply", lambda *_args: False)
+    venv_manager._save_venv_template(str(venv_dir))
+    assert not template_dir.exists()
+    monkeypatch.setattr(venv_manager, "_can_clone_cheaply", can_clone_cheaply)
+    venv_manager._save_venv_template(str(tmp_path / "missing"))
+    assert not template_dir.exists()
+
+    other_dir = tmp_path / "other"
+    module = other_dir / "lib" / "python3.12" / "site-packages" / "mod.py"
+    module.parent.mkdir(parents=True)
+    module.write_text("x = 2\n", encoding="utf-8")
+    (other_dir / venv_manager.DEPS_HASH_FILE).write_text(
+        venv_manager._compute_deps_hash(), encoding="utf-8"
+    )
+    venv_manager._save_venv_template(str(other_dir))
+
+    restored = tmp_path / "restored"
+    assert venv_manager._try_restore_cached_venv(str(restored), "python3") == "template"
+    assert (restored / "lib" / "python3.12" / "site-packages" / "mod.py").read_text(
+        encoding="utf-8"
+    ) == "x = 2\n"
+
+
+def test_get_verification_code_uses_import_table():
+    """Verification code comes from the import table, with a name fallback."""
+    assert (
+        venv_manager._get_verification_code("Pillow")
+        == "import PIL.Image; print(PIL.Image.__version__)"
+    )
+    assert (
+        venv_manager._get_verification_code("google-auth-oauthlib")
+        == "import google_auth_oauthlib"
+    )
+    assert venv_manager._get_verification_code("some-package") == (
+        "import some_package"
+    )
+
+
+def test_verify_venv_checks_all_packages_in_one_subprocess(tmp_path, monkeypatch):
+    """Every package is checked by a single venv interpreter."""
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(venv_manager, "venv_exists", lambda venv_dir=None: True)
+    monkeypatch.setattr(
+        venv_manager, "get_venv_python_path", lambda venv_dir=None: sys.executable
+    )
+    real_run = venv_manager.subprocess.run
+    runs = []
+
+    def counting_run(cmd, **kwargs):
+        runs.append(cmd)
+        return real_run(cmd, **kwargs)
+
+    monkeypatch.setattr(venv_manager.subprocess, "run", counting_run)
+
+    monkeypatch.setattr(venv_manager, "REQUIRED_PACKAGES", [("json", ""), ("os", "")])
+    assert venv_manager.verify_venv(str(tmp_path)) == (
+        True,
+        "Virtual environment ready",
+    )
+    assert len(runs) == 1
+
+    monkeypatch.setattr(
+        venv_manager,
+        "REQUIRED_PACKAGES",
+        [("json", ""), ("missing-package-xyz", "")],
+    )
+    success, message = venv_manager.verify_venv(str(tmp_path))
+    assert success is False
+    assert message.startswith("Package missing-package-xyz is broken: ")
+    assert "ModuleNotFoundError" in message
+
+    # Warnings on stderr share the pipe with the JSON result
+    monkeypatch.setattr(venv_manager, "REQUIRED_PACKAGES", [("json", "")])
+    monkeypatch.setattr(
+        venv_manager,
+        "_get_verification_code",
+        lambda _name: "import sys; sys.stderr.write('{warning\\n'); sys.stderr.flush()",
+    )
+    assert venv_manager.verify_venv(str(tmp_path))[0] is True
+
+
+def test_installer_error_markers():
+    """Installer output is classified without regard to case or order."""
+    assert venv_manager._is_ssl_error("[SSL: CERTIFICATE_VERIFY_FAILED]")
+    assert venv_manager._is_network_error("urllib3 NewConnectionError: Timed Out")
+    assert not venv_manager._is_network_error("ERROR: No matching distribution")
+    message = venv_manager._classify_pip_error(
+        "PermissionError: ...\nERROR: No matching distribution found for ee"
+    )
+    assert message.startswith("A required package was not found.")
+    assert venv_manager._classify_pip_error("OSError: No space left on device") == (
+        "Not enough disk space to install dependencies."
+    )
+
+
+def test_run_install_network_retry_keeps_ssl_flags(monkeypatch):
+    """A network retry after an SSL failure still trusts the PyPI hosts."""
+    results = iter(
+        [
+            (1, "", "SSL: CERTIFICATE_VERIFY_FAILED"),
+            (1, "", "ConnectionError: connection reset by peer"),
+            (0, "", ""),
+        ]
+    )
+    commands = []
+
+    def fake_run(cmd, *_args, **_kwargs):
+        commands.append(cmd)
+        return next(results)
+
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(venv_manager, "_run_install_subprocess", fake_run)
+    monkeypatch.setattr(
+        venv_manager, "_sleep_unless_cancelled", lambda *_args, **_kwargs: True
+    )
+
+    assert venv_manager._run_install(["pip", "install", "ee"], None, {}) == (
+        True,
+        "",
+        "",
+    )
+    assert len(commands) == 3
+    assert commands[2] == commands[1]
+    assert "--trusted-host" in commands[2]
+
+
+def test_run_install_network_retry_wait_is_cancellable(monkeypatch):
+    """Cancelling during the back-off skips the retry."""
+    calls = []
+
+    def fake_run(cmd, *_args, **_kwargs):
+        calls.append(cmd)
+        return 1, "", "connection refused"
+
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(venv_manager, "_run_install_subprocess", fake_run)
+
+    success, message, _output = venv_manager._run_install(
+        ["pip", "install", "ee"], None, {}, cancel_check=lambda: len(calls) > 0
+    )
+
+    assert (success, message) == (False, "Installation cancelled.")
+    assert len(calls) == 1
+
+
+def test_refresh_ee_updates_registered_modules(monkeypatch):
+    """Registered modules get the fresh ee, or reload their own dependencies."""
+    monkeypatch.setattr(venv_manager, "_EE_CONSUMERS", [])
+    monkeypatch.setattr(venv_manager, "_log", lambda *args, **kwargs: None)
+    fake_ee = types.ModuleType("ee")
+    monkeypatch.setitem(sys.modules, "ee", fake_ee)
+
+    plain = types.ModuleType("plain_consumer")
+    plain.ee = None
+    reloading = types.ModuleType("reloading_consumer")
+    reloading.ee = None
+    reloading.reload_dependencies = lambda: setattr(reloading, "ee", "reloaded")
+    gone = types.ModuleType("gone_consumer")
+    for module in (plain, reloading, reloading, gone):
+        venv_manager.register_ee_consumer(module)
+    assert len(venv_manager._EE_CONSUMERS) == 3
+    del gone, module
+
+    venv_manager._refresh_ee_in_modules()
+
+    assert plain.ee is fake_ee
+    assert reloading.ee == "reloaded"
+    assert len(venv_manager._EE_CONSUMERS) == 2
@@ -6,8 +6,6 @@ and aerial imagery (NAIP, Landsat, Sentinel-2, Sentinel-1, GOES, MODIS)
 using Google Earth Engine.
 """
 
-from .timelapse_plugin import TimelapsePlugin
-
 
 def classFactory(iface):
     """Load TimelapsePlugin class from file timelapse_plugin.
@@ -18,4 +16,6 @@ def classFactory(iface):
     Returns:
         TimelapsePlugin: The plugin instance.
     """
+    from .timelapse_plugin import TimelapsePlugin
+
     return TimelapsePlugin(iface)
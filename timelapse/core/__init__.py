@@ -5,23 +5,6 @@ This module contains the core functionality for creating timelapse animations
 from satellite and aerial imagery using Google Earth Engine.
 """
 
-from .timelapse_core import (
-    check_dependencies,
-    reload_dependencies,
-    get_ee_project,
-    is_ee_initialized,
-    initialize_ee,
-    try_auto_initialize_ee,
-    bbox_to_ee_geometry,
-    geojson_to_ee_geometry,
-    create_naip_timelapse,
-    create_sentinel2_timelapse,
-    create_sentinel1_timelapse,
-    create_landsat_timelapse,
-    create_modis_ndvi_timelapse,
-    create_goes_timelapse,
-)
-
 __all__ = [
     "check_dependencies",
     "reload_dependencies",
@@ -38,3 +21,22 @@ __all__ = [
     "create_modis_ndvi_timelapse",
     "create_goes_timelapse",
 ]
+
+
+def __getattr__(name):
+    """Import public names from ``timelapse_core`` on first access.
+
+    Importing ``timelapse.core`` (for example to reach ``venv_manager``) does
+    not load Earth Engine or Pillow until one of these names is used.
+    """
+    if name in __all__:
+        from . import timelapse_core
+
+        value = getattr(timelapse_core, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,7 @@ import re
 import tempfile
 import urllib.parse
 import urllib.request
+import uuid
 import xml.etree.ElementTree as ET  # nosec B405 (parsing trusted ESRI Wayback WMTS XML over https; no DTDs/entities used)
 from dataclasses import dataclass
 from typing import Callable, Dict, Iterable, List, Optional
@@ -305,23 +306,25 @@ def force_gif_frame_duration(
         return
 
     duration = int(1000 / max(fps, 1))
-    with timelapse_core.Image.open(in_gif) as gif:
-        frames = []
-        for index in range(gif.n_frames):
-            gif.seek(index)
-            frames.append(gif.copy())
-
-    if not frames:
-        raise ValueError("No frames found in GIF.")
-
-    frames[0].save(
-        out_gif,
-        format="GIF",
-        append_images=frames[1:],
-        save_all=True,
-        duration=duration,
-        loop=loop,
-    )
+    # Let Pillow walk the frames itself (ImageSequence) while saving instead
+    # of seeking and copying every frame into a list first. The output goes
+    # to a temporary file because in_gif is still being read.
+    tmp_gif = f"{out_gif}.{uuid.uuid4().hex}.tmp.gif"
+    try:
+        with timelapse_core.Image.open(in_gif) as gif:
+            gif.save(
+                tmp_gif,
+                format="GIF",
+                save_all=True,
+                duration=duration,
+                loop=loop,
+                optimize=True,
+            )
+    except Exception:
+        if os.path.exists(tmp_gif):
+            os.remove(tmp_gif)
+        raise
+    os.replace(tmp_gif, out_gif)
 
 
 def esri_wayback_frames(
@@ -522,34 +525,27 @@ def create_external_timelapse(
             clean_up=False,
         )
 
-    if add_text:
-        timelapse_core.add_text_to_gif(
+    out_mp4 = out_gif.replace(".gif", ".mp4") if mp4 else None
+    if add_text or (title and title.strip()):
+        # The overlay pass also sets the frame timing and writes the MP4, so
+        # the GIF is not re-encoded again afterwards.
+        timelapse_core.add_overlays_to_gif(
             out_gif,
             out_gif,
-            [frame.label for frame in rendered_frames],
+            [frame.label for frame in rendered_frames] if add_text else None,
+            title,
             font_size=font_size,
             font_color=font_color,
-            add_progress_bar=add_progress_bar,
+            add_progress_bar=add_progress_bar and add_text,
             progress_bar_color=progress_bar_color,
             progress_bar_height=progress_bar_height,
             loop=loop,
+            out_mp4=out_mp4,
+            duration=int(1000 / max(frames_per_second, 1)),
         )
-
-    if title and title.strip():
-        timelapse_core.add_text_to_gif(
-            out_gif,
-            out_gif,
-            title,
-            xy=("2%", "93%"),
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=False,
-            loop=loop,
-        )
-
-    force_gif_frame_duration(out_gif, out_gif, frames_per_second, loop=loop)
-
-    if mp4:
-        timelapse_core.gif_to_mp4(out_gif, out_gif.replace(".gif", ".mp4"))
+    else:
+        force_gif_frame_duration(out_gif, out_gif, frames_per_second, loop=loop)
+        if out_mp4 is not None:
+            timelapse_core.gif_to_mp4(out_gif, out_mp4)
 
     return out_gif
@@ -6,13 +6,22 @@ from satellite and aerial imagery using Google Earth Engine.
 Based on the geemap timelapse module.
 """
 
+import collections
 import datetime
+import functools
 import glob
+import hashlib
 import json
 import os
 import re
+import sys
 import tempfile
-from typing import Optional, Union, List, Dict, Any
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Optional, Union, List, Dict, Any, Tuple
 
 try:
     import ee
@@ -20,20 +29,46 @@ except ImportError:
     ee = None
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from osgeo import gdal
+except ImportError:
+    gdal = None
+
+# Optional faster JSON decoder for large overlay files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from PIL import Image, ImageColor, ImageDraw, ImageFont
 except ImportError as e:
     print(f"Warning: Failed to import PIL (Pillow): {e}")
     print("Timelapse GIFs will be created without text overlays.")
     Image = None
+    ImageColor = None
     ImageDraw = None
     ImageFont = None
 except Exception as e:
     print(f"Error: Unexpected error importing PIL (Pillow): {e}")
     print("Timelapse GIFs will be created without text overlays.")
     Image = None
+    ImageColor = None
     ImageDraw = None
     ImageFont = None
 
+# Inside QGIS, have reload_dependencies() run once the venv is on sys.path
+try:
+    from .venv_manager import register_ee_consumer
+except ImportError:
+    register_ee_consumer = None
+if register_ee_consumer is not None:
+    register_ee_consumer(sys.modules[__name__])
+
 
 def check_dependencies() -> Dict[str, bool]:
     """Check if all required dependencies are installed.
@@ -52,13 +87,13 @@ def reload_dependencies() -> Dict[str, bool]:
 
     This should be called after ``ensure_venv_packages_available()`` has added
     the venv site-packages to ``sys.path``. It updates the module-level globals
-    (``ee``, ``Image``, ``ImageDraw``, ``ImageFont``) so that subsequent code
-    can use them.
+    (``ee``, ``np``, ``Image``, ``ImageColor``, ``ImageDraw``, ``ImageFont``) so
+    that subsequent code can use them.
 
     Returns:
         Dict with dependency names and their availability after reload.
     """
-    global ee, Image, ImageDraw, ImageFont
+    global ee, np, Image, ImageColor, ImageDraw, ImageFont
 
     if ee is None:
         try:
@@ -68,15 +103,25 @@ def reload_dependencies() -> Dict[str, bool]:
         except ImportError:
             pass
 
+    if np is None:
+        try:
+            import numpy as _np
+
+            np = _np
+        except ImportError:
+            pass
+
     if Image is None:
         try:
             from PIL import (
                 Image as _Image,
+                ImageColor as _ImageColor,
                 ImageDraw as _ImageDraw,
                 ImageFont as _ImageFont,
             )
 
             Image = _Image
+            ImageColor = _ImageColor
             ImageDraw = _ImageDraw
             ImageFont = _ImageFont
         except ImportError:
@@ -298,99 +343,243 @@ def geojson_to_ee_geometry(geojson: dict) -> "ee.Geometry":
     return ee.Geometry(geojson)
 
 
-def vector_to_geojson(
-    vector_path: str,
-    bbox: Dict[str, float] = None,
-) -> dict:
-    """Convert a local vector file to GeoJSON, optionally filtering by bbox.
+# GeoJSON "crs" names that mean plain longitude/latitude (RFC 7946 default)
+_WGS84_CRS_NAMES = frozenset(
+    {"urn:ogc:def:crs:OGC:1.3:CRS84", "urn:ogc:def:crs:OGC::CRS84", "CRS84"}
+)
+
+
+def _geojson_bounds(geometry: dict) -> Optional[tuple]:
+    """Return (xmin, ymin, xmax, ymax) of a GeoJSON geometry, or None if empty."""
+    if geometry["type"] == "GeometryCollection":
+        parts = [_geojson_bounds(g) for g in geometry.get("geometries", [])]
+        parts = [b for b in parts if b is not None]
+        if not parts:
+            return None
+        xmins, ymins, xmaxs, ymaxs = zip(*parts)
+        return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
+
+    # Flatten the nested coordinate arrays down to positions
+    positions = [geometry.get("coordinates") or []]
+    while positions and isinstance(positions[0], list) and positions[0]:
+        if not isinstance(positions[0][0], list):
+            break
+        positions = [p for part in positions for p in part]
+    positions = [p for p in positions if p]
+    if not positions:
+        return None
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _read_wgs84_geojson(vector_path: str, bbox: Dict[str, float] = None):
+    """Load a WGS84 GeoJSON FeatureCollection directly, without GDAL.
 
     Args:
-        vector_path: Path to vector file (Shapefile, GeoJSON, GeoPackage, KML, etc.).
+        vector_path: Path to a .geojson or .json file.
         bbox: Optional bounding box dict with xmin, ymin, xmax, ymax (WGS84).
 
     Returns:
-        GeoJSON dictionary.
+        GeoJSON dictionary, or None if the file is not a FeatureCollection in
+        longitude/latitude and needs the GDAL path instead.
     """
-    import json
+    try:
+        with open(vector_path, "rb") as f:
+            data = f.read()
+        geojson = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(geojson, dict) or geojson.get("type") != "FeatureCollection":
+        return None
+    crs = geojson.get("crs")
+    if crs is not None:
+        name = (
+            (crs.get("properties") or {}).get("name") if isinstance(crs, dict) else None
+        )
+        if name not in _WGS84_CRS_NAMES:
+            return None
+
+    features = [
+        feature
+        for feature in geojson.get("features", [])
+        if feature.get("geometry") is not None
+    ]
+    if bbox is not None:
+        xmin, ymin, xmax, ymax = bbox["xmin"], bbox["ymin"], bbox["xmax"], bbox["ymax"]
+        selected = []
+        for feature in features:
+            bounds = _geojson_bounds(feature["geometry"])
+            if (
+                bounds is not None
+                and bounds[0] <= xmax
+                and bounds[2] >= xmin
+                and bounds[1] <= ymax
+                and bounds[3] >= ymin
+            ):
+                selected.append(feature)
+        features = selected
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+# Recently converted overlays as GeoJSON bytes, keyed by the path, the bbox
+# and the (name, mtime, size) of the file and its sidecars (.shx, .dbf,
+# -wal, ...) so any edit triggers a new conversion. Only the converted
+# output is kept; the source dataset is closed right away so the file is
+# never held open (and locked on Windows) between calls.
+_VECTOR_GEOJSON_CACHE = collections.OrderedDict()
+_VECTOR_GEOJSON_CACHE_SIZE = 4
+_VECTOR_GEOJSON_LOCK = threading.Lock()
+
+
+def _vector_cache_key(vector_path: str, bbox: Optional[Dict[str, float]]):
+    """Build the conversion cache key for a vector file.
+
+    Args:
+        vector_path: Path to the vector file.
+        bbox: Optional bounding box dict with xmin, ymin, xmax, ymax.
 
+    Returns:
+        A hashable key, or None for paths that are not plain files (e.g.
+        ``/vsi`` paths), which are not cached.
+    """
+    path = os.path.abspath(vector_path)
+    folder, name = os.path.split(path)
+    stem = os.path.splitext(name)[0]
     try:
-        from osgeo import ogr, osr
-    except ImportError:
-        raise ImportError("GDAL/OGR is required for vector file support.")
+        with os.scandir(folder) as entries:
+            files = sorted(
+                (entry.name, st.st_mtime_ns, st.st_size)
+                for entry in entries
+                if entry.name == name or entry.name.startswith((stem + ".", name + "-"))
+                for st in (entry.stat(),)
+            )
+    except OSError:
+        return None
+    if not any(entry[0] == name for entry in files):
+        return None
+    bbox_key = (
+        None
+        if bbox is None
+        else (bbox["xmin"], bbox["ymin"], bbox["xmax"], bbox["ymax"])
+    )
+    return path, bbox_key, tuple(files)
+
+
+def _translate_vector_to_geojson(
+    vector_path: str, bbox: Optional[Dict[str, float]]
+) -> bytes:
+    """Convert a vector file to WGS84 GeoJSON bytes with GDAL.
+
+    The source dataset is closed before returning.
+
+    Args:
+        vector_path: Path to the vector file.
+        bbox: Optional bounding box dict with xmin, ymin, xmax, ymax (WGS84).
+
+    Returns:
+        The GeoJSON document as bytes.
 
-    # Open the vector file
-    ds = ogr.Open(vector_path)
+    Raises:
+        ValueError: If the file cannot be opened or converted.
+    """
+    ds = gdal.OpenEx(vector_path, gdal.OF_VECTOR)
     if ds is None:
         raise ValueError(f"Could not open vector file: {vector_path}")
+    try:
+        layer = ds.GetLayer()
+        if layer is None:
+            raise ValueError(f"Could not read layer from: {vector_path}")
+
+        options = {"format": "GeoJSON", "layers": [layer.GetName()]}
+        # Reproject to WGS84 only when the source CRS is known
+        if layer.GetSpatialRef() is not None:
+            options["dstSRS"] = "EPSG:4326"
+        # The bbox is in WGS84; GDAL transforms it to the source CRS and
+        # pushes it down to the driver's spatial index.
+        if bbox is not None:
+            options["spatFilter"] = [
+                bbox["xmin"],
+                bbox["ymin"],
+                bbox["xmax"],
+                bbox["ymax"],
+            ]
+            options["spatSRS"] = "EPSG:4326"
+        layer = None
+
+        mem_path = f"/vsimem/timelapse_overlay_{uuid.uuid4().hex}.geojson"
+        try:
+            out_ds = gdal.VectorTranslate(mem_path, ds, **options)
+            if out_ds is None:
+                raise ValueError(f"Could not convert vector file: {vector_path}")
+            out_ds = None  # Flush the GeoJSON file
 
-    layer = ds.GetLayer()
-    if layer is None:
-        raise ValueError(f"Could not read layer from: {vector_path}")
-
-    # Get source CRS and create transformation to WGS84
-    source_srs = layer.GetSpatialRef()
-    target_srs = osr.SpatialReference()
-    target_srs.ImportFromEPSG(4326)
+            f = gdal.VSIFOpenL(mem_path, "rb")
+            try:
+                gdal.VSIFSeekL(f, 0, 2)
+                size = gdal.VSIFTellL(f)
+                gdal.VSIFSeekL(f, 0, 0)
+                return gdal.VSIFReadL(1, size, f)
+            finally:
+                gdal.VSIFCloseL(f)
+        finally:
+            gdal.Unlink(mem_path)
+    finally:
+        ds = None  # Close the source file so it is not kept locked
 
-    transform = None
-    if source_srs is not None and not source_srs.IsSame(target_srs):
-        # Handle axis order for GDAL 3+
-        source_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-        target_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-        transform = osr.CoordinateTransformation(source_srs, target_srs)
 
-    # Set spatial filter if bbox provided
-    if bbox is not None:
-        # Create bbox geometry in WGS84
-        bbox_geom = ogr.Geometry(ogr.wkbPolygon)
-        ring = ogr.Geometry(ogr.wkbLinearRing)
-        ring.AddPoint(bbox["xmin"], bbox["ymin"])
-        ring.AddPoint(bbox["xmax"], bbox["ymin"])
-        ring.AddPoint(bbox["xmax"], bbox["ymax"])
-        ring.AddPoint(bbox["xmin"], bbox["ymax"])
-        ring.AddPoint(bbox["xmin"], bbox["ymin"])
-        bbox_geom.AddGeometry(ring)
-
-        # Transform bbox to source CRS if needed
-        if transform is not None:
-            inverse_transform = osr.CoordinateTransformation(target_srs, source_srs)
-            bbox_geom.Transform(inverse_transform)
-
-        layer.SetSpatialFilter(bbox_geom)
-
-    # Build GeoJSON FeatureCollection
-    features = []
-    for feature in layer:
-        geom = feature.GetGeometryRef()
-        if geom is None:
-            continue
+def vector_to_geojson(
+    vector_path: str,
+    bbox: Dict[str, float] = None,
+) -> dict:
+    """Convert a local vector file to GeoJSON, optionally filtering by bbox.
 
-        # Clone and transform geometry
-        geom = geom.Clone()
-        if transform is not None:
-            geom.Transform(transform)
+    The read, reprojection and bbox filtering all run inside GDAL through
+    ``gdal.VectorTranslate`` into an in-memory GeoJSON file, so no geometry
+    is touched from Python. GeoJSON files already in WGS84 are read directly
+    without GDAL.
 
-        # Get properties
-        properties = {}
-        for i in range(feature.GetFieldCount()):
-            field_name = feature.GetFieldDefnRef(i).GetName()
-            field_value = feature.GetField(i)
-            properties[field_name] = field_value
+    Args:
+        vector_path: Path to vector file (Shapefile, GeoJSON, GeoPackage, KML, etc.).
+        bbox: Optional bounding box dict with xmin, ymin, xmax, ymax (WGS84).
 
-        geojson_geom = json.loads(geom.ExportToJson())
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": geojson_geom,
-                "properties": properties,
-            }
-        )
+    Returns:
+        GeoJSON dictionary.
+    """
+    # Plain WGS84 GeoJSON needs no reprojection, so skip the GDAL round trip
+    if vector_path.lower().endswith((".geojson", ".json")):
+        geojson = _read_wgs84_geojson(vector_path, bbox)
+        if geojson is not None:
+            return geojson
 
-    ds = None  # Close dataset
+    if gdal is None:
+        raise ImportError("GDAL/OGR is required for vector file support.")
 
+    key = _vector_cache_key(vector_path, bbox)
+    with _VECTOR_GEOJSON_LOCK:
+        data = _VECTOR_GEOJSON_CACHE.get(key) if key is not None else None
+        if data is not None:
+            _VECTOR_GEOJSON_CACHE.move_to_end(key)
+    if data is None:
+        data = _translate_vector_to_geojson(vector_path, bbox)
+        if key is not None:
+            with _VECTOR_GEOJSON_LOCK:
+                _VECTOR_GEOJSON_CACHE[key] = data
+                while len(_VECTOR_GEOJSON_CACHE) > _VECTOR_GEOJSON_CACHE_SIZE:
+                    _VECTOR_GEOJSON_CACHE.popitem(last=False)
+
+    geojson = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    # Features without geometry cannot be drawn as an overlay
     return {
         "type": "FeatureCollection",
-        "features": features,
+        "features": [
+            feature
+            for feature in geojson.get("features", [])
+            if feature.get("geometry") is not None
+        ],
     }
 
 
@@ -408,10 +597,22 @@ def geojson_to_ee_featurecollection(
         ee.FeatureCollection object.
     """
     if geojson["type"] == "FeatureCollection":
-        for feature in geojson["features"]:
-            if feature["geometry"]["type"] != "Point":
-                feature["geometry"]["geodesic"] = geodesic
-        return ee.FeatureCollection(geojson)
+        # Earth Engine treats GeoJSON geometries as geodesic unless told
+        # otherwise, so the flag is always sent. Build new dicts only for the
+        # features whose flag differs instead of mutating the caller's data.
+        features = [
+            (
+                feature
+                if feature["geometry"]["type"] == "Point"
+                or feature["geometry"].get("geodesic") is geodesic
+                else {
+                    **feature,
+                    "geometry": {**feature["geometry"], "geodesic": geodesic},
+                }
+            )
+            for feature in geojson["features"]
+        ]
+        return ee.FeatureCollection({**geojson, "features": features})
     elif geojson["type"] == "Feature":
         geojson["geometry"]["geodesic"] = geodesic
         return ee.FeatureCollection([ee.Feature(geojson)])
@@ -450,6 +651,25 @@ def load_overlay_data(
         return ee.FeatureCollection(asset_id)
 
 
+# Common color names to hex
+_COLOR_MAP = {
+    "red": "#FF0000",
+    "green": "#00FF00",
+    "blue": "#0000FF",
+    "black": "#000000",
+    "white": "#FFFFFF",
+    "yellow": "#FFFF00",
+    "cyan": "#00FFFF",
+    "magenta": "#FF00FF",
+    "orange": "#FFA500",
+    "purple": "#800080",
+    "pink": "#FFC0CB",
+    "brown": "#A52A2A",
+    "gray": "#808080",
+    "grey": "#808080",
+}
+
+
 def check_color(color: str) -> str:
     """Check and normalize color to hex format.
 
@@ -459,27 +679,11 @@ def check_color(color: str) -> str:
     Returns:
         Hex color code with # prefix.
     """
-    if color.startswith("#"):
+    if not color or color[0] == "#":
         return color
-    # Common color names to hex
-    color_map = {
-        "red": "#FF0000",
-        "green": "#00FF00",
-        "blue": "#0000FF",
-        "black": "#000000",
-        "white": "#FFFFFF",
-        "yellow": "#FFFF00",
-        "cyan": "#00FFFF",
-        "magenta": "#FF00FF",
-        "orange": "#FFA500",
-        "purple": "#800080",
-        "pink": "#FFC0CB",
-        "brown": "#A52A2A",
-        "gray": "#808080",
-        "grey": "#808080",
-    }
-    if color.lower() in color_map:
-        return color_map[color.lower()]
+    hex_color = _COLOR_MAP.get(color.lower())
+    if hex_color is not None:
+        return hex_color
     # Assume it's a hex without #
     if len(color) == 6:
         return f"#{color}"
@@ -537,20 +741,21 @@ def add_overlay(
     # Remove # for palette
     palette_color = hex_color.lstrip("#")
 
-    # Create overlay image with proper projection (same as geemap)
+    # Create overlay image with proper projection (same as geemap). paint()
+    # and visualize() are per-pixel ops that keep this default projection.
     empty = ee.Image().byte().setDefaultProjection(target_proj)
     image = empty.paint(
         featureCollection=overlay_data,
         color=1,
         width=width,
     ).visualize(palette=[palette_color], opacity=opacity)
-    image = image.setDefaultProjection(target_proj)
 
     # Clip to region if provided
     if region_geom is not None:
         image = image.clip(region_geom)
 
-    # Blend overlay with each image in collection
+    # Blend overlay with each image in collection. blend() is a mosaic and
+    # drops the default projection, so the base image's is restored.
     blend_col = collection.map(
         lambda img: img.blend(image)
         .setDefaultProjection(img.projection())
@@ -559,6 +764,10 @@ def add_overlay(
     return blend_col
 
 
+# "MM-dd" within-year dates, accepting one-digit fields like strptime does
+_MMDD_RE = re.compile(r"(\d{1,2})-(\d{1,2})", re.ASCII)
+
+
 def date_sequence(
     start_year: int,
     end_year: int,
@@ -569,6 +778,9 @@ def date_sequence(
 ) -> list:
     """Generate a sequence of date ranges based on frequency.
 
+    Results are memoized, so repeated calls with the same arguments only pay
+    for copying the cached list.
+
     Args:
         start_year: Starting year.
         end_year: Ending year.
@@ -581,22 +793,41 @@ def date_sequence(
     Returns:
         List of tuples (start_date, end_date, label) for each time period.
     """
-    from datetime import date, timedelta
+    return list(
+        _date_sequence_cached(
+            start_year, end_year, start_date, end_date, frequency, step
+        )
+    )
+
 
-    # Validate and parse start_date and end_date in "MM-dd" format
+@functools.lru_cache(maxsize=256)
+def _date_sequence_cached(
+    start_year: int,
+    end_year: int,
+    start_date: str,
+    end_date: str,
+    frequency: str,
+    step: int,
+) -> tuple:
+    """Compute the date ranges for :func:`date_sequence` as a tuple."""
+    # Validate and parse start_date and end_date in "MM-dd" format. Building
+    # a date in non-leap 1900 rejects impossible days such as 02-30 and,
+    # like strptime("%m-%d"), 02-29.
     try:
-        start_dt = datetime.datetime.strptime(start_date, "%m-%d")
-        end_dt = datetime.datetime.strptime(end_date, "%m-%d")
+        start_match = _MMDD_RE.fullmatch(start_date)
+        end_match = _MMDD_RE.fullmatch(end_date)
+        if start_match is None or end_match is None:
+            raise ValueError("not in MM-dd format")
+        start_month, start_day = map(int, start_match.groups())
+        end_month, end_day = map(int, end_match.groups())
+        date(1900, start_month, start_day)
+        date(1900, end_month, end_day)
     except (ValueError, TypeError) as exc:
         raise ValueError(
             "start_date and end_date must be strings in 'MM-dd' format, "
             f"got start_date={start_date!r}, end_date={end_date!r}"
         ) from exc
 
-    start_month = start_dt.month
-    start_day = start_dt.day
-    end_month = end_dt.month
-    end_day = end_dt.day
     dates = []
 
     if frequency == "year":
@@ -748,12 +979,43 @@ def date_sequence(
     elif frequency == "day":
         current = date(start_year, start_month, start_day)
         end = date(end_year, end_month, end_day)
-        while current <= end:
-            label = current.strftime("%Y-%m-%d")
-            dates.append((current, current, label))
-            current += timedelta(days=step)
+        if np is not None:
+            # Generate the days and their labels in numpy's C loops
+            days = np.arange(
+                np.datetime64(current),
+                np.datetime64(end) + np.timedelta64(1, "D"),
+                np.timedelta64(step, "D"),
+            )
+            labels = np.datetime_as_string(days, unit="D").tolist()
+            dates.extend((day, day, label) for day, label in zip(days.tolist(), labels))
+        else:
+            while current <= end:
+                label = current.strftime("%Y-%m-%d")
+                dates.append((current, current, label))
+                current += timedelta(days=step)
+
+    return tuple(dates)
+
+
+def _parse_ymd(value: str) -> date:
+    """Parse a 'YYYY-MM-dd' string with a split instead of strptime.
+
+    Args:
+        value: Date string; one-digit month and day fields are accepted.
+
+    Returns:
+        The parsed date.
+
+    Raises:
+        ValueError: If the string is not a valid 'YYYY-MM-dd' date.
+    """
+    year, month, day = value.split("-")
+    return date(int(year), int(month), int(day))
+
 
-    return dates
+# ee.Reducer factories supported by create_timeseries (looked up by name at
+# call time because ee may be missing at import)
+_REDUCER_NAMES = frozenset({"median", "mean", "min", "max", "sum"})
 
 
 def create_timeseries(
@@ -794,15 +1056,10 @@ def create_timeseries(
     if bands is not None:
         collection = collection.select(bands)
 
-    # Get reducer function
-    reducers = {
-        "median": ee.Reducer.median(),
-        "mean": ee.Reducer.mean(),
-        "min": ee.Reducer.min(),
-        "max": ee.Reducer.max(),
-        "sum": ee.Reducer.sum(),
-    }
-    selected_reducer = reducers.get(reducer, ee.Reducer.median())
+    # Get reducer function, constructing only the selected one
+    selected_reducer = getattr(
+        ee.Reducer, reducer if reducer in _REDUCER_NAMES else "median"
+    )()
 
     # Set date format based on frequency
     if date_format is None:
@@ -839,26 +1096,24 @@ def create_timeseries(
         # Build calendar dekads (1-10, 11-20, 21-end of month) rather than
         # fixed 10-day windows from start_date, so the generated timestamps
         # stay aligned to month boundaries (matching date_sequence()).
-        from datetime import date as _date
-
-        start_dt = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-        end_dt = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        start_dt = _parse_ymd(start_date)
+        end_dt = _parse_ymd(end_date)
 
         dekad_ranges = []
         selected_count = 0
         for year in range(start_dt.year, end_dt.year + 1):
             for month in range(1, 13):
                 for dekad_start_day in (1, 11, 21):
-                    dekad_start = _date(year, month, dekad_start_day)
+                    dekad_start = date(year, month, dekad_start_day)
                     # Exclusive upper bound: the start of the next dekad.
                     if dekad_start_day == 1:
-                        dekad_stop = _date(year, month, 11)
+                        dekad_stop = date(year, month, 11)
                     elif dekad_start_day == 11:
-                        dekad_stop = _date(year, month, 21)
+                        dekad_stop = date(year, month, 21)
                     elif month == 12:
-                        dekad_stop = _date(year + 1, 1, 1)
+                        dekad_stop = date(year + 1, 1, 1)
                     else:
-                        dekad_stop = _date(year, month + 1, 1)
+                        dekad_stop = date(year, month + 1, 1)
 
                     # Keep dekads overlapping the requested [start, end] range.
                     if dekad_stop > start_dt and dekad_start <= end_dt:
@@ -940,20 +1195,19 @@ def naip_timeseries(
     # Check if NIR band is requested
     use_nir = "N" in bands
 
+    # Year-independent filters are applied once, outside the mapped function
+    naip_col = ee.ImageCollection("USDA/NAIP/DOQQ")
+    if roi is not None:
+        naip_col = naip_col.filterBounds(roi)
+    # Filter for 4-band imagery if NIR is requested
+    if use_nir:
+        naip_col = naip_col.filter(ee.Filter.listContains("system:band_names", "N"))
+
     def get_annual_naip(year):
         year = ee.Number(year)
-        collection = ee.ImageCollection("USDA/NAIP/DOQQ")
-
-        if roi is not None:
-            collection = collection.filterBounds(roi)
-
         start_date = ee.Date.fromYMD(year, 1, 1)
         end_date = ee.Date.fromYMD(year, 12, 31)
-        naip = collection.filterDate(start_date, end_date)
-
-        # Filter for 4-band imagery if NIR is requested
-        if use_nir:
-            naip = naip.filter(ee.Filter.listContains("system:band_names", "N"))
+        naip = naip_col.filterDate(start_date, end_date)
 
         if roi is not None:
             image = naip.mosaic().clip(roi)
@@ -975,6 +1229,10 @@ def naip_timeseries(
     return collection.filterMetadata("empty", "equals", 0)
 
 
+# Sentinel-2 QA60 opaque cloud (bit 10) and cirrus (bit 11) flags
+_S2_QA_MASK = (1 << 10) | (1 << 11)
+
+
 def sentinel2_timeseries(
     roi: "ee.Geometry",
     start_year: int = 2015,
@@ -1032,30 +1290,35 @@ def sentinel2_timeseries(
 
     def mask_clouds(image):
         """Apply cloud mask to Sentinel-2 image."""
-        qa = image.select("QA60")
-        cloud_bit_mask = 1 << 10
-        cirrus_bit_mask = 1 << 11
-        mask = (
-            qa.bitwiseAnd(cloud_bit_mask)
-            .eq(0)
-            .And(qa.bitwiseAnd(cirrus_bit_mask).eq(0))
-        )
+        mask = image.select("QA60").bitwiseAnd(_S2_QA_MASK).eq(0)
         return image.updateMask(mask).divide(10000)
 
     # Generate date sequence based on frequency
     dates = date_sequence(start_year, end_year, start_date, end_date, frequency, step)
 
-    def get_s2_composite(date_info):
-        start_dt, end_dt, label = date_info
-        start = ee.Date(start_dt.isoformat())
-        end = ee.Date(end_dt.isoformat()).advance(1, "day")
+    # Build all composites server-side by mapping over one ee.List of date
+    # ranges instead of growing a client-side graph branch per period.
+    date_ranges = ee.List(
+        [
+            [start_dt.isoformat(), end_dt.isoformat(), label]
+            for start_dt, end_dt, label in dates
+        ]
+    )
 
-        collection = (
-            ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
-            .filterBounds(roi)
-            .filterDate(start, end)
-            .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", cloud_pct))
-        )
+    # Period-independent filters are applied once, outside the mapped function
+    s2_col = (
+        ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
+        .filterBounds(roi)
+        .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", cloud_pct))
+    )
+
+    def get_s2_composite(date_range):
+        date_range = ee.List(date_range)
+        start = ee.Date(date_range.get(0))
+        end = ee.Date(date_range.get(1)).advance(1, "day")
+        label = date_range.get(2)
+
+        collection = s2_col.filterDate(start, end)
 
         if apply_fmask:
             collection = collection.map(mask_clouds)
@@ -1079,8 +1342,7 @@ def sentinel2_timeseries(
             }
         )
 
-    images = [get_s2_composite(d) for d in dates]
-    result = ee.ImageCollection(images)
+    result = ee.ImageCollection(date_ranges.map(get_s2_composite))
 
     return result.filterMetadata("empty", "equals", 0)
 
@@ -1129,20 +1391,35 @@ def sentinel1_timeseries(
     # Generate date sequence based on frequency
     dates = date_sequence(start_year, end_year, start_date, end_date, frequency, step)
 
-    def get_s1_composite(date_info):
-        start_dt, end_dt, label = date_info
-        start = ee.Date(start_dt.isoformat())
-        end = ee.Date(end_dt.isoformat()).advance(1, "day")
-
-        collection = (
-            ee.ImageCollection("COPERNICUS/S1_GRD")
-            .filterBounds(roi)
-            .filterDate(start, end)
-            .filter(ee.Filter.inList("orbitProperties_pass", orbit))
-            .filter(ee.Filter.listContains("transmitterReceiverPolarisation", bands[0]))
-            .filter(ee.Filter.eq("instrumentMode", "IW"))
-            .select(bands)
+    # Build all composites server-side by mapping over one ee.List of date
+    # ranges instead of growing a client-side graph branch per period.
+    date_ranges = ee.List(
+        [
+            [start_dt.isoformat(), end_dt.isoformat(), label]
+            for start_dt, end_dt, label in dates
+        ]
+    )
+
+    # Period-independent filters are applied once, outside the mapped function
+    s1_col = (
+        ee.ImageCollection("COPERNICUS/S1_GRD")
+        .filterBounds(roi)
+        .filter(
+            ee.Filter.And(
+                ee.Filter.inList("orbitProperties_pass", orbit),
+                ee.Filter.listContains("transmitterReceiverPolarisation", bands[0]),
+                ee.Filter.eq("instrumentMode", "IW"),
+            )
         )
+    )
+
+    def get_s1_composite(date_range):
+        date_range = ee.List(date_range)
+        start = ee.Date(date_range.get(0))
+        end = ee.Date(date_range.get(1)).advance(1, "day")
+        label = date_range.get(2)
+
+        collection = s1_col.filterDate(start, end).select(bands)
 
         composite = collection.median()
 
@@ -1157,8 +1434,7 @@ def sentinel1_timeseries(
             }
         )
 
-    images = [get_s1_composite(d) for d in dates]
-    result = ee.ImageCollection(images)
+    result = ee.ImageCollection(date_ranges.map(get_s1_composite))
 
     return result.filterMetadata("empty", "equals", 0)
 
@@ -1195,15 +1471,19 @@ def landsat_timeseries(
     if end_year is None:
         end_year = datetime.datetime.now().year
 
-    # Landsat collections
-    LC09col = ee.ImageCollection("LANDSAT/LC09/C02/T1_L2")
-    LC08col = ee.ImageCollection("LANDSAT/LC08/C02/T1_L2")
-    LE07col = ee.ImageCollection("LANDSAT/LE07/C02/T1_L2")
-    LT05col = ee.ImageCollection("LANDSAT/LT05/C02/T1_L2")
-    LT04col = ee.ImageCollection("LANDSAT/LT04/C02/T1_L2")
-
-    def col_filter(col, roi, start_dt, end_dt):
-        return col.filterBounds(roi).filterDate(start_dt, end_dt)
+    # Landsat collections, merged per sensor family and filtered to the ROI
+    # once so each period only adds a date filter per family.
+    oli_col = (
+        ee.ImageCollection("LANDSAT/LC09/C02/T1_L2")
+        .merge(ee.ImageCollection("LANDSAT/LC08/C02/T1_L2"))
+        .filterBounds(roi)
+    )
+    etm_col = (
+        ee.ImageCollection("LANDSAT/LE07/C02/T1_L2")
+        .merge(ee.ImageCollection("LANDSAT/LT05/C02/T1_L2"))
+        .merge(ee.ImageCollection("LANDSAT/LT04/C02/T1_L2"))
+        .filterBounds(roi)
+    )
 
     def rename_oli(img):
         """Rename OLI bands (Landsat 8, 9)."""
@@ -1259,20 +1539,27 @@ def landsat_timeseries(
     # Generate date sequence based on frequency
     dates = date_sequence(start_year, end_year, start_date, end_date, frequency, step)
 
-    def get_composite(date_info):
-        start_dt, end_dt, label = date_info
-        start = ee.Date(start_dt.isoformat())
-        end = ee.Date(end_dt.isoformat()).advance(1, "day")
-
-        # Filter and prepare each collection
-        lc09 = col_filter(LC09col, roi, start, end).map(prep_oli)
-        lc08 = col_filter(LC08col, roi, start, end).map(prep_oli)
-        le07 = col_filter(LE07col, roi, start, end).map(prep_etm)
-        lt05 = col_filter(LT05col, roi, start, end).map(prep_etm)
-        lt04 = col_filter(LT04col, roi, start, end).map(prep_etm)
+    # Build all composites server-side by mapping over one ee.List of date
+    # ranges instead of growing a client-side graph branch per period.
+    date_ranges = ee.List(
+        [
+            [start_dt.isoformat(), end_dt.isoformat(), label]
+            for start_dt, end_dt, label in dates
+        ]
+    )
 
-        # Merge collections
-        col = lc09.merge(lc08).merge(le07).merge(lt05).merge(lt04)
+    def get_composite(date_range):
+        date_range = ee.List(date_range)
+        start = ee.Date(date_range.get(0))
+        end = ee.Date(date_range.get(1)).advance(1, "day")
+        label = date_range.get(2)
+
+        # Filter and prepare each sensor family, then merge
+        col = (
+            oli_col.filterDate(start, end)
+            .map(prep_oli)
+            .merge(etm_col.filterDate(start, end).map(prep_etm))
+        )
 
         composite = col.median()
         n_bands = composite.bandNames().size()
@@ -1290,28 +1577,42 @@ def landsat_timeseries(
             }
         )
 
-    images = [get_composite(d) for d in dates]
-    result = ee.ImageCollection(images)
+    result = ee.ImageCollection(date_ranges.map(get_composite))
 
     return result.filterMetadata("empty", "equals", 0)
 
 
+# HTTP statuses worth retrying: rate limiting and transient server errors.
+_RETRY_HTTP_CODES = frozenset({429, 500, 502, 503, 504})
+
+
 def download_ee_video(
     collection: "ee.ImageCollection",
     video_args: dict,
     out_gif: str,
+    timeout: float = 300,
+    max_retries: int = 3,
+    backoff: float = 2.0,
 ) -> str:
     """Download Earth Engine video/animation.
 
+    Rate-limited (HTTP 429), transient server errors and network errors are
+    retried with exponential backoff.
+
     Args:
         collection: Image collection to animate.
         video_args: Video parameters dict.
         out_gif: Output GIF path.
+        timeout: Socket timeout in seconds for the download.
+        max_retries: Number of retries after the first failed download.
+        backoff: Delay in seconds before the first retry, doubled on each
+            following retry.
 
     Returns:
         Path to output GIF.
     """
     import shutil
+    import socket
     import urllib.request
     import urllib.error
 
@@ -1325,206 +1626,954 @@ def download_ee_video(
     if not url.startswith("https://"):
         raise RuntimeError(f"Refusing to download non-https video URL: {url}")
 
-    # Download the GIF
-    try:
-        with urllib.request.urlopen(
-            url, timeout=120
-        ) as response:  # nosec B310 (https enforced above)
-            with open(out_gif, "wb") as out_file:
-                shutil.copyfileobj(response, out_file)
-    except urllib.error.HTTPError as e:
-        # Read the error response body for more details
-        error_body = ""
-        if hasattr(e, "read"):
-            try:
-                error_body = e.read().decode("utf-8", errors="ignore")
-            except (
-                Exception
-            ):  # nosec B110 (best-effort body extraction; we re-raise RuntimeError below)
-                pass
-        raise RuntimeError(
-            f"Failed to download video: HTTP {e.code} {e.reason}. "
-            f"Details: {error_body[:500] if error_body else 'No details'}"
-        ) from e
+    # Download the GIF, streaming it to disk in 1 MiB chunks
+    for attempt in range(max_retries + 1):
+        retry = attempt < max_retries
+        delay = backoff * 2**attempt
+        try:
+            with urllib.request.urlopen(
+                url, timeout=timeout
+            ) as response:  # nosec B310 (https enforced above)
+                with open(out_gif, "wb") as out_file:
+                    shutil.copyfileobj(response, out_file, length=1 << 20)
+            break
+        except urllib.error.HTTPError as e:
+            if retry and e.code in _RETRY_HTTP_CODES:
+                print(
+                    f"Warning: Video download failed with HTTP {e.code}, "
+                    f"retrying in {delay:g} s"
+                )
+                time.sleep(delay)
+                continue
+            # Read the error response body for more details
+            error_body = ""
+            if hasattr(e, "read"):
+                try:
+                    error_body = e.read().decode("utf-8", errors="ignore")
+                except (
+                    Exception
+                ):  # nosec B110 (best-effort body extraction; we re-raise RuntimeError below)
+                    pass
+            raise RuntimeError(
+                f"Failed to download video: HTTP {e.code} {e.reason}. "
+                f"Details: {error_body[:500] if error_body else 'No details'}"
+            ) from e
+        except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+            # A connection dropped mid-transfer leaves a truncated file
+            if not retry:
+                if os.path.exists(out_gif):
+                    os.remove(out_gif)
+                raise
+            print(f"Warning: Video download failed ({e}), retrying in {delay:g} s")
+            time.sleep(delay)
 
     return out_gif
 
 
-def make_gif(
-    images: Union[List[str], str],
-    out_gif: str,
-    ext: str = "jpg",
-    fps: int = 10,
-    loop: int = 0,
-    clean_up: bool = False,
-) -> None:
-    """Create a GIF from a list of images.
+# ffmpeg filter graph that builds a single palette from every frame and maps
+# the frames onto it (better colors and smaller files than per-frame PIL
+# quantization).
+_GIF_PALETTE_FILTER = "split[a][b];[a]palettegen[p];[b][p]paletteuse=dither=sierra2_4a"
 
-    Args:
-        images: List of image paths or directory.
-        out_gif: Output GIF path.
-        ext: Image extension.
-        fps: Frames per second.
-        loop: Number of loops (0 = infinite).
-        clean_up: Whether to delete source images.
-    """
-    # Check if PIL is available
-    if Image is None:
-        raise RuntimeError(
-            "PIL (Pillow) is not available. Cannot create GIF from images."
-        )
 
-    if isinstance(images, str) and os.path.isdir(images):
-        images = list(glob.glob(os.path.join(images, f"*.{ext}")))
+# H.264 encoder settings. The software encoder is always available; the
+# hardware encoders are only tried when ffmpeg lists them, in this order.
+_X264_ARGS = ["-vcodec", "libx264", "-preset", "veryfast", "-crf", "25"]
+_HW_H264_ARGS = {
+    "h264_nvenc": [
+        "-vcodec",
+        "h264_nvenc",
+        "-preset",
+        "p4",
+        "-tune",
+        "hq",
+        "-rc",
+        "vbr",
+        "-cq",
+        "25",
+    ],
+    "h264_videotoolbox": ["-vcodec", "h264_videotoolbox", "-b:v", "0", "-q:v", "50"],
+}
 
-    if not images:
-        raise ValueError("No images found.")
 
-    images.sort()
+@functools.lru_cache(maxsize=1)
+def _detect_h264_encoder() -> Optional[str]:
+    """Find a hardware H.264 encoder supported by the local ffmpeg build.
 
-    frames = [Image.open(img) for img in images]
-    frame_one = frames[0]
-    frame_one.save(
-        out_gif,
-        format="GIF",
-        append_images=frames[1:],
-        save_all=True,
-        duration=int(1000 / fps),
-        loop=loop,
-    )
+    Returns:
+        The encoder name, or None if only the software encoder is available.
+    """
+    import subprocess  # nosec B404 (ffmpeg invoked with validated list-form args)
+    import shutil
 
-    if clean_up:
-        for image in images:
-            os.remove(image)
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        return None
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )  # nosec B603 (cmd is built from validated ffmpeg path + fixed flags)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    listed = {
+        line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1
+    }
+    return next((name for name in _HW_H264_ARGS if name in listed), None)
 
 
-def add_text_to_gif(
-    in_gif: str,
-    out_gif: str,
-    text_sequence: Union[str, List[str]],
-    xy: tuple = ("2%", "2%"),
-    font_size: int = 20,
-    font_color: str = "white",
-    add_progress_bar: bool = True,
-    progress_bar_color: str = "white",
-    progress_bar_height: int = 5,
-    loop: int = 0,
-) -> None:
-    """Add text overlay to each frame of a GIF.
+def _ffmpeg_make_gif(images: List[str], out_gif: str, fps: int, loop: int) -> bool:
+    """Encode image files into a GIF with ffmpeg.
 
     Args:
-        in_gif: Input GIF path.
+        images: Sorted list of image paths.
         out_gif: Output GIF path.
-        text_sequence: Text for each frame.
-        xy: Position of text.
-        font_size: Font size.
-        font_color: Font color.
-        add_progress_bar: Whether to add progress bar.
-        progress_bar_color: Progress bar color.
-        progress_bar_height: Progress bar height.
-        loop: Loop count.
-    """
-    # Check if PIL is available
-    if Image is None:
-        print("Warning: PIL (Pillow) is not available. Skipping text overlay.")
-        return
+        fps: Frames per second.
+        loop: Number of loops (0 = infinite).
 
-    gif = Image.open(in_gif)
+    Returns:
+        True if ffmpeg wrote the GIF, False if ffmpeg is unavailable or failed.
+    """
+    import subprocess  # nosec B404 (ffmpeg invoked with validated list-form args)
+    import shutil
 
-    frames = []
-    n_frames = gif.n_frames
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        return False
 
-    if isinstance(text_sequence, str):
-        text_sequence = [text_sequence] * n_frames
-    elif len(text_sequence) < n_frames:
-        text_sequence = text_sequence + [text_sequence[-1]] * (
-            n_frames - len(text_sequence)
-        )
+    # The concat demuxer takes an explicit, ordered file list, which works
+    # for arbitrary file names and on Windows (unlike -pattern_type glob).
+    entries = []
+    for image in images:
+        escaped = os.path.abspath(image).replace("'", "'\\''")
+        entries.append(f"file '{escaped}'\n")
 
-    # Try to load a font
+    fd, list_path = tempfile.mkstemp(suffix=".txt", prefix="timelapse_frames_")
     try:
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except (OSError, IOError):
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size
-            )
-        except (OSError, IOError):
-            font = ImageFont.load_default()
-
-    for i in range(n_frames):
-        gif.seek(i)
-        frame = gif.copy().convert("RGBA")
-        draw = ImageDraw.Draw(frame)
-
-        # Calculate position
-        width, height = frame.size
-        if isinstance(xy[0], str) and "%" in xy[0]:
-            x = int(width * float(xy[0].strip("%")) / 100)
-        else:
-            x = int(xy[0])
-
-        if isinstance(xy[1], str) and "%" in xy[1]:
-            y = int(height * float(xy[1].strip("%")) / 100)
-        else:
-            y = int(xy[1])
-
-        # Draw text
-        text = text_sequence[i] if i < len(text_sequence) else ""
-        draw.text((x, y), text, font=font, fill=font_color)
-
-        # Add progress bar
-        if add_progress_bar:
-            progress = (i + 1) / n_frames
-            bar_width = int(width * progress)
-            bar_y = height - progress_bar_height
-            draw.rectangle([(0, bar_y), (bar_width, height)], fill=progress_bar_color)
-
-        frames.append(frame.convert("P", palette=Image.ADAPTIVE))
-
-    # Get original duration
-    duration = gif.info.get("duration", 100)
-
-    # Save new GIF
-    frames[0].save(
-        out_gif,
-        format="GIF",
-        append_images=frames[1:],
-        save_all=True,
-        duration=duration,
-        loop=loop,
-    )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("ffconcat version 1.0\n")
+            f.writelines(entries)
+        cmd = [
+            ffmpeg,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            list_path,
+            "-filter_complex",
+            # Retime the frames to one per 1/fps seconds
+            f"setpts=N/({fps}*TB),{_GIF_PALETTE_FILTER}",
+            "-r",
+            str(fps),
+            "-loop",
+            str(loop),
+            out_gif,
+        ]
+        subprocess.run(
+            cmd, check=True
+        )  # nosec B603 (cmd is built from validated ffmpeg path + fixed flags)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    finally:
+        os.remove(list_path)
+    return os.path.exists(out_gif)
 
 
-def gif_to_mp4(in_gif: str, out_mp4: str) -> bool:
-    """Convert GIF to MP4 using ffmpeg.
+def _ffmpeg_write_gif(
+    frames,
+    out_gif: str,
+    size: tuple,
+    duration: int,
+    loop: int,
+    out_mp4: str = None,
+) -> bool:
+    """Stream RGB frames into ffmpeg and encode them as a GIF.
+
+    Frames are written to ffmpeg's stdin one at a time, so the caller never
+    needs to hold the whole animation in memory. When ``out_mp4`` is given,
+    the same pass also encodes an H.264 MP4 from the frames, instead of
+    decoding the finished GIF again.
 
     Args:
-        in_gif: Input GIF path.
-        out_mp4: Output MP4 path.
+        frames: Iterable of raw RGB24 frames of ``size`` (``bytes`` or any
+            contiguous buffer, such as a uint8 numpy array).
+        out_gif: Output GIF path. Removed again if encoding fails.
+        size: Frame (width, height).
+        duration: Frame duration in milliseconds.
+        loop: Number of loops (0 = infinite).
+        out_mp4: Optional output MP4 path.
 
     Returns:
-        True if successful, False otherwise.
+        True if ffmpeg wrote the output(s), False if ffmpeg is unavailable
+        or failed.
     """
     import subprocess  # nosec B404 (ffmpeg invoked with validated list-form args)
     import shutil
 
-    # Check if PIL is available
-    if Image is None:
-        print(
-            "Warning: PIL (Pillow) is not available. Cannot determine GIF dimensions for MP4 conversion."
-        )
-        return False
-
-    if not shutil.which("ffmpeg"):
-        return False
-
-    if not os.path.exists(in_gif):
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
         return False
 
-    out_mp4 = os.path.abspath(out_mp4)
-    os.makedirs(os.path.dirname(out_mp4), exist_ok=True)
-
+    width, height = size
+    cmd = [
+        ffmpeg,
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "-framerate",
+        f"1000/{max(int(duration), 1)}",
+        "-i",
+        "-",
+    ]
+    outputs = [out_gif]
+    if out_mp4 is None:
+        cmd += ["-filter_complex", _GIF_PALETTE_FILTER, "-loop", str(loop), out_gif]
+    else:
+        out_mp4 = os.path.abspath(out_mp4)
+        os.makedirs(os.path.dirname(out_mp4), exist_ok=True)
+        _forget_mp4_source(out_mp4)
+        outputs.append(out_mp4)
+        # Ensure even dimensions for h264 (same settings as gif_to_mp4)
+        filter_graph = (
+            f"[0:v]split[g][m];[g]{_GIF_PALETTE_FILTER}[gif];"
+            f"[m]scale={width + width % 2}:{height + height % 2}[mp4]"
+        )
+        cmd += [
+            "-filter_complex",
+            filter_graph,
+            "-map",
+            "[gif]",
+            "-loop",
+            str(loop),
+            out_gif,
+            "-map",
+            "[mp4]",
+            *_X264_ARGS,
+            "-pix_fmt",
+            "yuv420p",
+            "-movflags",
+            "+faststart",
+            out_mp4,
+        ]
+
+    def remove_outputs():
+        for path in outputs:
+            if os.path.exists(path):
+                os.remove(path)
+
+    try:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE
+        )  # nosec B603 (cmd is built from validated ffmpeg path + fixed flags)
+    except OSError:
+        return False
+
+    try:
+        with proc.stdin:
+            for frame in frames:
+                proc.stdin.write(frame)
+    except BrokenPipeError:
+        pass  # ffmpeg exited early; reported through its return code
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        remove_outputs()
+        raise
+    ok = proc.wait() == 0
+
+    if not ok:
+        remove_outputs()
+    return ok and all(os.path.exists(path) for path in outputs)
+
+
+def _prune_cache_dir(cache_dir: str, pattern: str, max_files: int) -> None:
+    """Delete all but the ``max_files`` most recently used cache files.
+
+    Args:
+        cache_dir: The cache directory.
+        pattern: Glob pattern of the cache files, such as ``"*.gif"``.
+        max_files: Number of files to keep.
+    """
+    try:
+        cached = sorted(
+            glob.glob(os.path.join(cache_dir, pattern)), key=os.path.getmtime
+        )
+        for old in cached[:-max_files]:
+            os.remove(old)
+    except OSError:
+        pass
+
+
+# On-disk cache of getInfo() results for queries whose answer cannot change
+# (such as the frame times of a past date range), keyed by the request graph.
+# Only the most recently used files and in-memory results are kept.
+_EE_INFO_CACHE_DIR = os.path.join(
+    os.path.expanduser("~/.qgis_timelapse"), "cache", "ee_info"
+)
+_EE_INFO_CACHE_MAX_FILES = 256
+_EE_INFO_MEMO = collections.OrderedDict()
+_EE_INFO_MEMO_SIZE = 64
+_EE_INFO_LOCK = threading.Lock()
+
+
+def _cached_get_info(obj: "ee.ComputedObject"):
+    """Return ``obj.getInfo()``, reusing a result stored for the same query.
+
+    Results are kept in memory and as JSON files under
+    ``_EE_INFO_CACHE_DIR``. Only use this for queries over data that no
+    longer changes.
+
+    Args:
+        obj: EE object to evaluate.
+
+    Returns:
+        The JSON-compatible value of ``obj``.
+    """
+    key = hashlib.blake2b(obj.serialize().encode("utf-8"), digest_size=16).hexdigest()
+    with _EE_INFO_LOCK:
+        if key in _EE_INFO_MEMO:
+            _EE_INFO_MEMO.move_to_end(key)
+            return _EE_INFO_MEMO[key]
+
+    path = os.path.join(_EE_INFO_CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            value = json.load(f)
+        # Refresh the modification time so pruning keeps recently used files
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    except (OSError, ValueError):
+        value = obj.getInfo()
+        # Best effort: write to a temporary file and move it into place so a
+        # concurrent reader never sees a partial file.
+        try:
+            os.makedirs(_EE_INFO_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+        _prune_cache_dir(_EE_INFO_CACHE_DIR, "*.json", _EE_INFO_CACHE_MAX_FILES)
+
+    with _EE_INFO_LOCK:
+        _EE_INFO_MEMO[key] = value
+        while len(_EE_INFO_MEMO) > _EE_INFO_MEMO_SIZE:
+            _EE_INFO_MEMO.popitem(last=False)
+    return value
+
+
+# On-disk cache of downloaded videos for past date ranges, keyed by the
+# collection graph and video parameters. Only the most recent files are kept.
+_EE_VIDEO_CACHE_DIR = os.path.join(
+    os.path.expanduser("~/.qgis_timelapse"), "cache", "ee_video"
+)
+_EE_VIDEO_CACHE_MAX_FILES = 32
+
+
+def _cached_download_ee_video(
+    collection: "ee.ImageCollection", video_args: dict, out_gif: str
+) -> str:
+    """Download an Earth Engine video, reusing a copy of an earlier download.
+
+    Labels, titles and MP4 output are added after the download, so changing
+    them reuses the stored GIF. Only use this for data that no longer
+    changes.
+
+    Args:
+        collection: Image collection to animate.
+        video_args: Video parameters dict.
+        out_gif: Output GIF path.
+
+    Returns:
+        Path to output GIF.
+    """
+    import shutil
+
+    args = {
+        name: value.serialize() if hasattr(value, "serialize") else value
+        for name, value in video_args.items()
+    }
+    request = json.dumps([collection.serialize(), args], sort_keys=True, default=str)
+    key = hashlib.blake2b(request.encode("utf-8"), digest_size=16).hexdigest()
+    path = os.path.join(_EE_VIDEO_CACHE_DIR, f"{key}.gif")
+
+    if os.path.isfile(path):
+        shutil.copyfile(path, out_gif)
+        # Refresh the modification time so pruning keeps recently used files
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return out_gif
+
+    download_ee_video(collection, video_args, out_gif)
+    try:
+        os.makedirs(_EE_VIDEO_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        shutil.copyfile(out_gif, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    _prune_cache_dir(_EE_VIDEO_CACHE_DIR, "*.gif", _EE_VIDEO_CACHE_MAX_FILES)
+    return out_gif
+
+
+def _download_ee_video_and_fetch(
+    collection: "ee.ImageCollection",
+    video_args: dict,
+    out_gif: str,
+    info: "ee.ComputedObject" = None,
+    cache_info: bool = False,
+    cache_video: bool = False,
+):
+    """Download an Earth Engine video while fetching another value.
+
+    The video download and ``info.getInfo()`` (typically the frame labels)
+    are independent server round trips, so they run concurrently instead of
+    one after the other.
+
+    Args:
+        collection: Image collection to animate.
+        video_args: Video parameters dict.
+        out_gif: Output GIF path.
+        info: Optional EE object to fetch alongside the download.
+        cache_info: Whether ``info`` may be answered from, and stored in,
+            the getInfo cache (see ``_cached_get_info``).
+        cache_video: Whether the video may be answered from, and stored in,
+            the video cache (see ``_cached_download_ee_video``).
+
+    Returns:
+        The fetched value, or None if no ``info`` was given.
+    """
+    download = _cached_download_ee_video if cache_video else download_ee_video
+    if info is None:
+        download(collection, video_args, out_gif)
+        return None
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if cache_info:
+            future = executor.submit(_cached_get_info, info)
+        else:
+            future = executor.submit(info.getInfo)
+        download(collection, video_args, out_gif)
+        return future.result()
+
+
+def make_gif(
+    images: Union[List[str], str],
+    out_gif: str,
+    ext: str = "jpg",
+    fps: int = 10,
+    loop: int = 0,
+    clean_up: bool = False,
+) -> None:
+    """Create a GIF from a list of images.
+
+    Args:
+        images: List of image paths or directory.
+        out_gif: Output GIF path.
+        ext: Image extension.
+        fps: Frames per second.
+        loop: Number of loops (0 = infinite).
+        clean_up: Whether to delete source images.
+    """
+    # Check if PIL is available
+    if Image is None:
+        raise RuntimeError(
+            "PIL (Pillow) is not available. Cannot create GIF from images."
+        )
+
+    if isinstance(images, str) and os.path.isdir(images):
+        images = list(glob.glob(os.path.join(images, f"*.{ext}")))
+
+    if not images:
+        raise ValueError("No images found.")
+
+    images.sort()
+
+    # ffmpeg streams the frames and builds one palette for the whole
+    # animation; PIL is the fallback when ffmpeg is missing or fails.
+    if not _ffmpeg_make_gif(images, out_gif, fps, loop):
+        frames = [Image.open(img) for img in images]
+        frame_one = frames[0]
+        frame_one.save(
+            out_gif,
+            format="GIF",
+            append_images=frames[1:],
+            save_all=True,
+            duration=int(1000 / fps),
+            loop=loop,
+        )
+
+    if clean_up:
+        for image in images:
+            os.remove(image)
+
+
+# Fonts to try for overlays, in order; Pillow resolves bare file names
+# against the system font directories.
+_FONT_CANDIDATES = (
+    "arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+_FONT_PATH = None
+# FreeType faces are not thread safe, and cached fonts are shared between
+# timelapses built concurrently (see create_timelapses_batch).
+_FONT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=16)
+def _get_font(size: int):
+    """Load the overlay font at a given size.
+
+    The first candidate that loads is remembered, so later sizes skip the
+    failed lookups, and each size is only loaded once per session. Reusing
+    the same font object also lets ``_text_sprite`` hit its cache across
+    calls.
+
+    Args:
+        size: Font size in points.
+
+    Returns:
+        A PIL font, or Pillow's default font if no candidate is available.
+    """
+    global _FONT_PATH
+    candidates = (_FONT_PATH,) if _FONT_PATH else _FONT_CANDIDATES
+    for path in candidates:
+        try:
+            font = ImageFont.truetype(path, size)
+        except OSError:
+            continue
+        _FONT_PATH = path
+        return font
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _text_mask(text: str, font):
+    """Rasterize text once into a coverage mask.
+
+    Memoized, so a label repeated across frames (such as a title drawn on
+    every frame) is only rasterized once. The returned mask is shared and
+    must not be modified.
+
+    Args:
+        text: Text to draw.
+        font: PIL font.
+
+    Returns:
+        Tuple ``(mask, (dx, dy))`` where ``mask`` is an "L" image of the text
+        coverage and ``(dx, dy)`` its offset from the text anchor, or None
+        for empty text.
+    """
+    with _FONT_LOCK:
+        left, top, right, bottom = font.getbbox(text) if text else (0, 0, 0, 0)
+        if right <= left or bottom <= top:
+            return None
+        mask = Image.new("L", (right - left, bottom - top), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+
+@functools.lru_cache(maxsize=256)
+def _text_sprite(text: str, font, color: str):
+    """Turn a cached text mask into a color + coverage sprite for numpy.
+
+    Memoized like ``_text_mask``; the returned arrays are shared and must
+    not be modified.
+
+    Args:
+        text: Text to draw.
+        font: PIL font.
+        color: Text color (name or hex).
+
+    Returns:
+        Tuple ``(ink, keep, (dx, dy))`` where ``ink`` is the (h, w, 3) text
+        color already weighted by its coverage (plus 0.5 for rounding),
+        ``keep`` the (h, w, 1) weight left for the background and
+        ``(dx, dy)`` the sprite offset from the text anchor, or None for
+        empty text.
+    """
+    text_mask = _text_mask(text, font)
+    if text_mask is None:
+        return None
+    mask, offset = text_mask
+    alpha = np.asarray(mask, dtype=np.float32)[:, :, None] / 255.0
+    rgb = np.array(ImageColor.getrgb(color)[:3], dtype=np.float32)
+    return rgb * alpha + 0.5, 1.0 - alpha, offset
+
+
+def _paste_text(frame, text_mask, x: int, y: int, color) -> None:
+    """Paint a cached text mask onto a PIL image in place."""
+    if text_mask is None:
+        return
+    mask, (dx, dy) = text_mask
+    frame.paste(color, (x + dx, y + dy), mask)
+
+
+def _blend_sprite(arr, sprite, x: int, y: int) -> None:
+    """Alpha-blend a text sprite into an (h, w, 3+) uint8 array in place.
+
+    Args:
+        arr: Frame pixel array.
+        sprite: Result of :func:`_text_sprite`, or None to do nothing.
+        x: Text anchor x.
+        y: Text anchor y.
+    """
+    if sprite is None:
+        return
+    ink, keep, (dx, dy) = sprite
+    height, width = arr.shape[:2]
+    x0, y0 = x + dx, y + dy
+    x1, y1 = x0 + keep.shape[1], y0 + keep.shape[0]
+    # Clip the sprite to the frame
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x1, width), min(y1, height)
+    if cx1 <= cx0 or cy1 <= cy0:
+        return
+    sy, sx = slice(cy0 - y0, cy1 - y0), slice(cx0 - x0, cx1 - x0)
+    region = arr[cy0:cy1, cx0:cx1, :3]
+    # The text terms are precomputed per sprite, so a frame only costs one
+    # multiply and one add, done in a single float buffer.
+    blended = np.multiply(region, keep[sy, sx], dtype=np.float32)
+    blended += ink[sy, sx]
+    region[...] = blended
+
+
+def add_text_to_gif(
+    in_gif: str,
+    out_gif: str,
+    text_sequence: Union[str, List[str]],
+    xy: tuple = ("2%", "2%"),
+    font_size: int = 20,
+    font_color: str = "white",
+    add_progress_bar: bool = True,
+    progress_bar_color: str = "white",
+    progress_bar_height: int = 5,
+    loop: int = 0,
+    out_mp4: str = None,
+) -> None:
+    """Add text overlay to each frame of a GIF.
+
+    Args:
+        in_gif: Input GIF path.
+        out_gif: Output GIF path.
+        text_sequence: Text for each frame.
+        xy: Position of text.
+        font_size: Font size.
+        font_color: Font color.
+        add_progress_bar: Whether to add progress bar.
+        progress_bar_color: Progress bar color.
+        progress_bar_height: Progress bar height.
+        loop: Loop count.
+        out_mp4: Optional MP4 path to also write from the annotated frames.
+    """
+    add_overlays_to_gif(
+        in_gif,
+        out_gif,
+        text_sequence,
+        xy=xy,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        out_mp4=out_mp4,
+    )
+
+
+def _resolve_xy(xy: tuple, width: int, height: int) -> Tuple[int, int]:
+    """Convert a position given in pixels or percentages to pixels."""
+    x, y = xy
+    if isinstance(x, str) and "%" in x:
+        x = width * float(x.strip("%")) / 100
+    if isinstance(y, str) and "%" in y:
+        y = height * float(y.strip("%")) / 100
+    return int(x), int(y)
+
+
+def add_overlays_to_gif(
+    in_gif: str,
+    out_gif: str,
+    text_sequence: Optional[Union[str, List[str]]] = None,
+    title: Optional[str] = None,
+    xy: tuple = ("2%", "2%"),
+    title_xy: tuple = ("2%", "93%"),
+    font_size: int = 20,
+    font_color: str = "white",
+    add_progress_bar: bool = True,
+    progress_bar_color: str = "white",
+    progress_bar_height: int = 5,
+    loop: int = 0,
+    out_mp4: str = None,
+    duration: Optional[int] = None,
+) -> None:
+    """Add frame labels, a title and a progress bar to a GIF in one pass.
+
+    Equivalent to calling ``add_text_to_gif`` once for the labels and again
+    for the title, but the GIF is only decoded and encoded once.
+
+    Args:
+        in_gif: Input GIF path.
+        out_gif: Output GIF path.
+        text_sequence: Text for each frame, or None for no labels.
+        title: Text drawn on every frame at ``title_xy``, or None.
+        xy: Position of the frame labels.
+        title_xy: Position of the title.
+        font_size: Font size.
+        font_color: Font color.
+        add_progress_bar: Whether to add progress bar.
+        progress_bar_color: Progress bar color.
+        progress_bar_height: Progress bar height.
+        loop: Loop count.
+        out_mp4: Optional MP4 path to also write from the annotated frames.
+        duration: Frame duration in milliseconds for the output. Defaults to
+            the duration of the input GIF.
+    """
+    # Check if PIL is available
+    if Image is None:
+        print("Warning: PIL (Pillow) is not available. Skipping text overlay.")
+        return
+
+    gif = Image.open(in_gif)
+    try:
+        n_frames = gif.n_frames
+
+        if text_sequence is None:
+            text_sequence = []
+        elif isinstance(text_sequence, str):
+            text_sequence = [text_sequence] * n_frames
+        elif len(text_sequence) < n_frames:
+            text_sequence = text_sequence + [text_sequence[-1]] * (
+                n_frames - len(text_sequence)
+            )
+        if not (isinstance(title, str) and title.strip()):
+            title = None
+
+        font = _get_font(font_size)
+        x, y = _resolve_xy(xy, *gif.size)
+        title_x, title_y = _resolve_xy(title_xy, *gif.size)
+
+        if np is not None:
+            bar_rgb = np.array(
+                ImageColor.getrgb(progress_bar_color)[:3], dtype=np.uint8
+            )
+            title_sprite = _text_sprite(title, font, font_color) if title else None
+        else:
+            text_rgb = ImageColor.getrgb(font_color)[:3]
+            title_mask = _text_mask(title, font) if title else None
+
+        def annotate(i, buf=None):
+            gif.seek(i)
+            # Text and progress bar are opaque, so draw in RGB: convert() already
+            # returns a new image, and there is no alpha channel to carry along.
+            frame = gif.convert("RGB")
+
+            width, height = frame.size
+            text = text_sequence[i] if i < len(text_sequence) else ""
+            progress = (i + 1) / n_frames
+            bar_width = int(width * progress)
+            bar_y = height - progress_bar_height
+
+            if np is None:
+                # Text is rasterized once per distinct string and then pasted
+                _paste_text(frame, _text_mask(text, font), x, y, text_rgb)
+                if add_progress_bar:
+                    ImageDraw.Draw(frame).rectangle(
+                        [(0, bar_y), (bar_width, height)], fill=progress_bar_color
+                    )
+                _paste_text(frame, title_mask, title_x, title_y, text_rgb)
+                return frame
+
+            # Composite on the pixel array: the text is blended in from a
+            # pre-rasterized sprite and the progress bar is a slice assignment.
+            # With a caller-owned buffer the array itself is returned.
+            if buf is None:
+                arr = np.array(frame)
+            else:
+                arr = buf
+                arr[...] = np.asarray(frame)
+            _blend_sprite(arr, _text_sprite(text, font, font_color), x, y)
+            if add_progress_bar:
+                arr[max(bar_y, 0) :, : bar_width + 1, :3] = bar_rgb
+            _blend_sprite(arr, title_sprite, title_x, title_y)
+            return Image.fromarray(arr) if buf is None else arr
+
+        def raw_frames():
+            if np is None:
+                for i in range(n_frames):
+                    yield annotate(i).tobytes()
+                return
+            # ffmpeg consumes each frame before the next one is drawn, so a
+            # single buffer is reused for the whole animation.
+            buf = np.empty((gif.height, gif.width, 3), dtype=np.uint8)
+            for i in range(n_frames):
+                yield annotate(i, buf)
+
+        # Keep the original duration unless a new one is requested
+        if duration is None:
+            duration = gif.info.get("duration", 100)
+
+        # Stream each annotated frame straight into ffmpeg so only one decoded
+        # frame is held at a time. The output goes to a temporary file because
+        # in_gif and out_gif are often the same path.
+        tmp_gif = f"{out_gif}.{uuid.uuid4().hex}.tmp.gif"
+        if _ffmpeg_write_gif(
+            raw_frames(),
+            tmp_gif,
+            gif.size,
+            duration,
+            loop,
+            out_mp4,
+        ):
+            gif.close()
+            os.replace(tmp_gif, out_gif)
+            return
+
+        # PIL fallback. Like ffmpeg's palettegen, build one adaptive palette for
+        # the whole clip (from a sample of frames that includes the last one,
+        # with the full progress bar) rather than running median cut on every
+        # frame. This avoids palette flicker and makes mapping each frame a
+        # cheap lookup.
+        sample = sorted({round(k * (n_frames - 1) / 7) for k in range(8)})
+        montage = Image.new("RGB", (gif.width, gif.height * len(sample)))
+        for row, i in enumerate(sample):
+            montage.paste(annotate(i), (0, row * gif.height))
+        # 255 colors leave one palette index free for the transparent deltas
+        # written by save(optimize=True) below.
+        palette = montage.convert("P", palette=Image.ADAPTIVE, colors=255)
+        montage = None
+
+        # Mapping runs in Pillow's C code with the GIL released, so overlap it
+        # across frames. Text drawing stays on this thread because FreeType
+        # fonts are not safe to share between threads. Frames are handed to the
+        # GIF writer as they are mapped, with at most one pending frame per
+        # worker, instead of collecting the whole clip in a list first.
+        workers = min(n_frames, os.cpu_count() or 1)
+
+        def quantized_frames():
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = collections.deque()
+                for i in range(n_frames):
+                    pending.append(
+                        executor.submit(annotate(i).quantize, palette=palette)
+                    )
+                    if len(pending) > workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+
+        # Save new GIF. optimize lets Pillow store unchanged pixels of each frame
+        # as transparent, which is lossless and compresses much better. in_gif is
+        # still being read while frames are written, so the temporary path is
+        # used here as well.
+        frames = quantized_frames()
+        try:
+            next(frames).save(
+                tmp_gif,
+                format="GIF",
+                append_images=frames,
+                save_all=True,
+                duration=duration,
+                loop=loop,
+                optimize=True,
+            )
+        except Exception:
+            if os.path.exists(tmp_gif):
+                os.remove(tmp_gif)
+            raise
+        gif.close()
+        os.replace(tmp_gif, out_gif)
+    finally:
+        gif.close()
+
+    if out_mp4 is not None:
+        gif_to_mp4(out_gif, out_mp4)
+
+
+def _file_digest(path: str) -> str:
+    """Return a short blake2b hex digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _mp4_source_file(out_mp4: str) -> str:
+    """Path of the sidecar recording which GIF an MP4 was converted from."""
+    return f"{out_mp4}.sha"
+
+
+def _forget_mp4_source(out_mp4: str) -> None:
+    """Drop the sidecar of an MP4 that is about to be rewritten."""
+    try:
+        os.remove(_mp4_source_file(os.path.abspath(out_mp4)))
+    except OSError:
+        pass
+
+
+def gif_to_mp4(in_gif: str, out_mp4: str) -> bool:
+    """Convert GIF to MP4 using ffmpeg.
+
+    The digest of ``in_gif`` is stored next to the MP4 in ``<out_mp4>.sha``.
+    When the MP4 and a matching digest already exist, the conversion is
+    skipped.
+
+    Args:
+        in_gif: Input GIF path.
+        out_mp4: Output MP4 path.
+
+    Returns:
+        True if successful, False otherwise.
+    """
+    import subprocess  # nosec B404 (ffmpeg invoked with validated list-form args)
+    import shutil
+
+    # Check if PIL is available
+    if Image is None:
+        print(
+            "Warning: PIL (Pillow) is not available. Cannot determine GIF dimensions for MP4 conversion."
+        )
+        return False
+
+    if not shutil.which("ffmpeg"):
+        return False
+
+    if not os.path.exists(in_gif):
+        return False
+
+    out_mp4 = os.path.abspath(out_mp4)
+    os.makedirs(os.path.dirname(out_mp4), exist_ok=True)
+
+    # Re-encoding an unchanged GIF would produce the same MP4
+    source_file = _mp4_source_file(out_mp4)
+    digest = _file_digest(in_gif)
+    if os.path.exists(out_mp4):
+        try:
+            with open(source_file, encoding="utf-8") as f:
+                if f.read().strip() == digest:
+                    return True
+        except OSError:
+            pass
+    _forget_mp4_source(out_mp4)
+
     # Get dimensions
     img = Image.open(in_gif)
     width, height = img.size
@@ -1534,31 +2583,132 @@ def gif_to_mp4(in_gif: str, out_mp4: str) -> bool:
     width = width + (width % 2)
     height = height + (height % 2)
 
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-loglevel",
-        "error",
-        "-i",
-        in_gif,
-        "-vf",
-        f"scale={width}:{height}",
-        "-vcodec",
-        "libx264",
-        "-crf",
-        "25",
-        "-pix_fmt",
-        "yuv420p",
-        out_mp4,
-    ]
+    # A hardware encoder can be listed by ffmpeg but still fail to open (no
+    # GPU or driver), so it falls back to libx264.
+    encoder = _detect_h264_encoder()
+    attempts = [_HW_H264_ARGS[encoder]] if encoder else []
+    attempts.append(_X264_ARGS)
+
+    for encoder_args in attempts:
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-i",
+            in_gif,
+            "-vf",
+            f"scale={width}:{height}",
+            *encoder_args,
+            "-pix_fmt",
+            "yuv420p",
+            "-movflags",
+            "+faststart",
+            out_mp4,
+        ]
+        last = encoder_args is _X264_ARGS
+        try:
+            subprocess.run(
+                cmd, check=True, stderr=None if last else subprocess.DEVNULL
+            )  # nosec B603 (cmd is built from validated ffmpeg path + fixed flags)
+        except subprocess.CalledProcessError:
+            if last:
+                return False
+            continue
+        if not os.path.exists(out_mp4):
+            return False
+        try:
+            with open(source_file, "w", encoding="utf-8") as f:
+                f.write(digest)
+        except OSError:
+            pass
+        return True
+    return False
 
-    try:
-        subprocess.run(
-            cmd, check=True
-        )  # nosec B603 (cmd is built from validated ffmpeg path + fixed flags)
-        return os.path.exists(out_mp4)
-    except subprocess.CalledProcessError:
-        return False
+
+def _visualize_collection(
+    collection: "ee.ImageCollection",
+    vis_params: dict,
+    properties: List[str],
+    keep_projection: bool = False,
+) -> "ee.ImageCollection":
+    """Render every image of a collection to RGB for a video thumbnail.
+
+    All timelapse builders share this mapping, so identical inputs always
+    produce the same request graph and Earth Engine can answer a repeated
+    timelapse from its own result cache.
+
+    Args:
+        collection: Image collection to visualize.
+        vis_params: Parameters for ``ee.Image.visualize``.
+        properties: Properties to carry over from the source images.
+        keep_projection: Whether to keep each source image's projection as
+            the default projection of the rendered image.
+
+    Returns:
+        ee.ImageCollection of visualized images.
+    """
+
+    def visualize(img):
+        vis = img.visualize(**vis_params)
+        if keep_projection:
+            vis = vis.setDefaultProjection(img.projection())
+        return ee.Image(vis.copyProperties(img, properties))
+
+    return collection.map(visualize)
+
+
+def _annotate_timelapse(
+    out_gif: str,
+    labels: Optional[List[str]],
+    title: Optional[str],
+    font_size: int = 20,
+    font_color: str = "white",
+    add_progress_bar: bool = True,
+    progress_bar_color: str = "white",
+    progress_bar_height: int = 5,
+    loop: int = 0,
+    mp4: bool = False,
+) -> None:
+    """Add frame labels, a title and an optional MP4 to a downloaded GIF.
+
+    Labels and title are drawn in a single pass, and the MP4 is encoded from
+    the same annotated frames, so the GIF is decoded only once.
+
+    Args:
+        out_gif: GIF path, annotated in place.
+        labels: Text for each frame, or None to skip frame labels.
+        title: Title drawn near the bottom of every frame, or None.
+        font_size: Font size.
+        font_color: Font color.
+        add_progress_bar: Whether to add a progress bar with the labels.
+        progress_bar_color: Progress bar color.
+        progress_bar_height: Progress bar height.
+        loop: Loop count.
+        mp4: Whether to also create an MP4 next to the GIF.
+    """
+    out_mp4 = out_gif.replace(".gif", ".mp4") if mp4 else None
+    has_title = title is not None and isinstance(title, str) and title.strip()
+
+    if labels is None and not has_title:
+        # Nothing to draw, only convert
+        if out_mp4 is not None:
+            gif_to_mp4(out_gif, out_mp4)
+        return
+
+    add_overlays_to_gif(
+        out_gif,
+        out_gif,
+        labels,
+        title,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar and labels is not None,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        out_mp4=out_mp4,
+    )
 
 
 def create_naip_timelapse(
@@ -1630,13 +2780,8 @@ def create_naip_timelapse(
     collection = naip_timeseries(roi, start_year, end_year, bands=bands, step=step)
 
     # Visualize collection
-    vis_collection = collection.map(
-        lambda img: img.visualize(**vis_params).set(
-            {
-                "system:time_start": img.get("system:time_start"),
-                "system:date": img.get("system:date"),
-            }
-        )
+    vis_collection = _visualize_collection(
+        collection, vis_params, ["system:time_start", "system:date"]
     )
 
     # Add overlay if provided
@@ -1656,41 +2801,27 @@ def create_naip_timelapse(
         "bands": ["vis-red", "vis-green", "vis-blue"],
     }
 
-    # Download video
-    download_ee_video(vis_collection, video_args, out_gif)
-
-    # Add text overlay
-    if add_text:
-        dates = vis_collection.aggregate_array("system:date").getInfo()
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            dates,
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=add_progress_bar,
-            progress_bar_color=progress_bar_color,
-            progress_bar_height=progress_bar_height,
-            loop=loop,
-        )
-
-    # Add title overlay if specified
-    if title is not None and isinstance(title, str) and title.strip():
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            title,
-            xy=("2%", "93%"),
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=False,
-            loop=loop,
-        )
+    # Download video, fetching the frame labels at the same time
+    dates = _download_ee_video_and_fetch(
+        vis_collection,
+        video_args,
+        out_gif,
+        vis_collection.aggregate_array("system:date") if add_text else None,
+    )
 
-    # Convert to MP4 if requested
-    if mp4:
-        out_mp4 = out_gif.replace(".gif", ".mp4")
-        gif_to_mp4(out_gif, out_mp4)
+    # Add text and title overlays, and the MP4 if requested
+    _annotate_timelapse(
+        out_gif,
+        dates if add_text else None,
+        title,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        mp4=mp4,
+    )
 
     return out_gif
 
@@ -1797,13 +2928,8 @@ def create_sentinel2_timelapse(
     )
 
     # Visualize collection
-    vis_collection = collection.map(
-        lambda img: img.visualize(**vis_params).set(
-            {
-                "system:time_start": img.get("system:time_start"),
-                "system:date": img.get("system:date"),
-            }
-        )
+    vis_collection = _visualize_collection(
+        collection, vis_params, ["system:time_start", "system:date"]
     )
 
     # Add overlay if provided
@@ -1823,41 +2949,27 @@ def create_sentinel2_timelapse(
         "bands": ["vis-red", "vis-green", "vis-blue"],
     }
 
-    # Download video
-    download_ee_video(vis_collection, video_args, out_gif)
-
-    # Add text overlay
-    if add_text:
-        dates = vis_collection.aggregate_array("system:date").getInfo()
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            dates,
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=add_progress_bar,
-            progress_bar_color=progress_bar_color,
-            progress_bar_height=progress_bar_height,
-            loop=loop,
-        )
-
-    # Add title overlay if specified
-    if title is not None and isinstance(title, str) and title.strip():
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            title,
-            xy=("2%", "93%"),
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=False,
-            loop=loop,
-        )
+    # Download video, fetching the frame labels at the same time
+    dates = _download_ee_video_and_fetch(
+        vis_collection,
+        video_args,
+        out_gif,
+        vis_collection.aggregate_array("system:date") if add_text else None,
+    )
 
-    # Convert to MP4 if requested
-    if mp4:
-        out_mp4 = out_gif.replace(".gif", ".mp4")
-        gif_to_mp4(out_gif, out_mp4)
+    # Add text and title overlays, and the MP4 if requested
+    _annotate_timelapse(
+        out_gif,
+        dates if add_text else None,
+        title,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        mp4=mp4,
+    )
 
     return out_gif
 
@@ -1961,13 +3073,8 @@ def create_sentinel1_timelapse(
     )
 
     # Visualize collection - always outputs vis-red, vis-green, vis-blue
-    vis_collection = collection.map(
-        lambda img: img.visualize(**vis_params).set(
-            {
-                "system:time_start": img.get("system:time_start"),
-                "system:date": img.get("system:date"),
-            }
-        )
+    vis_collection = _visualize_collection(
+        collection, vis_params, ["system:time_start", "system:date"]
     )
 
     # Add overlay if provided
@@ -1987,41 +3094,27 @@ def create_sentinel1_timelapse(
         "bands": ["vis-red", "vis-green", "vis-blue"],
     }
 
-    # Download video
-    download_ee_video(vis_collection, video_args, out_gif)
-
-    # Add text overlay
-    if add_text:
-        dates = vis_collection.aggregate_array("system:date").getInfo()
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            dates,
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=add_progress_bar,
-            progress_bar_color=progress_bar_color,
-            progress_bar_height=progress_bar_height,
-            loop=loop,
-        )
-
-    # Add title overlay if specified
-    if title is not None and isinstance(title, str) and title.strip():
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            title,
-            xy=("2%", "93%"),
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=False,
-            loop=loop,
-        )
+    # Download video, fetching the frame labels at the same time
+    dates = _download_ee_video_and_fetch(
+        vis_collection,
+        video_args,
+        out_gif,
+        vis_collection.aggregate_array("system:date") if add_text else None,
+    )
 
-    # Convert to MP4 if requested
-    if mp4:
-        out_mp4 = out_gif.replace(".gif", ".mp4")
-        gif_to_mp4(out_gif, out_mp4)
+    # Add text and title overlays, and the MP4 if requested
+    _annotate_timelapse(
+        out_gif,
+        dates if add_text else None,
+        title,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        mp4=mp4,
+    )
 
     return out_gif
 
@@ -2115,13 +3208,8 @@ def create_landsat_timelapse(
     )
 
     # Select bands and visualize
-    vis_collection = collection.select(bands).map(
-        lambda img: img.visualize(**vis_params).set(
-            {
-                "system:time_start": img.get("system:time_start"),
-                "system:date": img.get("system:date"),
-            }
-        )
+    vis_collection = _visualize_collection(
+        collection.select(bands), vis_params, ["system:time_start", "system:date"]
     )
 
     # Add overlay if provided
@@ -2141,43 +3229,72 @@ def create_landsat_timelapse(
         "bands": ["vis-red", "vis-green", "vis-blue"],
     }
 
-    # Download video
-    download_ee_video(vis_collection, video_args, out_gif)
+    # Download video, fetching the frame labels at the same time
+    dates = _download_ee_video_and_fetch(
+        vis_collection,
+        video_args,
+        out_gif,
+        vis_collection.aggregate_array("system:date") if add_text else None,
+    )
 
-    # Add text overlay
-    if add_text:
-        dates = vis_collection.aggregate_array("system:date").getInfo()
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            dates,
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=add_progress_bar,
-            progress_bar_color=progress_bar_color,
-            progress_bar_height=progress_bar_height,
-            loop=loop,
-        )
+    # Add text and title overlays, and the MP4 if requested
+    _annotate_timelapse(
+        out_gif,
+        dates if add_text else None,
+        title,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        mp4=mp4,
+    )
 
-    # Add title overlay if specified
-    if title is not None and isinstance(title, str) and title.strip():
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            title,
-            xy=("2%", "93%"),
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=False,
-            loop=loop,
-        )
+    return out_gif
 
-    # Convert to MP4 if requested
-    if mp4:
-        out_mp4 = out_gif.replace(".gif", ".mp4")
-        gif_to_mp4(out_gif, out_mp4)
 
-    return out_gif
+_MONTH_ABBR = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+def _month_day_labels(timestamps: List[int]) -> List[str]:
+    """Format epoch-millisecond timestamps as "Mon DD" labels (UTC).
+
+    Args:
+        timestamps: Times in milliseconds since the epoch.
+
+    Returns:
+        One label per timestamp, such as "Jan 01".
+    """
+    if np is None:
+        epoch = datetime.datetime(1970, 1, 1)
+        labels = []
+        for ms in timestamps:
+            day = epoch + timedelta(milliseconds=ms)
+            labels.append(f"{_MONTH_ABBR[day.month - 1]} {day.day:02d}")
+        return labels
+
+    # Month and day come from datetime64 unit casts, for all frames at once
+    times = np.asarray(timestamps, dtype="datetime64[ms]")
+    months = times.astype("datetime64[M]")
+    days = (times.astype("datetime64[D]") - months).astype(np.int64) + 1
+    names = np.asarray(_MONTH_ABBR)[months.astype(np.int64) % 12]
+    return np.char.add(
+        np.char.add(names, " "), np.char.zfill(days.astype(str), 2)
+    ).tolist()
 
 
 def modis_ndvi_timeseries(
@@ -2280,13 +3397,8 @@ def create_modis_ndvi_timelapse(
         ],
     }
 
-    vis_collection = collection.map(
-        lambda img: img.visualize(**vis_params).set(
-            {
-                "system:index": img.get("system:index"),
-                "system:time_start": img.get("system:time_start"),
-            }
-        )
+    vis_collection = _visualize_collection(
+        collection, vis_params, ["system:index", "system:time_start"]
     )
 
     # Add overlay if provided
@@ -2302,63 +3414,116 @@ def create_modis_ndvi_timelapse(
         "crs": crs,
     }
 
-    download_ee_video(vis_collection, video_args, out_gif)
+    timestamps = _download_ee_video_and_fetch(
+        vis_collection,
+        video_args,
+        out_gif,
+        vis_collection.aggregate_array("system:time_start") if add_text else None,
+    )
 
-    if add_text:
-        text = vis_collection.aggregate_array("system:index").getInfo()
-        text_sequence = []
-        for t in text:
-            try:
-                parts = t.replace("_", "-")[5:]
-                month = int(parts[:2])
-                day = int(parts[3:5])
-                months = [
-                    "Jan",
-                    "Feb",
-                    "Mar",
-                    "Apr",
-                    "May",
-                    "Jun",
-                    "Jul",
-                    "Aug",
-                    "Sep",
-                    "Oct",
-                    "Nov",
-                    "Dec",
-                ]
-                text_sequence.append(f"{months[month-1]} {day:02d}")
-            except (ValueError, TypeError, IndexError):
-                text_sequence.append(t)
+    text_sequence = _month_day_labels(timestamps) if add_text else None
 
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            text_sequence,
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=add_progress_bar,
-            progress_bar_color=progress_bar_color,
-            progress_bar_height=progress_bar_height,
-            loop=loop,
+    # Add text and title overlays, and the MP4 if requested
+    _annotate_timelapse(
+        out_gif,
+        text_sequence,
+        title,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        mp4=mp4,
+    )
+
+    return out_gif
+
+
+# GOES ABI channel band names such as "CMI_C13"
+_CMI_BAND_RE = re.compile(r"CMI_C(\d+)", re.ASCII)
+
+# Raw ABI channels each fixed GOES band combination is computed from
+_GOES_RAW_BANDS = {
+    "true_color": ["CMI_C01", "CMI_C02", "CMI_C03"],
+    "volcanic_ash": ["CMI_C11", "CMI_C13", "CMI_C15"],
+    "volcanic_gases": ["CMI_C07", "CMI_C13", "CMI_C15"],
+}
+
+_GOES_RGB_BANDS = ["GOES_RED", "GOES_GREEN", "GOES_BLUE"]
+
+# Visualization (bands, min/max) of each fixed GOES band combination
+_GOES_VIS_PARAMS = {
+    "true_color": (["CMI_C02", "CMI_GREEN", "CMI_C01"], {"min": 0, "max": 0.8}),
+    "volcanic_ash": (
+        _GOES_RGB_BANDS,
+        {"min": [-6.7, -6.0, 243.6], "max": [2.6, 6.3, 302.4]},
+    ),
+    "volcanic_gases": (
+        _GOES_RGB_BANDS,
+        {"min": [-4.0, -4.0, 243.6], "max": [2.0, 5.0, 302.4]},
+    ),
+}
+
+_GOES_DEFAULT_CUSTOM_BANDS = ["CMI_C02", "CMI_C03", "CMI_C01"]
+
+
+def _goes_mode(band_combination: str) -> str:
+    """Normalize a GOES band combination name, rejecting unknown ones."""
+    mode = band_combination.lower().strip()
+    if mode not in _GOES_VIS_PARAMS and mode != "custom_rgb":
+        raise ValueError(
+            f"Unsupported GOES band_combination: {band_combination}. "
+            "Use true_color, volcanic_ash, volcanic_gases, or custom_rgb."
         )
+    return mode
 
-    # Add title overlay if specified
-    if title is not None and isinstance(title, str) and title.strip():
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            title,
-            xy=("2%", "93%"),
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=False,
-            loop=loop,
+
+def _goes_custom_bands(custom_bands: Optional[List[str]]) -> List[str]:
+    """Return the [R, G, B] channels of a custom GOES composite."""
+    selected = custom_bands or _GOES_DEFAULT_CUSTOM_BANDS
+    if len(selected) != 3:
+        raise ValueError(
+            "custom_bands must contain exactly three GOES bands [R, G, B]."
         )
+    return selected
 
-    if mp4:
-        gif_to_mp4(out_gif, out_gif.replace(".gif", ".mp4"))
 
-    return out_gif
+def _goes_custom_vis_params(selected: List[str]) -> dict:
+    """Visualization parameters for a custom GOES composite of ``selected``."""
+
+    def band_range(name: str):
+        # Channels 1-6 are reflectance, 7-16 brightness temperature (K)
+        match = _CMI_BAND_RE.fullmatch(name)
+        if match and int(match.group(1)) > 6:
+            return 180.0, 330.0
+        return 0.0, 1.0
+
+    mins, maxs = zip(*[band_range(b) for b in selected])
+    return {"bands": _GOES_RGB_BANDS, "min": list(mins), "max": list(maxs)}
+
+
+def _utc_minute_labels(timestamps: List[int]) -> List[str]:
+    """Format epoch-millisecond timestamps as "YYYY-MM-DD HH:MM UTC" labels.
+
+    Args:
+        timestamps: Times in milliseconds since the epoch.
+
+    Returns:
+        One label per timestamp, such as "2021-10-24 14:00 UTC".
+    """
+    if np is None:
+        return [
+            datetime.datetime.fromtimestamp(ms / 1000, datetime.timezone.utc).strftime(
+                "%Y-%m-%d %H:%M UTC"
+            )
+            for ms in timestamps
+        ]
+
+    # ISO strings truncated to the minute, for all frames at once
+    times = np.asarray(timestamps, dtype="datetime64[ms]").astype("datetime64[m]")
+    labels = np.char.replace(np.datetime_as_string(times), "T", " ")
+    return np.char.add(labels, " UTC").tolist()
 
 
 def goes_timeseries(
@@ -2382,7 +3547,8 @@ def goes_timeseries(
         custom_bands: Custom GOES RGB bands [R, G, B] when band_combination is "custom_rgb".
 
     Returns:
-        ee.ImageCollection of processed GOES images.
+        ee.ImageCollection of processed GOES images, with only the bands of
+        the requested composite.
     """
     scan_types = {
         "full_disk": "MCMIPF",
@@ -2393,14 +3559,24 @@ def goes_timeseries(
     satellite_num = data[-2:]  # "16", "17", "18", "19"
     col = ee.ImageCollection(f"NOAA/GOES/{satellite_num}/{scan_types[scan.lower()]}")
 
+    mode = _goes_mode(band_combination)
+
+    # Raw bands the composite reads. Only these are selected from the
+    # collection, so scaling and the composite math never touch the rest.
+    if mode == "custom_rgb":
+        selected = _goes_custom_bands(custom_bands)
+        raw_bands = list(dict.fromkeys(selected))
+    else:
+        raw_bands = _GOES_RAW_BANDS[mode]
+
     def apply_scale_and_offset(img):
-        def get_factor_img(factor_names):
-            factor_list = img.toDictionary().select(factor_names).values()
+        def get_factor_img(suffix):
+            factor_list = img.toDictionary().values([b + suffix for b in raw_bands])
             return ee.Image.constant(factor_list)
 
-        scale_img = get_factor_img(["CMI_C.._scale"])
-        offset_img = get_factor_img(["CMI_C.._offset"])
-        scaled = img.select("CMI_C..").multiply(scale_img).add(offset_img)
+        scale_img = get_factor_img("_scale")
+        offset_img = get_factor_img("_offset")
+        scaled = img.multiply(scale_img).add(offset_img)
         return img.addBands(srcImg=scaled, overwrite=True)
 
     def add_green_band(img):
@@ -2416,7 +3592,7 @@ def goes_timeseries(
 
     def scale_for_vis(img):
         return (
-            img.select(["CMI_C01", "CMI_GREEN", "CMI_C02", "CMI_C03", "CMI_C05"])
+            img.select(["CMI_C02", "CMI_GREEN", "CMI_C01"])
             .resample("bicubic")
             .log10()
             .interpolate([-1.6, 0.176], [0, 1], "clamp")
@@ -2424,7 +3600,7 @@ def goes_timeseries(
             .set("system:time_start", img.get("system:time_start"))
         )
 
-    def create_thermal_composite(img, mode: str):
+    def create_thermal_composite(img):
         red = img.select("CMI_C15").subtract(img.select("CMI_C13")).rename("GOES_RED")
 
         if mode == "volcanic_gases":
@@ -2445,35 +3621,23 @@ def goes_timeseries(
             "system:time_start", img.get("system:time_start")
         )
 
-    mode = band_combination.lower().strip()
-
     def process_for_vis(img):
         scaled = apply_scale_and_offset(img)
         if mode == "true_color":
             return scale_for_vis(add_green_band(scaled))
         if mode in ["volcanic_ash", "volcanic_gases"]:
-            return create_thermal_composite(scaled, mode)
-        if mode == "custom_rgb":
-            selected = custom_bands or ["CMI_C02", "CMI_C03", "CMI_C01"]
-            if len(selected) != 3:
-                raise ValueError(
-                    "custom_bands must contain exactly three GOES bands [R, G, B]."
-                )
-            return (
-                scaled.select(selected)
-                .rename(["GOES_RED", "GOES_GREEN", "GOES_BLUE"])
-                .set("system:time_start", img.get("system:time_start"))
-            )
-        raise ValueError(
-            f"Unsupported GOES band_combination: {band_combination}. "
-            "Use true_color, volcanic_ash, volcanic_gases, or custom_rgb."
+            return create_thermal_composite(scaled)
+        return (
+            scaled.select(selected)
+            .rename(_GOES_RGB_BANDS)
+            .set("system:time_start", img.get("system:time_start"))
         )
 
     result = col.filterDate(start_date, end_date)
     if region is not None:
         result = result.filterBounds(region)
 
-    return result.map(process_for_vis)
+    return result.select(raw_bands).map(process_for_vis)
 
 
 def create_goes_timelapse(
@@ -2541,56 +3705,20 @@ def create_goes_timelapse(
     )
 
     # Visualization params
-    mode = band_combination.lower().strip()
-    if mode == "true_color":
-        bands = ["CMI_C02", "CMI_GREEN", "CMI_C01"]
-        vis_params = {"bands": bands, "min": 0, "max": 0.8}
-    elif mode == "volcanic_ash":
-        bands = ["GOES_RED", "GOES_GREEN", "GOES_BLUE"]
-        vis_params = {
-            "bands": bands,
-            "min": [-6.7, -6.0, 243.6],
-            "max": [2.6, 6.3, 302.4],
-        }
-    elif mode == "volcanic_gases":
-        bands = ["GOES_RED", "GOES_GREEN", "GOES_BLUE"]
-        vis_params = {
-            "bands": bands,
-            "min": [-4.0, -4.0, 243.6],
-            "max": [2.0, 5.0, 302.4],
-        }
-    elif mode == "custom_rgb":
-        bands = ["GOES_RED", "GOES_GREEN", "GOES_BLUE"]
-        selected = custom_bands or ["CMI_C02", "CMI_C03", "CMI_C01"]
-
-        def _band_range(name: str):
-            if name.startswith("CMI_C"):
-                try:
-                    idx = int(name.split("CMI_C", 1)[1])
-                except Exception:
-                    idx = 2
-                if idx <= 6:
-                    return 0.0, 1.0
-                return 180.0, 330.0
-            return 0.0, 1.0
-
-        mins, maxs = zip(*[_band_range(b) for b in selected])
-        vis_params = {"bands": bands, "min": list(mins), "max": list(maxs)}
+    mode = _goes_mode(band_combination)
+    if mode == "custom_rgb":
+        vis_params = _goes_custom_vis_params(_goes_custom_bands(custom_bands))
     else:
-        raise ValueError(
-            f"Unsupported GOES band_combination: {band_combination}. "
-            "Use true_color, volcanic_ash, volcanic_gases, or custom_rgb."
-        )
+        bands, ranges = _GOES_VIS_PARAMS[mode]
+        vis_params = {"bands": bands, **ranges}
+    bands = vis_params["bands"]
 
     # Visualize collection and preserve original projection
-    vis_collection = collection.select(bands).map(
-        lambda img: img.visualize(**vis_params)
-        .setDefaultProjection(img.projection())
-        .set(
-            {
-                "system:time_start": img.get("system:time_start"),
-            }
-        )
+    vis_collection = _visualize_collection(
+        collection.select(bands),
+        vis_params,
+        ["system:time_start"],
+        keep_projection=True,
     )
 
     # Add overlay if provided
@@ -2618,49 +3746,104 @@ def create_goes_timelapse(
         "max": 255,
     }
 
-    # Download video
-    download_ee_video(vis_collection, video_args, out_gif)
+    # Fetch the raw frame timestamps in one request and format them locally,
+    # rather than mapping a date formatter over every image server-side.
+    dates = vis_collection.aggregate_array("system:time_start")
+
+    # Frames of a range that ended over a day ago are final, so the video
+    # and its frame times can come from the local cache on later runs, for
+    # example when only the title or font changes.
+    now = datetime.datetime.now(datetime.timezone.utc)
+    try:
+        end = datetime.datetime.fromisoformat(str(end_date))
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=datetime.timezone.utc)
+        settled = end < now - timedelta(days=1)
+    except ValueError:
+        settled = False
+
+    # Download video, fetching the frame timestamps at the same time
+    dates = _download_ee_video_and_fetch(
+        vis_collection,
+        video_args,
+        out_gif,
+        dates if add_text else None,
+        cache_info=settled,
+        cache_video=settled,
+    )
 
-    # Add text overlay with datetime
+    # Label each frame with its datetime
     if add_text:
-        # Get timestamps and format them
-        def format_date(img):
-            return ee.Date(img.get("system:time_start")).format("YYYY-MM-dd HH:mm")
-
-        dates = (
-            vis_collection.map(lambda img: ee.Feature(None, {"date": format_date(img)}))
-            .aggregate_array("date")
-            .getInfo()
-        )
+        dates = _utc_minute_labels(dates)
 
-        dates = [f"{date} UTC" for date in dates]
+    # Add text and title overlays, and the MP4 if requested
+    _annotate_timelapse(
+        out_gif,
+        dates,
+        title,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        loop=loop,
+        mp4=mp4,
+    )
 
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            dates,
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=add_progress_bar,
-            progress_bar_color=progress_bar_color,
-            progress_bar_height=progress_bar_height,
-            loop=loop,
-        )
+    return out_gif
 
-    # Add title overlay if specified
-    if title is not None and isinstance(title, str) and title.strip():
-        add_text_to_gif(
-            out_gif,
-            out_gif,
-            title,
-            xy=("2%", "93%"),
-            font_size=font_size,
-            font_color=font_color,
-            add_progress_bar=False,
-            loop=loop,
-        )
 
-    if mp4:
-        gif_to_mp4(out_gif, out_gif.replace(".gif", ".mp4"))
+_TIMELAPSE_BUILDERS = {
+    "naip": create_naip_timelapse,
+    "sentinel2": create_sentinel2_timelapse,
+    "sentinel1": create_sentinel1_timelapse,
+    "landsat": create_landsat_timelapse,
+    "modis_ndvi": create_modis_ndvi_timelapse,
+    "goes": create_goes_timelapse,
+}
 
-    return out_gif
+
+def create_timelapses_batch(
+    specs: List[Dict[str, Any]], max_workers: int = 4
+) -> List[Optional[str]]:
+    """Create several timelapses concurrently.
+
+    Each timelapse spends most of its time waiting on Earth Engine and
+    ffmpeg, so they are run on threads. A failed timelapse does not stop
+    the others.
+
+    Args:
+        specs: One dict per timelapse. The ``"type"`` key selects the
+            builder (``"naip"``, ``"sentinel2"``, ``"sentinel1"``,
+            ``"landsat"``, ``"modis_ndvi"`` or ``"goes"``) and the remaining
+            keys are passed to it as keyword arguments. Each spec should
+            have its own ``out_gif``.
+        max_workers: Maximum number of timelapses built at the same time.
+
+    Returns:
+        Output GIF paths in the order of ``specs``, with None for
+        timelapses that failed.
+    """
+    jobs = []
+    for spec in specs:
+        kwargs = dict(spec)
+        kind = kwargs.pop("type", None)
+        if kind not in _TIMELAPSE_BUILDERS:
+            raise ValueError(
+                f"Unknown timelapse type: {kind}. "
+                f"Choose from {', '.join(_TIMELAPSE_BUILDERS)}."
+            )
+        jobs.append((_TIMELAPSE_BUILDERS[kind], kwargs))
+
+    def run(job):
+        builder, kwargs = job
+        try:
+            return builder(**kwargs)
+        except Exception as e:
+            print(f"Warning: {builder.__name__} failed: {e}")
+            return None
+
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        return list(executor.map(run, jobs))
@@ -6,19 +6,37 @@ the plugin's Python dependencies (earthengine-api, numpy, Pillow) without
 modifying QGIS's built-in Python environment.
 """
 
-import importlib
-import importlib.metadata
+import collections
+import ctypes
+import hashlib
+import json
+import locale
 import os
 import platform
 import re
 import shutil
 import subprocess  # nosec B404 (validated list-form calls only; commands are pinned, not user input)
 import sys
+import tarfile
+import threading
 import time
+import weakref
 from typing import Callable, Optional, Tuple
 
 from qgis.core import QgsMessageLog, Qgis
 
+from . import python_manager, uv_manager
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+except ImportError:
+    SpecifierSet = None
+
 CACHE_DIR = os.path.expanduser("~/.qgis_timelapse")
 VENV_DIR = os.path.join(CACHE_DIR, "venv")
 
@@ -35,6 +53,50 @@ PACKAGE_IMPORT_DIRS = {
     "google-auth-oauthlib": ("google_auth_oauthlib",),
 }
 
+# Module imported by verify_venv for each package, with the attribute that
+# holds its version (None when the module has none)
+PACKAGE_VERIFY_IMPORTS = {
+    "earthengine-api": ("ee", "__version__"),
+    "numpy": ("numpy", "__version__"),
+    "Pillow": ("PIL.Image", "__version__"),
+    "google-auth-oauthlib": ("google_auth_oauthlib", None),
+}
+
+# Marker written into the venv after a successful install. It holds a hash
+# of REQUIRED_PACKAGES so repeat installs can skip the resolver entirely.
+DEPS_HASH_FILE = "deps_hash.txt"
+
+# Written inside the venv after a successful install, recording the specs
+# hash, site-packages path and installed versions. While it matches the
+# current specs, status checks at plugin load need no directory scans.
+READY_FILE = ".ready.json"
+
+# Pointer file inside the venv holding the resolved site-packages path, so
+# later sessions can skip scanning lib/ for the pythonX.Y directory.
+SITE_PACKAGES_FILE = ".sitepkg"
+
+# Lines of installer output kept for error messages
+_OUTPUT_TAIL_LINES = 64
+
+# Resolved site-packages paths for this session, as {venv_dir: path}
+_site_packages_cache = {}
+
+# Paths recorded in ready markers read this session, as
+# {venv_dir: (site_packages, python)}
+_ready_cache = {}
+
+# QGIS Python interpreters resolved this session, as
+# {(sys.executable, "X.Y"): path}
+_python_executable_cache = {}
+
+# Plugin modules that cache ``ee`` at import time, as weak references so
+# reloaded or unloaded modules drop out (see register_ee_consumer)
+_EE_CONSUMERS = []
+
+# QGIS's bundled Python found by a previous session, stored as the QGIS
+# executable and Python version it was resolved for, then the path.
+PYTHON_PATH_FILE = os.path.join(CACHE_DIR, ".python")
+
 
 def _log(message, level=Qgis.MessageLevel.Info):
     """Log a message to the QGIS message log.
@@ -89,20 +151,28 @@ def _get_clean_env_for_venv():
     return env
 
 
+_IS_WINDOWS = sys.platform == "win32"
+
+# Hide the console window of every child process on Windows. Popen copies
+# the STARTUPINFO it is given, so one instance serves every call.
+_SUBPROCESS_KWARGS = {}
+if _IS_WINDOWS:
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _startupinfo.wShowWindow = subprocess.SW_HIDE
+    _SUBPROCESS_KWARGS = {
+        "startupinfo": _startupinfo,
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+    }
+
+
 def _get_subprocess_kwargs():
     """Get platform-specific subprocess keyword arguments.
 
     Returns:
         Dict of kwargs to pass to subprocess.run/Popen.
     """
-    kwargs = {}
-    if platform.system() == "Windows":
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        startupinfo.wShowWindow = subprocess.SW_HIDE
-        kwargs["startupinfo"] = startupinfo
-        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-    return kwargs
+    return dict(_SUBPROCESS_KWARGS)
 
 
 def _strip_stderr_warnings(stderr):
@@ -149,7 +219,7 @@ def get_venv_python_path(venv_dir=None):
     """
     if venv_dir is None:
         venv_dir = VENV_DIR
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         primary = os.path.join(venv_dir, "Scripts", "python.exe")
         if os.path.isfile(primary):
             return primary
@@ -174,7 +244,7 @@ def get_venv_pip_path(venv_dir=None):
     """
     if venv_dir is None:
         venv_dir = VENV_DIR
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         return os.path.join(venv_dir, "Scripts", "pip.exe")
     return os.path.join(venv_dir, "bin", "pip")
 
@@ -191,19 +261,45 @@ def get_venv_site_packages(venv_dir=None):
     if venv_dir is None:
         venv_dir = VENV_DIR
 
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         sp = os.path.join(venv_dir, "Lib", "site-packages")
         return sp if os.path.isdir(sp) else None
 
+    # A path resolved earlier (this session or a previous one) only needs
+    # one existence check; it goes stale if the venv is rebuilt.
+    pointer = os.path.join(venv_dir, SITE_PACKAGES_FILE)
+    cached = _site_packages_cache.get(venv_dir)
+    if cached is None:
+        try:
+            with open(pointer, encoding="utf-8") as f:
+                cached = f.read().strip()
+        except OSError:
+            pass
+    if cached and os.path.isdir(cached):
+        _site_packages_cache[venv_dir] = cached
+        return cached
+
     # On Unix, detect the actual Python version directory in the venv
     lib_dir = os.path.join(venv_dir, "lib")
-    if not os.path.isdir(lib_dir):
+    try:
+        with os.scandir(lib_dir) as entries:
+            python_dirs = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith("python") and entry.is_dir()
+            ]
+    except OSError:
         return None
-    for entry in sorted(os.listdir(lib_dir), reverse=True):
-        if entry.startswith("python"):
-            sp = os.path.join(lib_dir, entry, "site-packages")
-            if os.path.isdir(sp):
-                return sp
+    for name in sorted(python_dirs, reverse=True):
+        sp = os.path.join(lib_dir, name, "site-packages")
+        if os.path.isdir(sp):
+            _site_packages_cache[venv_dir] = sp
+            try:
+                with open(pointer, "w", encoding="utf-8") as f:
+                    f.write(sp)
+            except OSError:
+                pass
+            return sp
     return None
 
 
@@ -224,49 +320,59 @@ def _normalize_distribution_name(name):
     return re.sub(r"[-_.]+", "-", name).lower()
 
 
-def _get_installed_version_from_site_packages(package_name, site_packages):
-    """Return an installed distribution version from a specific site-packages path."""
-    normalized_name = _normalize_distribution_name(package_name)
-    for distribution in importlib.metadata.distributions(path=[site_packages]):
-        distribution_name = distribution.metadata.get("Name")
-        if (
-            distribution_name
-            and _normalize_distribution_name(distribution_name) == normalized_name
-        ):
-            return distribution.version
-    return None
+def _scan_site_packages(site_packages):
+    """Read a site-packages directory once for package checks.
+
+    Args:
+        site_packages: Path to the site-packages directory.
 
+    Returns:
+        A tuple of (entries, versions) where entries is the set of names in
+        the directory and versions maps normalized distribution names to the
+        version from their .dist-info/.egg-info name (None if it has none).
+    """
+    try:
+        with os.scandir(site_packages) as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        return set(), {}
+
+    versions = {}
+    for entry in entries:
+        if entry.endswith((".dist-info", ".egg-info")):
+            parts = entry.rsplit(".", 1)[0].split("-")
+            versions[_normalize_distribution_name(parts[0])] = (
+                parts[1] if len(parts) > 1 else None
+            )
+    return entries, versions
 
-def _package_exists_in_site_packages(package_name, site_packages):
-    """Check whether a package appears to be installed in site-packages.
+
+def _installed_version(package_name, scan):
+    """Look up a package in a site-packages scan.
 
     Prefer distribution metadata. Fall back to import package directories for
     packages whose distribution name differs from their import name, such as
     Pillow -> PIL.
-    """
-    if _get_installed_version_from_site_packages(package_name, site_packages):
-        return True
 
-    import_dirs = PACKAGE_IMPORT_DIRS.get(
-        package_name, (package_name.replace("-", "_"),)
-    )
-    for import_dir in import_dirs:
-        if os.path.exists(os.path.join(site_packages, import_dir)):
-            return True
+    Args:
+        package_name: Distribution name, as in REQUIRED_PACKAGES.
+        scan: Result of _scan_site_packages().
 
+    Returns:
+        The installed version, "unknown" if the package is present without a
+        versioned metadata directory, or None if it is not installed.
+    """
+    entries, versions = scan
     normalized_name = _normalize_distribution_name(package_name)
-    try:
-        entries = os.listdir(site_packages)
-    except OSError:
-        return False
+    if normalized_name in versions:
+        return versions[normalized_name] or "unknown"
 
-    return any(
-        entry.endswith((".dist-info", ".egg-info"))
-        and _normalize_distribution_name(entry.rsplit(".", 1)[0]).startswith(
-            f"{normalized_name}-"
-        )
-        for entry in entries
+    import_dirs = PACKAGE_IMPORT_DIRS.get(
+        package_name, (package_name.replace("-", "_"),)
     )
+    if any(import_dir in entries for import_dir in import_dirs):
+        return "unknown"
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -293,7 +399,7 @@ def _is_python_executable_name(path: str) -> bool:
 
 def _is_macos_qgis_app_bundle_python(path: str) -> bool:
     """Return True for unsafe Python launchers in QGIS.app/Contents/MacOS."""
-    if not (platform.system() == "Darwin" or sys.platform == "darwin"):
+    if sys.platform != "darwin":
         return False
     parts = os.path.abspath(path).split(os.sep)
     for idx, part in enumerate(parts):
@@ -380,11 +486,28 @@ def _candidate_python_paths():
         [os.path.join(exe_dir, "python.exe"), os.path.join(exe_dir, "python3.exe")]
     )
 
+    # One directory read of the OSGeo4W apps folder; DirEntry.is_dir() is
+    # answered from that read on Windows, so files are skipped for free.
     apps_dir = os.path.join(os.path.dirname(exe_dir), "apps")
-    if os.path.isdir(apps_dir):
-        for entry in sorted(os.listdir(apps_dir), reverse=True):
-            if entry.lower().startswith("python"):
-                candidates.append(os.path.join(apps_dir, entry, "python.exe"))
+    try:
+        with os.scandir(apps_dir) as entries:
+            python_dirs = [
+                entry.name
+                for entry in entries
+                if entry.name.lower().startswith("python") and entry.is_dir()
+            ]
+    except OSError:
+        python_dirs = []
+    # Folders named for another version (apps/Python39 next to Python312)
+    # would only fail the version probe, which starts each interpreter.
+    version_tags = ("", str(sys.version_info.major), py_ver.replace(".", ""))
+    python_dirs = [
+        name
+        for name in python_dirs
+        if "".join(c for c in name if c.isdigit()) in version_tags
+    ]
+    for name in sorted(python_dirs, reverse=True):
+        candidates.append(os.path.join(apps_dir, name, "python.exe"))
 
     for root in [sys.executable, getattr(sys, "_base_executable", None), sys.prefix]:
         contents_dir = _contents_dir_from_path(root)
@@ -436,10 +559,20 @@ def _candidate_python_paths():
 
 
 def _find_python_executable():
-    """Find a real Python executable for venv creation."""
+    """Find a real Python executable for venv creation.
+
+    The result is remembered for the rest of the session, since probing
+    runs each candidate interpreter.
+    """
+    key = (sys.executable, f"{sys.version_info.major}.{sys.version_info.minor}")
+    cached = _python_executable_cache.get(key)
+    if cached is not None and os.path.isfile(cached):
+        return cached
+
     candidates = _candidate_python_paths()
     for candidate in candidates:
         if _python_candidate_matches_runtime(candidate):
+            _python_executable_cache[key] = candidate
             return candidate
 
     candidates_text = "\n".join(f"  - {path}" for path in candidates)
@@ -452,6 +585,40 @@ def _find_python_executable():
     )
 
 
+def _get_qgis_python():
+    """Find QGIS's bundled Python, reusing the result of earlier sessions.
+
+    Resolving it starts every candidate interpreter to check its version,
+    so the result is stored in PYTHON_PATH_FILE. A stored path for the same
+    QGIS executable and Python version only needs one existence check.
+
+    Returns:
+        The path to a Python executable matching the QGIS runtime.
+
+    Raises:
+        RuntimeError: If no matching Python is found.
+    """
+    key = f"{sys.executable}|{sys.version_info.major}.{sys.version_info.minor}"
+    try:
+        with open(PYTHON_PATH_FILE, encoding="utf-8") as f:
+            stored_key, python_path = f.read().splitlines()[:2]
+        if stored_key == key and os.path.isfile(python_path):
+            return python_path
+    except (OSError, ValueError):
+        pass
+
+    python_path = _find_python_executable()
+    tmp_path = f"{PYTHON_PATH_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(PYTHON_PATH_FILE), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{key}\n{python_path}\n")
+        os.replace(tmp_path, PYTHON_PATH_FILE)
+    except OSError:
+        pass
+    return python_path
+
+
 def _get_system_python():
     """Get the path to the Python executable for creating venvs.
 
@@ -465,15 +632,13 @@ def _get_system_python():
     Raises:
         RuntimeError: If no usable Python is found.
     """
-    from .python_manager import standalone_python_exists, get_standalone_python_path
-
-    if standalone_python_exists():
-        python_path = get_standalone_python_path()
+    if python_manager.standalone_python_exists():
+        python_path = python_manager.get_standalone_python_path()
         _log(f"Using standalone Python: {python_path}")
         return python_path
 
     # Fallback: find QGIS's bundled Python
-    python_path = _find_python_executable()
+    python_path = _get_qgis_python()
     if python_path and os.path.isfile(python_path):
         _log(
             f"Standalone Python unavailable, using system Python: {python_path}",
@@ -495,18 +660,338 @@ def _get_system_python():
 def _cleanup_partial_venv(venv_dir):
     """Remove a partially-created venv directory.
 
+    The directory is first renamed aside, which frees ``venv_dir`` for the
+    next attempt at once, and the renamed tree is deleted on a background
+    thread. Thousands of small files make the delete itself slow, especially
+    on Windows with a virus scanner. Leftovers from a session that exited
+    mid-delete are removed along with it.
+
     Args:
         venv_dir: The venv directory to remove.
     """
+    _ready_cache.pop(venv_dir, None)
+    _site_packages_cache.pop(venv_dir, None)
+    parent, name = os.path.split(os.path.abspath(venv_dir))
     if os.path.exists(venv_dir):
+        trash_dir = os.path.join(
+            parent, f"{name}.partial-{os.getpid()}-{time.monotonic_ns()}"
+        )
         try:
+            os.rename(venv_dir, trash_dir)
+        except OSError:
+            # Renaming can fail while a file is open; delete in place instead
             shutil.rmtree(venv_dir, ignore_errors=True)
-            _log(f"Cleaned up partial venv: {venv_dir}")
-        except Exception:
+        if os.path.exists(venv_dir):
             _log(
                 f"Could not clean up partial venv: {venv_dir}",
                 Qgis.MessageLevel.Warning,
             )
+        else:
+            _log(f"Cleaned up partial venv: {venv_dir}")
+
+    try:
+        with os.scandir(parent) as entries:
+            trash_dirs = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(f"{name}.partial-") and entry.is_dir()
+            ]
+    except OSError:
+        trash_dirs = []
+    if trash_dirs:
+
+        def remove_trash():
+            for path in trash_dirs:
+                shutil.rmtree(path, ignore_errors=True)
+
+        threading.Thread(target=remove_trash, daemon=True).start()
+
+
+def _venv_archive_paths():
+    """Return the pre-built venv archives that fit this Python and platform.
+
+    Archives are named ``venv-<X.Y>-<sys.platform>-<machine>.tar.zst`` (read
+    only when ``zstandard`` is installed) or ``.tar.gz`` and live in
+    CACHE_DIR. They hold the contents of a venv directory, including its
+    DEPS_HASH_FILE.
+    """
+    tag = (
+        f"{sys.version_info.major}.{sys.version_info.minor}-"
+        f"{sys.platform}-{platform.machine().lower()}"
+    )
+    base = os.path.join(CACHE_DIR, f"venv-{tag}.tar")
+    paths = [base + ".gz"]
+    if zstandard is not None:
+        paths.insert(0, base + ".zst")
+    return paths
+
+
+def _venv_template_dir():
+    """Return the local venv template for this Python version.
+
+    The template is a snapshot of the last verified venv, kept in CACHE_DIR
+    so a venv that has to be recreated can be cloned instead of installed.
+    """
+    return os.path.join(
+        CACHE_DIR, f"venv.template-{sys.version_info.major}.{sys.version_info.minor}"
+    )
+
+
+_FICLONE = 0x40049409
+
+
+def _reflink(src, dst):
+    """Clone a file copy-on-write (FICLONE on Linux, clonefile() on macOS).
+
+    Returns:
+        True if ``dst`` was created as a clone, False if the file system or
+        platform does not support it.
+    """
+    try:
+        if sys.platform == "darwin":
+            libc = ctypes.CDLL(None, use_errno=True)
+            return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+        if not sys.platform.startswith("linux"):
+            return False
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except (OSError, AttributeError):
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _clone_tree(src_dir, dst_dir, ignore=None):
+    """Copy a venv tree as cheaply as the file system allows.
+
+    Files are cloned copy-on-write where supported. Otherwise files under
+    ``lib``/``Lib`` are hardlinked: pip and Python replace those files
+    rather than rewriting them, so the two trees never see each other's
+    changes. Everything else, including pyvenv.cfg and the scripts that
+    ``venv --upgrade`` rewrites in place, is copied. A method that fails is
+    not retried for the remaining files.
+    """
+    state = {"reflink": True, "link": True}
+
+    def clone(src, dst):
+        if state["reflink"]:
+            if _reflink(src, dst):
+                return dst
+            state["reflink"] = False
+        top = os.path.relpath(src, src_dir).split(os.sep, 1)[0]
+        if state["link"] and top in ("lib", "Lib"):
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                state["link"] = False
+        return shutil.copy2(src, dst)
+
+    shutil.copytree(
+        src_dir,
+        dst_dir,
+        symlinks=True,
+        ignore=ignore,
+        copy_function=clone,
+        dirs_exist_ok=True,
+    )
+
+
+def _can_clone_cheaply(src_file, dst_dir):
+    """Check whether files can be reflinked or hardlinked into ``dst_dir``.
+
+    Args:
+        src_file: An existing file in the tree to be cloned.
+        dst_dir: The directory the clone will be created in.
+
+    Returns:
+        True if a copy-on-write clone or a hardlink of ``src_file`` could be
+        created in ``dst_dir``.
+    """
+    probe = os.path.join(dst_dir, f".clone-probe-{os.getpid()}")
+    try:
+        if _reflink(src_file, probe):
+            return True
+        try:
+            os.link(src_file, probe)
+        except OSError:
+            return False
+        return True
+    finally:
+        if os.path.lexists(probe):
+            os.remove(probe)
+
+
+def _save_venv_template(venv_dir):
+    """Snapshot a verified venv as the template for future venvs (best effort).
+
+    The snapshot shares its data with the venv through copy-on-write clones
+    or hardlinks. It is skipped when neither works between ``venv_dir`` and
+    CACHE_DIR (a file system without hardlinks, or another device), since a
+    full copy would double the disk space the dependencies take.
+
+    Args:
+        venv_dir: The venv directory to snapshot.
+    """
+    deps_hash = _read_deps_hash(venv_dir)
+    template_dir = _venv_template_dir()
+    if deps_hash is None or _read_deps_hash(template_dir) == deps_hash:
+        return
+    if not _can_clone_cheaply(
+        os.path.join(venv_dir, DEPS_HASH_FILE), os.path.dirname(template_dir)
+    ):
+        _log("Venv template would need a full copy, not saving it")
+        return
+
+    tmp_dir = template_dir + ".tmp"
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        _clone_tree(
+            venv_dir,
+            tmp_dir,
+            ignore=shutil.ignore_patterns(SITE_PACKAGES_FILE, READY_FILE),
+        )
+        shutil.rmtree(template_dir, ignore_errors=True)
+        os.replace(tmp_dir, template_dir)
+        _log(f"Saved venv template: {template_dir}")
+    except Exception as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        _log(f"Could not save venv template: {e}", Qgis.MessageLevel.Warning)
+
+
+def _clone_venv_template(venv_dir):
+    """Populate ``venv_dir`` from the local venv template.
+
+    Returns:
+        True if a template for the current package specs was cloned.
+    """
+    template_dir = _venv_template_dir()
+    if _read_deps_hash(template_dir) != _compute_deps_hash():
+        return False
+
+    _log(f"Cloning virtual environment from {template_dir}")
+    try:
+        _clone_tree(template_dir, venv_dir)
+    except Exception as e:
+        _log(f"Could not clone venv template: {e}", Qgis.MessageLevel.Warning)
+        _cleanup_partial_venv(venv_dir)
+        return False
+    return True
+
+
+def _extract_venv_members(tar, venv_dir):
+    """Extract a venv archive with the "data" filter.
+
+    The filter refuses members that would land outside ``venv_dir`` and
+    links that point outside it. A venv's interpreter links are absolute, so
+    they are skipped instead; ``python -m venv --upgrade`` recreates them.
+
+    Args:
+        tar: An open tarfile, possibly in stream mode.
+        venv_dir: The directory to extract into.
+    """
+    for member in tar:
+        if member.issym() and os.path.isabs(member.linkname):
+            continue
+        tar.extract(member, venv_dir, filter="data")
+
+
+def _extract_venv_archive(venv_dir):
+    """Populate ``venv_dir`` from a pre-built venv archive.
+
+    The archive is streamed straight into ``venv_dir``. It is only kept when
+    the dependency hash it carries matches REQUIRED_PACKAGES.
+
+    Returns:
+        True if a usable archive was extracted.
+    """
+    archive = next((p for p in _venv_archive_paths() if os.path.isfile(p)), None)
+    if archive is None:
+        return False
+
+    # Extraction filters (Python 3.12, backported to security releases of
+    # 3.8+) are what keep archive members inside venv_dir; without them the
+    # archive is not trusted and the venv is created normally.
+    if not hasattr(tarfile, "data_filter"):
+        _log(
+            "This Python cannot extract archives safely, ignoring venv archive",
+            Qgis.MessageLevel.Warning,
+        )
+        return False
+
+    _log(f"Restoring virtual environment from {archive}")
+    try:
+        with open(archive, "rb") as f:
+            if archive.endswith(".zst"):
+                with zstandard.ZstdDecompressor().stream_reader(f) as stream:
+                    with tarfile.open(fileobj=stream, mode="r|") as tar:
+                        _extract_venv_members(tar, venv_dir)
+            else:
+                with tarfile.open(fileobj=f, mode="r|gz") as tar:
+                    _extract_venv_members(tar, venv_dir)
+    except Exception as e:
+        _log(f"Could not restore venv archive: {e}", Qgis.MessageLevel.Warning)
+        _cleanup_partial_venv(venv_dir)
+        return False
+
+    if _read_deps_hash(venv_dir) != _compute_deps_hash():
+        _log("Venv archive was built for other package specs, ignoring it")
+        _cleanup_partial_venv(venv_dir)
+        return False
+    return True
+
+
+def _try_restore_cached_venv(venv_dir, system_python):
+    """Restore the venv from a local template or archive instead of creating it.
+
+    The local template (see _save_venv_template) is preferred over a
+    pre-built archive. Either is only used for the current package specs,
+    so the install step that follows finds everything up to date. ``python
+    -m venv --upgrade`` then rebinds the venv to ``system_python``.
+
+    Args:
+        venv_dir: The venv directory to restore into.
+        system_python: The Python executable the venv should use.
+
+    Returns:
+        "template" or "archive" for the source a usable venv was restored
+        from, or None to create it normally.
+    """
+    if _clone_venv_template(venv_dir):
+        source = "template"
+    elif _extract_venv_archive(venv_dir):
+        source = "archive"
+    else:
+        return None
+
+    # Paths recorded where the venv was built do not apply here
+    for name in (SITE_PACKAGES_FILE, READY_FILE):
+        try:
+            os.remove(os.path.join(venv_dir, name))
+        except OSError:
+            pass
+
+    try:
+        result = subprocess.run(  # nosec B603 (list-form, fixed venv args)
+            [system_python, "-m", "venv", "--upgrade", venv_dir],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            env=_get_clean_env_for_venv(),
+            **_get_subprocess_kwargs(),
+        )
+        ok = result.returncode == 0 and venv_exists(venv_dir)
+    except Exception:
+        ok = False
+    if not ok:
+        _log("Could not rebind restored venv, recreating it", Qgis.MessageLevel.Warning)
+        _cleanup_partial_venv(venv_dir)
+        return None
+    return source
 
 
 def create_venv(venv_dir=None, progress_callback=None):
@@ -541,13 +1026,18 @@ def create_venv(venv_dir=None, progress_callback=None):
         )
     if system_python:
         _log(f"Using Python: {system_python}")
+        source = _try_restore_cached_venv(venv_dir, system_python)
+        if source is not None:
+            if progress_callback:
+                progress_callback(20, "Virtual environment restored")
+            if source == "template":
+                return True, "Virtual environment cloned from local template"
+            return True, "Virtual environment restored from archive"
 
-    from .uv_manager import uv_exists, get_uv_path
-
-    use_uv = uv_exists()
+    use_uv = uv_manager.uv_exists()
 
     if use_uv:
-        uv_path = get_uv_path()
+        uv_path = uv_manager.get_uv_path()
         uv_python = (
             system_python or f"{sys.version_info.major}.{sys.version_info.minor}"
         )
@@ -654,6 +1144,23 @@ def create_venv(venv_dir=None, progress_callback=None):
 # ---------------------------------------------------------------------------
 
 
+# Installer output markers, matched case-insensitively in one pass each
+_SSL_ERROR_RE = re.compile(r"ssl|certificate", re.IGNORECASE)
+_NETWORK_ERROR_RE = re.compile(
+    r"ConnectionError|connection (?:refused|reset)|timed out|RemoteDisconnected",
+    re.IGNORECASE,
+)
+_PIP_ERROR_RE = re.compile(
+    # uv words a wheel-only miss as "no usable wheels" or as a hint that
+    # building from source is disabled
+    r"(?P<no_distribution>no matching distribution|no usable wheels"
+    r"|building from source is disabled)"
+    r"|(?P<permission>permission|denied)"
+    r"|(?P<no_space>no space left)",
+    re.IGNORECASE,
+)
+
+
 def _is_ssl_error(stderr):
     """Check if a pip error is SSL-related.
 
@@ -663,9 +1170,7 @@ def _is_ssl_error(stderr):
     Returns:
         True if the error is SSL-related.
     """
-    ssl_markers = ["ssl", "certificate", "CERTIFICATE_VERIFY_FAILED"]
-    lower = stderr.lower()
-    return any(m.lower() in lower for m in ssl_markers)
+    return _SSL_ERROR_RE.search(stderr) is not None
 
 
 def _is_network_error(stderr):
@@ -677,18 +1182,183 @@ def _is_network_error(stderr):
     Returns:
         True if the error is network-related.
     """
-    network_markers = [
-        "ConnectionError",
-        "connection refused",
-        "connection reset",
-        "timed out",
-        "RemoteDisconnected",
-        "NewConnectionError",
-    ]
-    return any(m.lower() in stderr.lower() for m in network_markers)
+    return _NETWORK_ERROR_RE.search(stderr) is not None
+
+
+def _is_missing_distribution(output):
+    """Check if installer output reports a package with no matching distribution.
+
+    Args:
+        output: The output from pip/uv.
+
+    Returns:
+        True if a requirement could not be matched to a distribution.
+    """
+    return any(
+        match.lastgroup == "no_distribution" for match in _PIP_ERROR_RE.finditer(output)
+    )
+
+
+def _compute_deps_hash():
+    """Return a hash of the required package specs.
+
+    Returns:
+        A hex digest that changes whenever REQUIRED_PACKAGES changes.
+    """
+    specs = "\n".join(f"{name}{spec}" for name, spec in REQUIRED_PACKAGES)
+    return hashlib.sha256(specs.encode("utf-8")).hexdigest()
+
+
+def _read_deps_hash(venv_dir):
+    """Read the dependency hash marker from a venv, or None if missing."""
+    try:
+        with open(os.path.join(venv_dir, DEPS_HASH_FILE), encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_deps_hash(venv_dir, deps_hash):
+    """Record the dependency hash after a successful install."""
+    try:
+        with open(os.path.join(venv_dir, DEPS_HASH_FILE), "w", encoding="utf-8") as f:
+            f.write(deps_hash)
+    except OSError as e:
+        _log(f"Could not write dependency hash: {e}", Qgis.MessageLevel.Warning)
+
+
+def _version_satisfies(version, version_spec):
+    """Check an installed version against a REQUIRED_PACKAGES spec.
+
+    Args:
+        version: Installed version from _installed_version().
+        version_spec: Version specifier, or "" for any version.
+
+    Returns:
+        True if the spec is empty or known to be satisfied. Specs cannot be
+        confirmed without packaging or a versioned metadata directory.
+    """
+    if not version_spec:
+        return True
+    if SpecifierSet is None or version == "unknown":
+        return False
+    try:
+        return SpecifierSet(version_spec).contains(version, prereleases=True)
+    except InvalidSpecifier:
+        return False
+
+
+def _dependencies_up_to_date(venv_dir, deps_hash):
+    """Check whether the required packages are already installed in the venv.
+
+    A matching stored hash only needs every package to still be present.
+    Without one, such as after the specs change or in a venv populated by
+    hand, the installed versions are checked against the specs instead.
+
+    Args:
+        venv_dir: The venv directory.
+        deps_hash: Hash of the currently required package specs.
+
+    Returns:
+        True if every required package is installed and satisfies its spec.
+    """
+    site_packages = get_venv_site_packages(venv_dir)
+    if site_packages is None:
+        return False
+    scan = _scan_site_packages(site_packages)
+    if _read_deps_hash(venv_dir) == deps_hash:
+        return all(
+            _installed_version(package_name, scan)
+            for package_name, _ in REQUIRED_PACKAGES
+        )
+    for package_name, version_spec in REQUIRED_PACKAGES:
+        version = _installed_version(package_name, scan)
+        if not version or not _version_satisfies(version, version_spec):
+            return False
+    return True
+
 
+def _write_ready_marker(venv_dir, deps_hash):
+    """Record a completed install in the venv's READY_FILE (best effort)."""
+    site_packages = get_venv_site_packages(venv_dir)
+    if site_packages is None:
+        return
+    scan = _scan_site_packages(site_packages)
+    marker = {
+        "deps_hash": deps_hash,
+        "python": get_venv_python_path(venv_dir),
+        "site_packages": site_packages,
+        "versions": {
+            package_name: _installed_version(package_name, scan)
+            for package_name, _ in REQUIRED_PACKAGES
+        },
+        "install_time": time.time(),
+    }
+    _ready_cache.pop(venv_dir, None)
+    path = os.path.join(venv_dir, READY_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(marker, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _log(f"Could not write ready marker: {e}", Qgis.MessageLevel.Warning)
+
+
+def _remove_ready_marker(venv_dir):
+    """Remove the venv's READY_FILE before its packages change."""
+    _ready_cache.pop(venv_dir, None)
+    try:
+        os.remove(os.path.join(venv_dir, READY_FILE))
+    except OSError:
+        pass
 
-def install_dependencies(venv_dir=None, progress_callback=None, cancel_check=None):
+
+def _ready_site_packages(venv_dir=None):
+    """Return the site-packages path of a venv with a current ready marker.
+
+    Args:
+        venv_dir: Optional venv directory path. Defaults to VENV_DIR.
+
+    Returns:
+        The recorded site-packages path, or None if the marker is missing,
+        was written for other package specs, or points to a removed venv or
+        interpreter.
+    """
+    if venv_dir is None:
+        venv_dir = VENV_DIR
+
+    # The marker is parsed once per session; the venv or its base
+    # interpreter could still be removed behind our back, so the path
+    # checks are repeated.
+    cached = _ready_cache.get(venv_dir)
+    if cached is None:
+        try:
+            with open(os.path.join(venv_dir, READY_FILE), encoding="utf-8") as f:
+                marker = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(marker, dict)
+            or marker.get("deps_hash") != _compute_deps_hash()
+        ):
+            return None
+        cached = (marker.get("site_packages"), marker.get("python"))
+        if not all(isinstance(path, str) for path in cached):
+            return None
+    site_packages, python_path = cached
+    # exists() follows the venv's interpreter symlink to the base Python
+    if not os.path.isdir(site_packages) or not os.path.exists(python_path):
+        _ready_cache.pop(venv_dir, None)
+        return None
+    _ready_cache[venv_dir] = cached
+    _site_packages_cache[venv_dir] = site_packages
+    return site_packages
+
+
+def install_dependencies(
+    venv_dir=None, progress_callback=None, cancel_check=None, force_upgrade=False
+):
     """Install required packages into the virtual environment.
 
     Uses uv when available for significantly faster installation,
@@ -698,6 +1368,9 @@ def install_dependencies(venv_dir=None, progress_callback=None, cancel_check=Non
         venv_dir: Optional venv directory path. Defaults to VENV_DIR.
         progress_callback: Function called with (percent, message).
         cancel_check: Function that returns True if operation should be cancelled.
+        force_upgrade: Upgrade packages that already satisfy their specs.
+            Without it, installed packages are left alone and the installer
+            does not have to refetch their index pages.
 
     Returns:
         A tuple of (success: bool, message: str).
@@ -709,14 +1382,21 @@ def install_dependencies(venv_dir=None, progress_callback=None, cancel_check=Non
     if not os.path.exists(python_path):
         return False, "Virtual environment Python not found"
 
+    deps_hash = _compute_deps_hash()
+    if _dependencies_up_to_date(venv_dir, deps_hash):
+        _log("Dependencies already up to date, skipping install")
+        _write_deps_hash(venv_dir, deps_hash)
+        _write_ready_marker(venv_dir, deps_hash)
+        if progress_callback:
+            progress_callback(90, "All packages already installed")
+        return True, "Dependencies already up to date"
+
     env = _get_clean_env_for_venv()
     kwargs = _get_subprocess_kwargs()
 
-    from .uv_manager import uv_exists, get_uv_path
-
-    use_uv = uv_exists()
+    use_uv = uv_manager.uv_exists()
     if use_uv:
-        uv_path = get_uv_path()
+        uv_path = uv_manager.get_uv_path()
         _log("Installing dependencies with uv")
     else:
         _log("Installing dependencies with pip")
@@ -732,6 +1412,8 @@ def install_dependencies(venv_dir=None, progress_callback=None, cancel_check=Non
     if cancel_check and cancel_check():
         return False, "Installation cancelled."
 
+    _remove_ready_marker(venv_dir)
+
     # Scale timeout with number of packages (600s per package)
     total = len(REQUIRED_PACKAGES)
     timeout = 600 * total
@@ -740,47 +1422,58 @@ def install_dependencies(venv_dir=None, progress_callback=None, cancel_check=Non
         progress_callback(20, f"Installing {', '.join(pkg_names)}...")
 
     if use_uv:
+        installer = "uv"
         cmd = [
             uv_path,
             "pip",
             "install",
             "--python",
             python_path,
-            "--upgrade",
-        ] + pkg_specs
-        success, error_msg = _run_install(
-            cmd,
-            env,
-            kwargs,
-            timeout=timeout,
-            progress_callback=progress_callback,
-            cancel_check=cancel_check,
-            installer="uv",
-        )
+        ]
     else:
+        installer = "pip"
         cmd = [
             python_path,
             "-m",
             "pip",
             "install",
-            "--upgrade",
             "--prefer-binary",
+            # Skip writing .pyc files for every installed module up front;
+            # Python compiles the few modules the plugin imports on first use.
+            "--no-compile",
             "--disable-pip-version-check",
             "--no-warn-script-location",
-        ] + pkg_specs
-        success, error_msg = _run_install(
-            cmd,
+        ]
+    if force_upgrade:
+        cmd.append("--upgrade")
+
+    # Install from prebuilt wheels only so nothing is compiled from source.
+    # Retry once without the restriction for platforms that lack a wheel.
+    for binary_flags in (["--only-binary", ":all:"], []):
+        success, error_msg, output = _run_install(
+            cmd + binary_flags + pkg_specs,
             env,
             kwargs,
             timeout=timeout,
             progress_callback=progress_callback,
             cancel_check=cancel_check,
-            installer="pip",
+            installer=installer,
+        )
+        # Only a package without a matching wheel is worth a source build;
+        # network, SSL, permission and disk errors would just fail again.
+        if success or not binary_flags or not _is_missing_distribution(output):
+            break
+        _log(
+            f"Wheel-only install via {installer} failed, retrying without "
+            f"--only-binary: {error_msg[:200]}",
+            Qgis.MessageLevel.Warning,
         )
 
     if not success:
         return False, error_msg
 
+    _write_deps_hash(venv_dir, deps_hash)
+    _write_ready_marker(venv_dir, deps_hash)
     _log(f"Installed {total} package(s)", Qgis.MessageLevel.Success)
 
     if progress_callback:
@@ -794,6 +1487,10 @@ def _run_install_subprocess(
 ):
     """Run an install command with progress polling and cancellation support.
 
+    The installer's output is read line by line while it runs, so the pipe
+    never fills up and only the last ``_OUTPUT_TAIL_LINES`` lines are kept
+    for error reporting. The latest line is shown as the progress message.
+
     Args:
         cmd: The command list to execute.
         env: Environment dict for the subprocess.
@@ -804,16 +1501,36 @@ def _run_install_subprocess(
 
     Returns:
         A tuple of (returncode: int, stdout: str, stderr: str).
-            returncode is -1 if cancelled, -2 if timed out.
+            returncode is -1 if cancelled, -2 if timed out. stdout is always
+            empty; stderr holds the tail of the combined output.
     """
     proc = subprocess.Popen(  # nosec B603 (cmd is list-form, no shell, args validated upstream)
         cmd,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+        stderr=subprocess.STDOUT,
         env=env,
         **kwargs,
     )
+    # Lines are kept as bytes and only the ones shown are decoded, with the
+    # same locale encoding text mode would have used.
+    tail = collections.deque(maxlen=_OUTPUT_TAIL_LINES)
+    encoding = locale.getpreferredencoding(False)
+
+    def decode(line):
+        return line.decode(encoding, errors="replace").rstrip()
+
+    def read_output():
+        for line in proc.stdout:
+            tail.append(line)
+
+    reader = threading.Thread(target=read_output, daemon=True)
+    reader.start()
+
+    def finish(returncode, message=None):
+        reader.join(timeout=5)
+        proc.stdout.close()
+        return returncode, "", message or "\n".join(map(decode, tail))
+
     start = time.time()
     poll_interval = 2  # seconds
     # Progress ticks from 25% to 85% over the timeout period
@@ -832,7 +1549,7 @@ def _run_install_subprocess(
                 proc.wait(timeout=10)
             except subprocess.TimeoutExpired:
                 proc.kill()
-            return -1, "", "Installation cancelled by user."
+            return finish(-1, "Installation cancelled by user.")
 
         # Check overall timeout
         elapsed = time.time() - start
@@ -842,17 +1559,32 @@ def _run_install_subprocess(
                 proc.wait(timeout=10)
             except subprocess.TimeoutExpired:
                 proc.kill()
-            return -2, "", f"Timed out after {timeout // 60} minutes."
+            return finish(-2, f"Timed out after {timeout // 60} minutes.")
 
         # Emit intermediate progress (25-85% range based on elapsed time)
         if progress_callback:
             fraction = min(elapsed / timeout, 1.0)
             percent = int(25 + fraction * 60)
-            progress_callback(percent, "Installing packages...")
+            latest = decode(tail[-1]).strip() if tail else ""
+            progress_callback(percent, latest[:80] or "Installing packages...")
+
+    return finish(proc.returncode)
 
-    stdout = proc.stdout.read() if proc.stdout else ""
-    stderr = proc.stderr.read() if proc.stderr else ""
-    return proc.returncode, stdout, stderr
+
+def _sleep_unless_cancelled(seconds, cancel_check=None):
+    """Sleep for ``seconds``, waking early if ``cancel_check`` returns True.
+
+    Returns:
+        False if the wait was cancelled, True otherwise.
+    """
+    deadline = time.monotonic() + seconds
+    while True:
+        if cancel_check and cancel_check():
+            return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        time.sleep(min(remaining, 0.25))
 
 
 def _run_install(
@@ -876,7 +1608,8 @@ def _run_install(
         installer: "pip" or "uv", used for retry flags and logging.
 
     Returns:
-        A tuple of (success: bool, error_message: str).
+        A tuple of (success: bool, error_message: str, output: str), where
+        output is the installer output of the last failed attempt.
     """
     try:
         returncode, stdout, stderr = _run_install_subprocess(
@@ -889,15 +1622,17 @@ def _run_install(
         )
 
         if returncode == -1:
-            return False, "Installation cancelled."
+            return False, "Installation cancelled.", ""
         if returncode == -2:
-            return False, f"Installation timed out after {timeout // 60} minutes."
+            return False, f"Installation timed out after {timeout // 60} minutes.", ""
         if returncode == 0:
-            return True, ""
+            return True, "", ""
 
         stderr = stderr or stdout or ""
 
-        # Retry on SSL errors
+        # Retry on SSL errors. Once SSL interception is detected, every
+        # later retry keeps the trusted-host flags.
+        retry_cmd = cmd
         if _is_ssl_error(stderr):
             if installer == "uv":
                 ssl_flags = [
@@ -928,9 +1663,15 @@ def _run_install(
                 cancel_check,
             )
             if returncode == -1:
-                return False, "Installation cancelled."
+                return False, "Installation cancelled.", ""
+            if returncode == -2:
+                return (
+                    False,
+                    f"Installation timed out after {timeout // 60} minutes.",
+                    "",
+                )
             if returncode == 0:
-                return True, ""
+                return True, "", ""
             stderr = retry_stderr or stderr
 
         # Retry on network errors with a delay
@@ -940,9 +1681,10 @@ def _run_install(
                 f"retrying in 5s...",
                 Qgis.MessageLevel.Warning,
             )
-            time.sleep(5)
+            if not _sleep_unless_cancelled(5, cancel_check):
+                return False, "Installation cancelled.", ""
             returncode, stdout, retry_stderr = _run_install_subprocess(
-                cmd,
+                retry_cmd,
                 env,
                 kwargs,
                 timeout,
@@ -950,20 +1692,26 @@ def _run_install(
                 cancel_check,
             )
             if returncode == -1:
-                return False, "Installation cancelled."
+                return False, "Installation cancelled.", ""
+            if returncode == -2:
+                return (
+                    False,
+                    f"Installation timed out after {timeout // 60} minutes.",
+                    "",
+                )
             if returncode == 0:
-                return True, ""
+                return True, "", ""
             stderr = retry_stderr or stderr
 
         # Classify the error for a user-friendly message
-        return False, _classify_pip_error(stderr)
+        return False, _classify_pip_error(stderr), stderr
 
     except FileNotFoundError:
         if installer == "uv":
-            return False, "uv executable not found."
-        return False, "Python executable not found in virtual environment."
+            return False, "uv executable not found.", ""
+        return False, "Python executable not found in virtual environment.", ""
     except Exception as e:
-        return False, f"Unexpected error installing dependencies: {str(e)}"
+        return False, f"Unexpected error installing dependencies: {str(e)}", ""
 
 
 def _classify_pip_error(stderr):
@@ -975,19 +1723,19 @@ def _classify_pip_error(stderr):
     Returns:
         A user-friendly error message string.
     """
-    stderr_lower = stderr.lower()
+    kinds = {match.lastgroup for match in _PIP_ERROR_RE.finditer(stderr)}
 
-    if "no matching distribution" in stderr_lower:
+    if "no_distribution" in kinds:
         return (
             "A required package was not found. "
             "Check your internet connection and try again."
         )
-    if "permission" in stderr_lower or "denied" in stderr_lower:
+    if "permission" in kinds:
         return (
             "Permission denied installing dependencies. "
             "Try running QGIS as administrator."
         )
-    if "no space left" in stderr_lower:
+    if "no_space" in kinds:
         return "Not enough disk space to install dependencies."
 
     return f"Failed to install dependencies: {stderr[:300]}"
@@ -1007,24 +1755,36 @@ def _get_verification_code(package_name):
     Returns:
         A Python code string that tests the package.
     """
-    if package_name == "earthengine-api":
-        return "import ee; print(ee.__version__)"
-    elif package_name == "numpy":
-        return "import numpy; print(numpy.__version__)"
-    elif package_name == "Pillow":
-        return "from PIL import Image; print(Image.__version__)"
-    elif package_name == "google-auth-oauthlib":
-        return "import google_auth_oauthlib; print('ok')"
-    else:
-        import_name = package_name.replace("-", "_")
-        return f"import {import_name}"
+    module, version_attr = PACKAGE_VERIFY_IMPORTS.get(
+        package_name, (package_name.replace("-", "_"), None)
+    )
+    if version_attr:
+        return f"import {module}; print({module}.{version_attr})"
+    return f"import {module}"
+
+
+# Runs every package check in one venv interpreter and prints a JSON object
+# mapping each package to its error, or null when the check passed. Output
+# of the checks themselves is swallowed so the JSON is the only line.
+_VERIFY_SCRIPT = """\
+import contextlib, io, json
+errors = {{}}
+for name, code in json.loads({checks!r}):
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            exec(code, {{}})
+        errors[name] = None
+    except BaseException as e:
+        errors[name] = f"{{type(e).__name__}}: {{e}}"
+print(json.dumps(errors))
+"""
 
 
 def verify_venv(venv_dir=None, progress_callback=None):
     """Verify that all required packages work in the venv.
 
-    Runs functional test code for each package in a subprocess to
-    verify the venv is properly set up.
+    Runs the functional test code of every package in a single venv
+    subprocess to verify the venv is properly set up.
 
     Args:
         venv_dir: Optional venv directory path. Defaults to VENV_DIR.
@@ -1044,44 +1804,54 @@ def verify_venv(venv_dir=None, progress_callback=None):
     kwargs = _get_subprocess_kwargs()
 
     total = len(REQUIRED_PACKAGES)
-    for i, (package_name, _) in enumerate(REQUIRED_PACKAGES):
-        if progress_callback:
-            percent = int((i / total) * 100)
-            progress_callback(percent, f"Verifying {package_name}... ({i + 1}/{total})")
+    if progress_callback:
+        progress_callback(0, f"Verifying {total} packages...")
 
-        verify_code = _get_verification_code(package_name)
-        cmd = [python_path, "-c", verify_code]
+    checks = [
+        [package_name, _get_verification_code(package_name)]
+        for package_name, _ in REQUIRED_PACKAGES
+    ]
+    cmd = [python_path, "-c", _VERIFY_SCRIPT.format(checks=json.dumps(checks))]
 
-        try:
-            result = subprocess.run(  # nosec B603 (list-form; verify_code is internal-controlled)
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-                env=env,
-                **kwargs,
-            )
+    try:
+        result = subprocess.run(  # nosec B603 (list-form; verify code is internal-controlled)
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=120 * total,
+            env=env,
+            **kwargs,
+        )
+        # Warnings share the pipe, so take the last JSON line
+        errors = next(
+            (
+                json.loads(line)
+                for line in reversed(result.stdout.splitlines())
+                if line.startswith("{")
+            ),
+            None,
+        )
+    except subprocess.TimeoutExpired:
+        _log("Package verification timed out", Qgis.MessageLevel.Warning)
+        return False, "Verification of packages timed out"
+    except Exception as e:
+        _log(f"Failed to verify packages: {str(e)}", Qgis.MessageLevel.Warning)
+        return False, "Verification error: could not check packages"
 
-            if result.returncode != 0:
-                error_detail = (
-                    result.stderr[:300] if result.stderr else result.stdout[:300]
-                )
-                _log(
-                    f"Package {package_name} verification failed: {error_detail}",
-                    Qgis.MessageLevel.Warning,
-                )
-                return False, (
-                    f"Package {package_name} is broken: {error_detail[:200]}"
-                )
+    if not isinstance(errors, dict):
+        error_detail = result.stdout.strip()[-300:]
+        _log(f"Package verification failed: {error_detail}", Qgis.MessageLevel.Warning)
+        return False, f"Verification error: {error_detail[:200]}"
 
-        except subprocess.TimeoutExpired:
-            _log(f"Verification of {package_name} timed out", Qgis.MessageLevel.Warning)
-            return False, f"Verification of {package_name} timed out"
-        except Exception as e:
+    for package_name, _ in REQUIRED_PACKAGES:
+        error_detail = errors.get(package_name)
+        if error_detail:
             _log(
-                f"Failed to verify {package_name}: {str(e)}", Qgis.MessageLevel.Warning
+                f"Package {package_name} verification failed: {error_detail[:300]}",
+                Qgis.MessageLevel.Warning,
             )
-            return False, f"Verification error: {package_name}"
+            return False, f"Package {package_name} is broken: {error_detail[:200]}"
 
     if progress_callback:
         progress_callback(100, "Verification complete")
@@ -1104,18 +1874,23 @@ def ensure_venv_packages_available():
     Returns:
         True if venv packages are available, False otherwise.
     """
-    if not venv_exists():
-        python_path = get_venv_python_path()
-        _log(
-            f"Venv does not exist: expected Python at {python_path}",
-            Qgis.MessageLevel.Warning,
-        )
-        return False
-
-    site_packages = get_venv_site_packages()
+    site_packages = _ready_site_packages()
     if site_packages is None:
-        _log(f"Venv site-packages not found in: {VENV_DIR}", Qgis.MessageLevel.Warning)
-        return False
+        if not venv_exists():
+            python_path = get_venv_python_path()
+            _log(
+                f"Venv does not exist: expected Python at {python_path}",
+                Qgis.MessageLevel.Warning,
+            )
+            return False
+
+        site_packages = get_venv_site_packages()
+        if site_packages is None:
+            _log(
+                f"Venv site-packages not found in: {VENV_DIR}",
+                Qgis.MessageLevel.Warning,
+            )
+            return False
 
     path_was_missing = site_packages not in sys.path
     if path_was_missing:
@@ -1131,31 +1906,49 @@ def ensure_venv_packages_available():
     return True
 
 
+def register_ee_consumer(module):
+    """Have a module's ``ee`` reference refreshed once the venv is usable.
+
+    Modules that use a top-level ``try: import ee / except: ee = None``
+    pattern call this with ``sys.modules[__name__]`` at import time. A module
+    that caches other venv packages as well can define a
+    ``reload_dependencies()`` function, which is called instead.
+
+    Args:
+        module: The module object to refresh.
+    """
+    if not any(ref() is module for ref in _EE_CONSUMERS):
+        _EE_CONSUMERS.append(weakref.ref(module))
+
+
 def _refresh_ee_in_modules():
     """Re-import the ``ee`` module into plugin modules that cached it as None.
 
-    Several plugin modules use a top-level ``try: import ee / except: ee = None``
-    pattern.  If the venv site-packages path was not yet on ``sys.path`` when
-    those modules were first imported, their module-level ``ee`` stays ``None``
-    even after the path is added.  This function performs a fresh import and
-    patches the reference in every affected module.
+    If the venv site-packages path was not yet on ``sys.path`` when the
+    registered modules were first imported, their module-level ``ee`` stays
+    ``None`` even after the path is added. This function performs a fresh
+    import and patches the reference in every registered module.
     """
     try:
         import ee  # noqa: F811 — intentional re-import
     except ImportError:
         return  # ee not installable yet; nothing to patch
 
-    # Modules that cache ``ee`` at module level.
-    _module_names = [
-        "timelapse.core.timelapse_core",
-        "timelapse.dialogs.timelapse_dock",
-        "timelapse.dialogs.settings_dock",
-    ]
-    for name in _module_names:
-        mod = sys.modules.get(name)
-        if mod is not None and getattr(mod, "ee", None) is None:
-            mod.ee = ee
-            _log(f"Refreshed 'ee' reference in {name}")
+    live = []
+    for ref in _EE_CONSUMERS:
+        module = ref()
+        if module is None:
+            continue
+        live.append(ref)
+        if getattr(module, "ee", None) is not None:
+            continue
+        reload_dependencies = getattr(module, "reload_dependencies", None)
+        if callable(reload_dependencies):
+            reload_dependencies()
+        else:
+            module.ee = ee
+        _log(f"Refreshed 'ee' reference in {module.__name__}")
+    _EE_CONSUMERS[:] = live
 
 
 # ---------------------------------------------------------------------------
@@ -1169,6 +1962,10 @@ def get_venv_status():
     Returns:
         A tuple of (is_ready: bool, message: str).
     """
+    # A completed install of the current specs needs no further checks
+    if _ready_site_packages() is not None:
+        return True, "Virtual environment ready"
+
     if not venv_exists():
         return False, "Virtual environment not configured"
 
@@ -1176,8 +1973,10 @@ def get_venv_status():
     if site_packages is None:
         return False, "Virtual environment incomplete"
 
+    # One directory read answers the check for every package
+    scan = _scan_site_packages(site_packages)
     for package_name, _ in REQUIRED_PACKAGES:
-        if not _package_exists_in_site_packages(package_name, site_packages):
+        if not _installed_version(package_name, scan):
             return False, f"Package {package_name} not found in venv"
 
     return True, "Virtual environment ready"
@@ -1204,12 +2003,11 @@ def check_dependencies():
     missing = []
     installed = []
 
+    scan = _scan_site_packages(site_packages)
     for package_name, version_spec in REQUIRED_PACKAGES:
-        version = _get_installed_version_from_site_packages(package_name, site_packages)
+        version = _installed_version(package_name, scan)
         if version:
             installed.append((package_name, version))
-        elif _package_exists_in_site_packages(package_name, site_packages):
-            installed.append((package_name, "unknown"))
         else:
             missing.append((package_name, version_spec))
 
@@ -1239,30 +2037,24 @@ def create_venv_and_install(progress_callback=None, cancel_check=None):
     Returns:
         A tuple of (success: bool, message: str).
     """
-    from .python_manager import (
-        standalone_python_exists,
-        download_python_standalone,
-    )
-    from .uv_manager import uv_exists, download_uv
-
     start_time = time.time()
 
     # Step 1: Download Python standalone if needed (0-35%)
-    if not standalone_python_exists():
+    if not python_manager.standalone_python_exists():
         _log("Downloading Python standalone...")
 
         def python_progress(percent, msg):
             if progress_callback:
                 progress_callback(int(percent * 0.35), msg)
 
-        success, msg = download_python_standalone(
+        success, msg = python_manager.download_python_standalone(
             progress_callback=python_progress,
             cancel_check=cancel_check,
         )
 
         if not success:
             # Fallback: use QGIS's bundled Python
-            fallback = _find_python_executable()
+            fallback = _get_qgis_python()
             if fallback and os.path.isfile(fallback):
                 _log(
                     f"Standalone download failed, using system Python: {fallback}",
@@ -1279,14 +2071,14 @@ def create_venv_and_install(progress_callback=None, cancel_check=None):
             progress_callback(35, "Python standalone ready")
 
     # Step 1b: Download uv package installer if needed (35-40%)
-    if not uv_exists():
+    if not uv_manager.uv_exists():
         _log("Downloading uv package installer...")
 
         def uv_progress(percent, msg):
             if progress_callback:
                 progress_callback(35 + int(percent * 0.05), msg)
 
-        success, msg = download_uv(
+        success, msg = uv_manager.download_uv(
             progress_callback=uv_progress,
             cancel_check=cancel_check,
         )
@@ -1351,6 +2143,8 @@ def create_venv_and_install(progress_callback=None, cancel_check=None):
     if not is_valid:
         return False, f"Verification failed: {verify_msg}"
 
+    _save_venv_template(VENV_DIR)
+
     elapsed = time.time() - start_time
     if elapsed >= 60:
         minutes, seconds = divmod(int(elapsed), 60)
@@ -1385,6 +2179,9 @@ def remove_venv(venv_dir=None):
     if venv_dir is None:
         venv_dir = VENV_DIR
 
+    # A reset should reinstall from scratch rather than clone the template
+    shutil.rmtree(_venv_template_dir(), ignore_errors=True)
+
     if not os.path.exists(venv_dir):
         return True, "Virtual environment does not exist"
 
@@ -6,6 +6,7 @@ Earth Engine authentication and managing plugin dependencies.
 """
 
 import os
+import sys
 
 from qgis.PyQt.QtCore import Qt, QSettings, pyqtSignal
 from qgis.PyQt.QtWidgets import (
@@ -30,6 +31,10 @@ try:
 except ImportError:
     ee = None
 
+from ..core.venv_manager import register_ee_consumer
+
+register_ee_consumer(sys.modules[__name__])
+
 
 class SettingsDockWidget(QDockWidget):
     """A settings panel for configuring timelapse plugin options."""